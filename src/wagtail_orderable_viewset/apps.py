@@ -0,0 +1,16 @@
+from django.apps import AppConfig
+
+
+class WagtailOrderableViewSetAppConfig(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "wagtail_orderable_viewset"
+    label = "wagtail_orderable_viewset"
+    verbose_name = "Wagtail orderable viewset"
+
+    def ready(self):
+        from .purge import purge_after_reorder
+        from .signals import post_reorder
+
+        post_reorder.connect(
+            purge_after_reorder, dispatch_uid="wagtail_orderable_viewset_purge"
+        )
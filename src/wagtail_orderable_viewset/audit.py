@@ -0,0 +1,55 @@
+"""
+Audit logging of reorders in Wagtail's `ModelLogEntry` table.
+
+Each reorder operation is logged as a single entry per model, holding a compact
+summary of the change (the operation, how many objects moved and a sample of
+their primary keys) rather than one entry per row. Entries are written with a
+single bulk insert, inside the reorder's transaction.
+"""
+
+from django.contrib.contenttypes.models import ContentType
+from django.utils import timezone
+from wagtail.log_actions import get_active_log_context
+from wagtail.models import ModelLogEntry
+
+REORDER_ACTION = "wagtail_orderable_viewset.reorder"
+
+# Number of primary keys kept in the summary of a log entry.
+LOG_SAMPLE_SIZE = 20
+
+
+def make_reorder_log_entry(model, pks, operation, user=None):
+    """
+    Returns an unsaved log entry summarising a reorder of `pks` of `model`.
+    The entry is attached to the first reordered object.
+    """
+    pks = list(pks)
+    context = get_active_log_context()
+    if user is None or not user.is_authenticated:
+        user = context.user
+    return ModelLogEntry(
+        content_type=ContentType.objects.get_for_model(model, for_concrete_model=False),
+        label=str(model._meta.verbose_name_plural),
+        action=REORDER_ACTION,
+        timestamp=timezone.now(),
+        data={
+            "operation": operation,
+            "count": len(pks),
+            "pks": [str(pk) for pk in pks[:LOG_SAMPLE_SIZE]],
+        },
+        user=user,
+        uuid=context.uuid,
+        content_changed=True,
+        object_id=str(pks[0]),
+    )
+
+
+def log_reorders(entries):
+    """
+    Saves log entries built by `make_reorder_log_entry` in one bulk insert.
+    """
+    return ModelLogEntry.objects.bulk_create(entries)
+
+
+def log_reorder(model, pks, operation, user=None):
+    return log_reorders([make_reorder_log_entry(model, pks, operation, user=user)])
@@ -0,0 +1,26 @@
+from wagtail.admin.ui.tables import Column
+
+
+class OrderHandleColumn(Column):
+    """
+    Listing column showing an object's sort value, with a drag handle when the
+    listing is sorted by it, for reordering the rows of the current page. For a
+    `descending` ordering, the listing has to be sorted in descending order.
+    """
+
+    cell_template_name = "wagtail_orderable_viewset/_order_handle_cell.html"
+
+    def __init__(self, name, label="Order", descending=False, **kwargs):
+        kwargs.setdefault("sort_key", name)
+        kwargs.setdefault("width", "10%")
+        super().__init__(name, label=label, **kwargs)
+        self.descending = descending
+
+    def get_cell_context_data(self, instance, parent_context):
+        context = super().get_cell_context_data(instance, parent_context)
+        ordering = parent_context["table"].ordering
+        if isinstance(ordering, (list, tuple)) and len(ordering) == 1:
+            ordering = ordering[0]
+        sort_key = f"-{self.sort_key}" if self.descending else self.sort_key
+        context["is_draggable"] = ordering == sort_key
+        return context
@@ -0,0 +1,149 @@
+"""
+Live order updates pushed to editors with the order view open.
+
+Each reorder publishes one compact event to a channel per model and scope,
+once the transaction commits. The order view subscribes with server-sent
+events and applies them to its list in place. An event is a dict with the
+`operation` and either:
+
+- `changes`: `[key, sort_value]` pairs for the rows whose value changed, or
+- `order`: the full list of keys, for unpublished (draft) orders.
+
+Events go through a broker. `InProcessOrderEventBroker` is the default and
+only reaches editors served by the same process, so use
+`CacheOrderEventBroker` (with a cache shared between processes) or a custom
+`BaseOrderEventBroker` subclass when running several processes.
+"""
+
+import threading
+import time
+from collections import deque
+
+from django.core.cache import caches
+
+# Event standing in for events dropped before a listener received them; the
+# order view reloads when it gets one.
+RELOAD_EVENT = {"reload": True}
+
+
+class BaseOrderEventBroker:
+    """
+    Publishes events to channels and lets listeners wait for them. Event IDs
+    increase within a channel, so a listener resumes after the last ID seen.
+    """
+
+    def publish(self, channel, event):
+        """
+        Publishes `event` to `channel` and returns its ID.
+        """
+        raise NotImplementedError
+
+    def last_event_id(self, channel):
+        """
+        Returns the ID of the latest event of `channel`, or 0.
+        """
+        raise NotImplementedError
+
+    def listen(self, channel, after, timeout):
+        """
+        Returns the `(event_id, event)` pairs of `channel` published after the
+        ID `after`, waiting up to `timeout` seconds for one. Returns an empty
+        list on timeout, and a `RELOAD_EVENT` if some events are gone.
+        """
+        raise NotImplementedError
+
+
+class InProcessOrderEventBroker(BaseOrderEventBroker):
+    """
+    Keeps the latest `history_size` events of each channel in memory.
+    """
+
+    def __init__(self, history_size=100):
+        self.history_size = history_size
+        self.channels = {}
+        self.condition = threading.Condition()
+
+    def publish(self, channel, event):
+        with self.condition:
+            events = self.channels.setdefault(channel, deque(maxlen=self.history_size))
+            event_id = events[-1][0] + 1 if events else 1
+            events.append((event_id, event))
+            self.condition.notify_all()
+        return event_id
+
+    def last_event_id(self, channel):
+        with self.condition:
+            events = self.channels.get(channel)
+            return events[-1][0] if events else 0
+
+    def listen(self, channel, after, timeout):
+        with self.condition:
+            self.condition.wait_for(
+                lambda: self.last_event_id(channel) != after, timeout=timeout
+            )
+            events = self.channels.get(channel)
+            if not events:
+                # The listener is ahead of a broker that has been restarted
+                return [(0, RELOAD_EVENT)] if after else []
+            if events[-1][0] == after:
+                return []
+            if not events[0][0] <= after + 1 <= events[-1][0]:
+                # Events were trimmed, or the listener is ahead of the broker
+                return [(events[-1][0], RELOAD_EVENT)]
+            return [(event_id, event) for event_id, event in events if event_id > after]
+
+
+class CacheOrderEventBroker(BaseOrderEventBroker):
+    """
+    Stores events in a Django cache, shared between processes, with listeners
+    polling it every `poll_interval` seconds. Events expire after `ttl`.
+    """
+
+    def __init__(self, cache_alias="default", ttl=300, poll_interval=1):
+        self.cache_alias = cache_alias
+        self.ttl = ttl
+        self.poll_interval = poll_interval
+
+    @property
+    def cache(self):
+        return caches[self.cache_alias]
+
+    def publish(self, channel, event):
+        counter = f"{channel}:last"
+        self.cache.add(counter, 0, timeout=None)
+        event_id = self.cache.incr(counter)
+        self.cache.set(f"{channel}:{event_id}", event, timeout=self.ttl)
+        return event_id
+
+    def last_event_id(self, channel):
+        return self.cache.get(f"{channel}:last") or 0
+
+    def listen(self, channel, after, timeout):
+        deadline = time.monotonic() + timeout
+        while True:
+            last = self.last_event_id(channel)
+            if last != after:
+                break
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return []
+            time.sleep(min(self.poll_interval, remaining))
+
+        # A counter behind the listener was evicted or cleared
+        if last < after:
+            return [(last, RELOAD_EVENT)]
+        keys = [f"{channel}:{event_id}" for event_id in range(after + 1, last + 1)]
+        found = self.cache.get_many(keys)
+        if len(found) < len(keys):
+            return [(last, RELOAD_EVENT)]
+        return [(after + 1 + index, found[key]) for index, key in enumerate(keys)]
+
+
+default_broker = InProcessOrderEventBroker()
+
+
+def get_default_broker():
+    """
+    Returns the process-wide `InProcessOrderEventBroker`.
+    """
+    return default_broker
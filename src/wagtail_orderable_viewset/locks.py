@@ -0,0 +1,113 @@
+"""
+Cache-based soft locks used to serialize reorders of the same model.
+
+A lock is a lease stored in Django's cache for the duration of a write. While
+it is held, other editors get an immediate "someone else is reordering" error
+instead of queueing on row locks in the database. The lease expires on its own
+if a write never completes. Use a cache shared between processes (e.g. Redis or
+Memcached) in production, otherwise each process has its own locks.
+
+Each acquisition stores a random token, so a request only ever releases its
+own lease. Further requests of the holder (e.g. from a second tab) refresh the
+lease instead of being rejected, and leave it to the request that took it.
+"""
+
+import secrets
+
+from django.core.cache import caches
+
+
+class OrderLocked(Exception):
+    """
+    Raised when the lock is held by another user or request.
+    """
+
+    def __init__(self, holder):
+        self.holder = holder or {}
+        super().__init__(self.holder_name)
+
+    @property
+    def holder_name(self):
+        return self.holder.get("name") or "Another user"
+
+
+class OrderLock:
+    """
+    A lease on `key` owned by `user`, expiring after `timeout` seconds.
+    """
+
+    def __init__(self, key, user, timeout=30, cache_alias="default"):
+        self.key = key
+        self.user = user
+        self.timeout = timeout
+        self.cache = caches[cache_alias]
+        self.token = None
+
+    @property
+    def owner(self):
+        return {
+            "user_id": getattr(self.user, "pk", None),
+            "name": self.get_user_display_name(),
+        }
+
+    def get_user_display_name(self):
+        if self.user is None or not self.user.is_authenticated:
+            return ""
+        return self.user.get_full_name() or self.user.get_username()
+
+    def holder(self):
+        """
+        Returns the owner dict of whoever currently holds the lease, or None.
+        """
+        return self.cache.get(self.key)
+
+    def other_holder(self):
+        """
+        Returns the owner dict if the lease is held by another user, or None.
+        """
+        holder = self.holder()
+        if holder is not None and holder["user_id"] != self.owner["user_id"]:
+            return holder
+        return None
+
+    def is_held_by_other(self):
+        return self.other_holder() is not None
+
+    def acquire(self):
+        """
+        Takes the lease, or refreshes it if the same user already holds it.
+        Returns False if another user holds it.
+        """
+        token = secrets.token_hex(16)
+        if self.cache.add(self.key, {**self.owner, "token": token}, self.timeout):
+            self.token = token
+            return True
+        if self.other_holder() is not None or self.owner["user_id"] is None:
+            return False
+        if self.cache.touch(self.key, self.timeout):
+            return True
+        # The lease expired in the meantime
+        if self.cache.add(self.key, {**self.owner, "token": token}, self.timeout):
+            self.token = token
+            return True
+        return False
+
+    def release(self):
+        """
+        Releases the lease if it is still the one taken by `acquire()`. A lease
+        that expired and was taken by another request is left alone.
+        """
+        if self.token is None:
+            return
+        holder = self.holder()
+        if holder is not None and holder.get("token") == self.token:
+            self.cache.delete(self.key)
+        self.token = None
+
+    def __enter__(self):
+        if not self.acquire():
+            raise OrderLocked(self.holder())
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.release()
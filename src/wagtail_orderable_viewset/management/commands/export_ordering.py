@@ -0,0 +1,48 @@
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
+
+from wagtail_orderable_viewset.transfer import FORMATS, export_ordering, get_format
+
+
+class Command(BaseCommand):
+    help = "Export the ordering of a model as CSV or JSON Lines"
+
+    def add_arguments(self, parser):
+        parser.add_argument("model", help="Model label, e.g. home.Testimonial")
+        parser.add_argument(
+            "-o", "--output", help="File to write to (default: standard output)"
+        )
+        parser.add_argument(
+            "--format",
+            choices=FORMATS,
+            help="Output format (default: guessed from --output, otherwise csv)",
+        )
+        parser.add_argument(
+            "--key",
+            default="pk",
+            help="Field identifying each object, e.g. a slug (default: pk)",
+        )
+        parser.add_argument(
+            "--field", default="sort_order", help="Sort field (default: sort_order)"
+        )
+
+    def handle(self, *args, **options):
+        try:
+            model = apps.get_model(options["model"])
+        except (LookupError, ValueError) as e:
+            raise CommandError(str(e)) from e
+
+        output = options["output"]
+        format = options["format"] or get_format(output)
+        lines = export_ordering(
+            model._default_manager.all(),
+            options["field"],
+            key_field=options["key"],
+            format=format,
+        )
+        if output:
+            with open(output, "w", encoding="utf-8", newline="") as f:
+                f.writelines(lines)
+        else:
+            for line in lines:
+                self.stdout.write(line, ending="")
@@ -0,0 +1,109 @@
+from django.apps import apps
+from django.core.exceptions import ObjectDoesNotExist, ValidationError
+from django.core.management.base import BaseCommand, CommandError
+from wagtail.models import Locale
+
+from wagtail_orderable_viewset.locks import OrderLocked
+from wagtail_orderable_viewset.transfer import FORMATS, get_format
+from wagtail_orderable_viewset.viewsets import OrderableChildViewSet, get_order_viewset
+
+
+class Command(BaseCommand):
+    help = (
+        "Import the ordering of a model from CSV or JSON Lines through its "
+        "registered orderable viewset"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("model", help="Model label, e.g. home.Testimonial")
+        parser.add_argument("file", help="File written by export_ordering")
+        parser.add_argument(
+            "--format",
+            choices=FORMATS,
+            help="Input format (default: guessed from the file name, otherwise csv)",
+        )
+        parser.add_argument(
+            "--key",
+            help=(
+                "Field identifying each object, e.g. a slug "
+                "(default: the viewset's order_transfer_key_field)"
+            ),
+        )
+        parser.add_argument(
+            "--locale",
+            help="Language code of the locale to import into, for per-locale orderings",
+        )
+        parser.add_argument(
+            "--parent",
+            help=(
+                "Primary key of the parent whose children are imported, "
+                "for child viewsets"
+            ),
+        )
+        parser.add_argument(
+            "--no-history",
+            action="store_true",
+            help="Do not record the import in the order history",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            model = apps.get_model(options["model"])
+        except (LookupError, ValueError) as e:
+            raise CommandError(str(e)) from e
+
+        viewset = get_order_viewset(model)
+        if viewset is None:
+            raise CommandError(
+                f"No orderable viewset is registered for {model._meta.label}"
+            )
+
+        path = options["file"]
+        try:
+            scope = self.get_scope(viewset, options)
+            with open(path, encoding="utf-8", newline="") as f:
+                ordering, changes = viewset.import_order(
+                    f,
+                    format=options["format"] or get_format(path),
+                    scope=scope,
+                    key_field=options["key"],
+                    history=not options["no_history"],
+                )
+        except (OSError, ValidationError) as e:
+            messages = e.messages if isinstance(e, ValidationError) else [str(e)]
+            raise CommandError("\n".join(messages)) from e
+        except OrderLocked as e:
+            raise CommandError(f"{e.holder_name} is currently reordering") from e
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Imported {len(ordering)} rows, {len(changes)} changed."
+            )
+        )
+
+    def get_scope(self, viewset, options):
+        """
+        Returns the ordering scope named by --locale or --parent, in the same
+        way the viewset's `get_order_scope` reads it from a request.
+        """
+        if isinstance(viewset, OrderableChildViewSet):
+            if not options["parent"]:
+                raise CommandError("--parent is required to import a child ordering")
+            try:
+                return viewset.parent_model._default_manager.get(pk=options["parent"])
+            except (ObjectDoesNotExist, ValueError, ValidationError):
+                raise CommandError(f"No parent {options['parent']!r}") from None
+        if not viewset.is_ordered_per_locale:
+            if options["locale"]:
+                raise CommandError(
+                    f"{viewset.model._meta.label} is not ordered per locale"
+                )
+            return None
+        if not options["locale"]:
+            return Locale.get_default()
+        try:
+            return Locale.objects.get_for_language(options["locale"])
+        except (Locale.DoesNotExist, LookupError):
+            raise CommandError(
+                f"No locale with language code {options['locale']!r}"
+            ) from None
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.18 on 2026-10-19 16:56
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("contenttypes", "0002_remove_content_type_name"),
+        ("wagtail_orderable_viewset", "0003_orderrevision_scope"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="orderhistory",
+            name="wagtail_ord_content_bf1528_idx",
+        ),
+        migrations.AddField(
+            model_name="orderhistory",
+            name="scope",
+            field=models.CharField(blank=True, default="", max_length=255),
+        ),
+        migrations.AddIndex(
+            model_name="orderhistory",
+            index=models.Index(
+                fields=["content_type", "scope", "undone"],
+                name="wagtail_ord_content_4aa776_idx",
+            ),
+        ),
+    ]
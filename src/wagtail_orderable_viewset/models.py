@@ -1,6 +1,18 @@
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db import models
 from wagtail.models import Orderable
 
+from .ordering import (
+    DEFAULT_BATCH_SIZE,
+    compact_order,
+    get_order_value_limits,
+    is_near_order_limits,
+    make_order_key,
+    start_order_compaction,
+)
+
 
 class IncrementingOrderable(Orderable):
     """
@@ -9,8 +21,25 @@ class IncrementingOrderable(Orderable):
     Inherit from this class to automatically add a `sort_order` IntegerField to your model.
     The field is managed so that new instances are appended to the end of the order by default.
     Provides a utility method to get the current maximum sort order value for the model.
+
+    Set `sort_order_descending` for an order listed from the highest value
+    down, and `sort_order_insert_at_start` to give new instances the first
+    place instead. New values come from a single `MIN()` or `MAX()` query,
+    which an index on `sort_order` serves, so no other row is renumbered.
+
+    When a new value nears the limit of the column, the order is compacted in
+    the background (see `compact_sort_order`); at the limit itself it is
+    compacted before saving rather than overflowing.
     """
 
+    # The order is listed from the highest sort value down, e.g. "newest first".
+    # Orderable viewsets follow this unless they set `order_descending`; set a
+    # matching `Meta.ordering = ["-sort_order"]` for other listings.
+    sort_order_descending = False
+
+    # New instances go to the start of the order rather than the end.
+    sort_order_insert_at_start = False
+
     class Meta:
         abstract = True
 
@@ -25,8 +54,311 @@ class IncrementingOrderable(Orderable):
         )["max_order"]
         return max_order or 0
 
+    def get_sort_order_min(self):
+        """
+        Returns the minimum value of the `sort_order` field for this model.
+        If no instances exist, returns 0.
+        """
+        min_order = self.__class__.objects.aggregate(
+            min_order=models.Min("sort_order")
+        )["min_order"]
+        return min_order or 0
+
+    def get_new_sort_order(self):
+        """
+        Returns the `sort_order` of a new instance: one above the maximum, or
+        one below the minimum when new instances go to the start of an
+        ascending order or the end of a descending one.
+        """
+        if self.sort_order_insert_at_start != self.sort_order_descending:
+            return self.get_sort_order_min() - 1
+        return self.get_sort_order_max() + 1
+
+    @classmethod
+    def compact_sort_order(cls, background=False, batch_size=DEFAULT_BATCH_SIZE):
+        """
+        Renumbers `sort_order` from 1 without changing the order, in chunks
+        (see `compact_model_order`), and returns the number of rows written.
+        With `background`, runs in a thread once the current transaction
+        commits and returns None.
+        """
+        queryset = cls.objects.all()
+        if not background:
+            return compact_model_order(queryset, "sort_order", batch_size=batch_size)
+        start_order_compaction(
+            cls._meta.label_lower,
+            lambda: compact_model_order(queryset, "sort_order", batch_size=batch_size),
+            using=queryset.db,
+        )
+
     def save(self, *args, **kwargs):
-        # On first save (object creation), set sort_order to max + 1 so new objects are appended.
+        # On first save (object creation), place new objects at the end (or start) of the order.
         if self.pk is None:
-            self.sort_order = self.get_sort_order_max() + 1
+            limits = get_order_value_limits(self.__class__.objects.all(), "sort_order")
+            sort_order = self.get_new_sort_order()
+            if not limits[0] <= sort_order <= limits[1]:
+                # No room left at that end: compact now rather than overflow
+                self.compact_sort_order()
+                sort_order = self.get_new_sort_order()
+            elif is_near_order_limits([sort_order], limits):
+                self.compact_sort_order(background=True)
+            self.sort_order = sort_order
+        super().save(*args, **kwargs)
+
+
+class OrderLabelMixin(models.Model):
+    """
+    Abstract mixin storing the label shown for an object in the order view in
+    an `order_label` field, maintained on save. The order view then reads the
+    labels with `values_list()` instead of loading every object and calling
+    `__str__`, which helps when it follows relations or is otherwise slow.
+
+    Combine with `IncrementingOrderable`, e.g.
+    `class TeamMember(OrderLabelMixin, IncrementingOrderable)`. Labels go stale
+    if `get_order_label()` depends on related objects that change, or when rows
+    are written with `QuerySet.update()`; use `refresh_order_labels()` then.
+    """
+
+    order_label = models.CharField(max_length=255, blank=True, editable=False)
+
+    class Meta:
+        abstract = True
+
+    def get_order_label(self):
+        """
+        Returns the label stored in `order_label`. Defaults to `str(self)`.
+        """
+        return str(self)
+
+    def save(self, *args, **kwargs):
+        self.order_label = self.get_order_label()[:255]
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None:
+            kwargs["update_fields"] = {*update_fields, "order_label"}
         super().save(*args, **kwargs)
+
+    @classmethod
+    def refresh_order_labels(cls, queryset=None, batch_size=500):
+        """
+        Recomputes the stored labels of `queryset` (all objects by default),
+        writing only those that changed. Returns the number of objects updated.
+        """
+        queryset = cls._default_manager.all() if queryset is None else queryset
+        changed = []
+        for obj in queryset.iterator(chunk_size=batch_size):
+            label = obj.get_order_label()[:255]
+            if obj.order_label != label:
+                obj.order_label = label
+                changed.append(obj)
+        cls._default_manager.bulk_update(
+            changed, ["order_label"], batch_size=batch_size
+        )
+        return len(changed)
+
+
+def get_scope_key(scope):
+    """
+    Returns the string stored for an ordering scope: "" for the whole model,
+    otherwise the "<app_label>.<model_name>:<pk>" key of the scope object.
+    """
+    if scope is None:
+        return ""
+    return make_order_key(scope, scope.pk)
+
+
+class OrderHistoryManager(models.Manager):
+    def for_model(self, model, scope=None):
+        return self.filter(
+            content_type=ContentType.objects.get_for_model(model),
+            scope=get_scope_key(scope),
+        )
+
+    def record(self, model, changes, user=None, limit=None, scope=None):
+        """
+        Stores a reorder of `model` within `scope` as a compact delta and
+        returns the new entry.
+
+        `changes` is a list of `(pk, old_value, new_value)` tuples for the rows
+        whose sort value changed. Recording a new entry discards any entries of
+        the scope that were undone (the redo stack), and entries beyond the
+        newest `limit` are pruned so that storage stays bounded.
+        """
+        history = self.for_model(model, scope)
+        history.filter(undone=True).delete()
+        entry = self.create(
+            content_type=ContentType.objects.get_for_model(model),
+            scope=get_scope_key(scope),
+            user=user if user is not None and user.is_authenticated else None,
+            changes=[list(change) for change in changes],
+        )
+        if limit:
+            stale_ids = history.order_by("-pk").values_list("pk", flat=True)[limit:]
+            history.filter(pk__in=list(stale_ids)).delete()
+        return entry
+
+    def undoable(self, model, scope=None):
+        """Entries of `scope` that can be undone, most recent first."""
+        return self.for_model(model, scope).filter(undone=False).order_by("-pk")
+
+    def redoable(self, model, scope=None):
+        """Entries of `scope` that can be redone, oldest undone first."""
+        return self.for_model(model, scope).filter(undone=True).order_by("pk")
+
+
+class OrderHistory(models.Model):
+    """
+    A single reorder operation, stored as the list of rows whose sort value
+    changed: `[[pk, old_value, new_value], ...]`.
+
+    Moving one item only renumbers the rows between its old and new position,
+    so entries stay small even for long lists. Undoing an entry writes back the
+    old values, redoing it writes the new values again.
+    """
+
+    content_type = models.ForeignKey(
+        ContentType, on_delete=models.CASCADE, related_name="+"
+    )
+    # Key of the scope ordered (see `get_scope_key`), e.g. a locale.
+    scope = models.CharField(max_length=255, blank=True, default="")
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        null=True,
+        blank=True,
+        on_delete=models.SET_NULL,
+        related_name="+",
+    )
+    timestamp = models.DateTimeField(auto_now_add=True)
+    changes = models.JSONField(default=list, encoder=DjangoJSONEncoder)
+    undone = models.BooleanField(default=False)
+
+    objects = OrderHistoryManager()
+
+    class Meta:
+        verbose_name = "order history entry"
+        verbose_name_plural = "order history entries"
+        indexes = (models.Index(fields=["content_type", "scope", "undone"]),)
+
+    def __str__(self):
+        return f"{self.content_type} reorder ({len(self.changes)} rows)"
+
+
+def compact_model_order(
+    queryset, field_name, batch_size=DEFAULT_BATCH_SIZE, scope=None
+):
+    """
+    Compacts the ordering of `queryset` (see `compact_order`) and returns the
+    number of rows written. If any row was, the order history of `scope` is
+    cleared, as undoing its entries would write back uncompacted values.
+    Without a scope `queryset` is taken to span the whole model, and the
+    history of every scope is cleared.
+    """
+    written = compact_order(queryset, field_name, batch_size=batch_size)
+    if written:
+        content_type = ContentType.objects.get_for_model(queryset.model)
+        history = OrderHistory.objects.filter(content_type=content_type)
+        if scope is not None:
+            history = history.filter(scope=get_scope_key(scope))
+        history.delete()
+    return written
+
+
+class OrderRevisionManager(models.Manager):
+    def for_model(self, model, scope=None):
+        return self.filter(
+            content_type=ContentType.objects.get_for_model(model),
+            scope=get_scope_key(scope),
+        )
+
+    def draft_for(self, model, scope=None):
+        """Returns the unpublished order of `model` within `scope`, or None."""
+        return self.for_model(model, scope).first()
+
+    def save_draft(self, model, object_ids, user=None, scope=None):
+        """
+        Stores `object_ids` as the unpublished order of `model` within `scope`,
+        replacing any previous draft, and returns the revision.
+        """
+        revision, _ = self.update_or_create(
+            content_type=ContentType.objects.get_for_model(model),
+            scope=get_scope_key(scope),
+            defaults={
+                "object_ids": [str(object_id) for object_id in object_ids],
+                "user": user if user is not None and user.is_authenticated else None,
+            },
+        )
+        return revision
+
+
+class OrderRevision(models.Model):
+    """
+    An unpublished order of a model, stored as a single permutation of object
+    IDs rather than as a revision of every object.
+
+    Used for models with draft/revision workflows: reorders are saved here and
+    the live sort values are only written when the order is published.
+    """
+
+    content_type = models.ForeignKey(
+        ContentType, on_delete=models.CASCADE, related_name="+"
+    )
+    # Key of the scope ordered (see `get_scope_key`), e.g. a locale.
+    scope = models.CharField(max_length=255, blank=True, default="")
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        null=True,
+        blank=True,
+        on_delete=models.SET_NULL,
+        related_name="+",
+    )
+    updated_at = models.DateTimeField(auto_now=True)
+    object_ids = models.JSONField(default=list)
+
+    objects = OrderRevisionManager()
+
+    class Meta:
+        verbose_name = "order revision"
+        verbose_name_plural = "order revisions"
+        constraints = (
+            models.UniqueConstraint(
+                fields=["content_type", "scope"],
+                name="wagtail_orderable_viewset_unique_revision_scope",
+            ),
+        )
+
+    def __str__(self):
+        return f"{self.content_type} draft order ({len(self.object_ids)} objects)"
+
+    @property
+    def positions(self):
+        return {object_id: index for index, object_id in enumerate(self.object_ids)}
+
+    def sort(self, objects, key=None):
+        """
+        Returns `objects` (e.g. the live ordering) sorted by this revision.
+        Objects missing from the revision keep their relative order at the end.
+        """
+        key = key or (lambda obj: str(obj.pk))
+        positions = self.positions
+        missing = len(positions)
+        return sorted(objects, key=lambda obj: positions.get(key(obj), missing))
+
+    def sort_ids(self, object_ids):
+        return self.sort(object_ids, key=str)
+
+    def apply_to(self, queryset):
+        """
+        Returns `queryset` ordered by this revision, for previewing the
+        unpublished order on the site. Objects missing from the revision come
+        last, in their existing order.
+        """
+        whens = [
+            models.When(pk=object_id, then=models.Value(index))
+            for object_id, index in self.positions.items()
+        ]
+        return queryset.alias(
+            draft_position=models.Case(
+                *whens,
+                default=models.Value(len(whens)),
+                output_field=models.IntegerField(),
+            )
+        ).order_by("draft_position", *queryset.query.order_by)
@@ -0,0 +1,598 @@
+"""
+Helpers for computing and applying sort order changes.
+
+Kept separate from the viewsets so that the same write path can be shared by
+the order views, undo/redo and any other code that rewrites an ordering.
+"""
+
+import heapq
+import threading
+import time
+
+from django.db import DatabaseError, connections, transaction
+from django.db.models import (
+    Case,
+    Exists,
+    F,
+    Max,
+    Min,
+    OuterRef,
+    Subquery,
+    Value,
+    When,
+    Window,
+)
+from django.db.models.functions import RowNumber
+
+# Maximum number of rows written by a single UPDATE statement.
+DEFAULT_BATCH_SIZE = 500
+
+# SQLSTATE codes for serialization failures and deadlocks (PostgreSQL).
+RETRYABLE_SQLSTATES = {"40001", "40P01"}
+
+# MySQL/MariaDB error codes for lock wait timeouts and deadlocks.
+RETRYABLE_MYSQL_ERRORS = {1205, 1213}
+
+# Fraction of the sort field's integer range beyond which an ordering is
+# compacted, leaving the rest as headroom for writes until it is done.
+DEFAULT_RANGE_THRESHOLD = 0.9
+
+# Keys of the compactions running in the background, so each runs once.
+_running_compactions = set()
+_running_compactions_lock = threading.Lock()
+
+
+def get_sort_field_model(model, field_name):
+    """
+    Returns the concrete model whose table stores `field_name`.
+
+    For multi-table inheritance this is the parent model that declares the
+    field, rather than `model` itself.
+    """
+    return model._meta.get_field(field_name).model._meta.concrete_model
+
+
+# Where rows without a sort value are listed; None leaves it to the database.
+NULLS = ("first", "last")
+
+
+def get_order_by(field_name, descending=False, nulls=None):
+    """
+    Returns the `order_by()` expression sorting on `field_name`, descending if
+    `descending`. Rows without a value are listed `nulls` ("first" or "last"),
+    or where the database puts them (None), which a plain index can serve.
+    """
+    if nulls is not None and nulls not in NULLS:
+        raise ValueError(f"Unknown nulls position {nulls!r}")
+    kwargs = {f"nulls_{nulls}": True} if nulls else {}
+    field = F(field_name)
+    return field.desc(**kwargs) if descending else field.asc(**kwargs)
+
+
+def get_sort_key(key, descending=False, nulls_first=False):
+    """
+    Returns a `sorted()` key function sorting items by the sort value returned
+    by `key`, in the given direction and with missing values first or last.
+    """
+
+    def sort_key(item):
+        value = key(item)
+        if value is None:
+            return (0 if nulls_first else 2, 0)
+        return (1, -value if descending else value)
+
+    return sort_key
+
+
+def merge_ordered(iterables, key, descending=False, nulls_first=False):
+    """
+    Merges `iterables`, each already sorted by the sort value returned by
+    `key` in the given direction, into a single list sorted the same way.
+    """
+    sort_key = get_sort_key(key, descending, nulls_first)
+    return list(heapq.merge(*iterables, key=sort_key))
+
+
+def get_order_changes(queryset, field_name, object_ids, start=1):
+    """
+    Returns the rows whose sort value changes when `object_ids` are numbered
+    sequentially from `start`, as a list of `(pk, old_value, new_value)` tuples.
+
+    Rows that already hold their target value are left out, as are IDs that do
+    not match an object in `queryset`.
+    """
+    return get_value_changes(
+        queryset,
+        field_name,
+        {object_id: index for index, object_id in enumerate(object_ids, start)},
+    )
+
+
+def get_value_changes(queryset, field_name, targets):
+    """
+    Returns the `(pk, old_value, new_value)` changes needed to give the rows of
+    `queryset` the `{object_id: sort_value}` values in `targets`, in the order
+    of `targets`.
+    """
+    current = {
+        str(pk): (pk, value)
+        for pk, value in queryset.filter(pk__in=list(targets)).values_list(
+            "pk", field_name
+        )
+    }
+    changes = []
+    for object_id, new_value in targets.items():
+        if str(object_id) not in current:
+            continue
+        pk, old_value = current[str(object_id)]
+        if old_value != new_value:
+            changes.append((pk, old_value, new_value))
+    return changes
+
+
+def make_order_key(model, pk):
+    """
+    Returns the key identifying an object in an ordering that spans several
+    models, e.g. `"home.testimonial:12"`.
+    """
+    return f"{model._meta.label_lower}:{pk}"
+
+
+def get_order_key(obj):
+    return make_order_key(obj, obj.pk)
+
+
+def get_combined_order_changes(querysets, field_name, order_keys, start=1):
+    """
+    Like `get_order_changes`, for an ordering spanning the models of several
+    `querysets` that share `field_name`. Items are identified by the keys
+    returned by `get_order_key`.
+
+    Returns a list of `(queryset, changes)` pairs, one per queryset.
+    """
+    targets = {queryset.model._meta.label_lower: {} for queryset in querysets}
+    for index, order_key in enumerate(order_keys, start=start):
+        label, _, object_id = str(order_key).rpartition(":")
+        if label in targets:
+            targets[label][object_id] = index
+    return [
+        (
+            queryset,
+            get_value_changes(
+                queryset, field_name, targets[queryset.model._meta.label_lower]
+            ),
+        )
+        for queryset in querysets
+    ]
+
+
+# Batch moves understood by `move_block`; "to" and "by" take an integer value.
+MOVES = ("first", "last", "to", "by")
+
+
+def move_block(order, selected, move, value=None):
+    """
+    Returns the list of IDs in `order` with the `selected` IDs moved together as
+    one block, keeping their current relative order.
+
+    `move` is one of `MOVES`: "first", "last", "to" (the block starts at the
+    1-based position `value`) or "by" (the block is shifted by `value` places,
+    negative values moving it up). Out of range targets are clamped.
+    """
+    order = [str(object_id) for object_id in order]
+    selected = {str(object_id) for object_id in selected}
+    block = [object_id for object_id in order if object_id in selected]
+    rest = [object_id for object_id in order if object_id not in selected]
+    if not block:
+        return order
+
+    if move == "first":
+        index = 0
+    elif move == "last":
+        index = len(rest)
+    elif move == "to":
+        index = value - 1
+    elif move == "by":
+        index = order.index(block[0]) + value
+    else:
+        raise ValueError(f"Unknown move {move!r}")
+    index = max(0, min(index, len(rest)))
+    return rest[:index] + block + rest[index:]
+
+
+def get_order_value_limits(queryset, field_name):
+    """
+    Returns the `(min_value, max_value)` range of the database column storing
+    `field_name`, e.g. 32-bit for an `IntegerField` on PostgreSQL.
+    """
+    field = queryset.model._meta.get_field(field_name)
+    return connections[queryset.db].ops.integer_field_range(field.get_internal_type())
+
+
+def is_near_order_limits(values, limits, threshold=DEFAULT_RANGE_THRESHOLD):
+    """
+    Whether any of `values` lies beyond the `threshold` fraction of `limits`,
+    i.e. the ordering is running out of room in that direction.
+    """
+    low, high = limits
+    return any(
+        value is not None and not low * threshold <= value <= high * threshold
+        for value in values
+    )
+
+
+def get_end_move_changes(queryset, field_name, object_ids, move, descending=False):
+    """
+    Returns the changes moving `object_ids` as one block to the start ("first")
+    or end ("last") of `queryset`, keeping their relative order. In a
+    `descending` ordering the start holds the highest values.
+
+    Only the moved rows are written: they take the values just below the
+    lowest, or just above the highest, value of the other rows, going negative
+    if needed. Returns None for other moves, if the other rows have no values,
+    or if the new values would not fit the column, in which case the whole
+    ordering has to be renumbered.
+    """
+    if move not in ("first", "last"):
+        return None
+    if descending:
+        move = "last" if move == "first" else "first"
+    object_ids = [str(object_id) for object_id in object_ids]
+    selected = list(
+        queryset.filter(pk__in=object_ids)
+        .order_by(field_name, "pk")
+        .values_list("pk", field_name)
+    )
+    others = queryset.exclude(pk__in=[pk for pk, value in selected]).aggregate(
+        low=Min(field_name), high=Max(field_name)
+    )
+    if not selected:
+        return []
+    if others["low"] is None:
+        return None
+
+    low, high = get_order_value_limits(queryset, field_name)
+    if move == "first":
+        start = others["low"] - len(selected)
+        if start < low:
+            return None
+    else:
+        start = others["high"] + 1
+        if start + len(selected) - 1 > high:
+            return None
+    return [
+        (pk, old_value, new_value)
+        for (pk, old_value), new_value in zip(
+            selected, range(start, start + len(selected)), strict=True
+        )
+        if old_value != new_value
+    ]
+
+
+def compact_order(queryset, field_name, start=1, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Renumbers the sort values of `queryset` to consecutive integers from
+    `start`, keeping the order, and returns the number of rows written. Rows
+    sharing a value keep sharing it, and rows without one are left alone.
+
+    The rows are written in chunks of up to `batch_size` values, each in its
+    own short transaction, so the table is never locked for long. The order
+    stays correct between chunks: values above their target are lowered
+    starting from the lowest, and values below it are raised starting from the
+    highest, so no row passes another. If a row of the next chunk has changed
+    since the values were read, compaction stops; run it again to finish.
+    """
+    queryset = queryset.order_by()
+    rows = list(
+        queryset.exclude(**{f"{field_name}__isnull": True}).values_list(
+            "pk", field_name
+        )
+    )
+    targets = {
+        value: index
+        for index, value in enumerate(sorted({value for pk, value in rows}), start)
+    }
+    lowered = sorted(value for value, target in targets.items() if value > target)
+    raised = sorted(
+        (value for value, target in targets.items() if value < target), reverse=True
+    )
+    pks_by_value = {}
+    for pk, value in rows:
+        pks_by_value.setdefault(value, []).append(pk)
+
+    written = 0
+    for values in (lowered, raised):
+        for offset in range(0, len(values), batch_size):
+            chunk = {
+                pk: (value, targets[value])
+                for value in values[offset : offset + batch_size]
+                for pk in pks_by_value[value]
+            }
+            with transaction.atomic(using=queryset.db):
+                current = dict(
+                    queryset.filter(pk__in=list(chunk))
+                    .select_for_update()
+                    .values_list("pk", field_name)
+                )
+                if current != {pk: old for pk, (old, new) in chunk.items()}:
+                    return written
+                apply_order_values(
+                    queryset,
+                    field_name,
+                    {pk: new for pk, (old, new) in chunk.items()},
+                    batch_size=batch_size,
+                )
+            written += len(chunk)
+    return written
+
+
+def start_order_compaction(key, func, using=None):
+    """
+    Runs `func` (typically calling `compact_order`) in a background thread once
+    the current transaction commits, unless a compaction with the same `key`
+    is already running. Returns immediately.
+    """
+
+    def run():
+        try:
+            func()
+        finally:
+            connections.close_all()
+            with _running_compactions_lock:
+                _running_compactions.discard(key)
+
+    def start():
+        with _running_compactions_lock:
+            if key in _running_compactions:
+                return
+            _running_compactions.add(key)
+        threading.Thread(target=run, name=f"compact-{key}", daemon=True).start()
+
+    transaction.on_commit(start, using=using)
+
+
+def get_page_order_changes(queryset, field_name, object_ids, descending=False):
+    """
+    Returns the changes reordering a page of a listing sorted by `field_name`,
+    descending if `descending`, where `object_ids` are the rows shown on the
+    page in their new order.
+
+    The rows keep the set of sort values they already hold, reassigned in the
+    new order, so rows on other pages (or hidden by a filter) are untouched.
+    Returns None if the values are missing or not distinct, as the page then
+    has no well-defined place in the global order.
+    """
+    current = {
+        str(pk): (pk, value)
+        for pk, value in queryset.filter(pk__in=list(object_ids)).values_list(
+            "pk", field_name
+        )
+    }
+    values = sorted(
+        (value for pk, value in current.values() if value is not None),
+        reverse=descending,
+    )
+    if len(set(values)) != len(current):
+        return None
+
+    object_ids = dict.fromkeys(
+        str(object_id) for object_id in object_ids if str(object_id) in current
+    )
+    changes = []
+    for object_id, new_value in zip(object_ids, values, strict=False):
+        pk, old_value = current[object_id]
+        if old_value != new_value:
+            changes.append((pk, old_value, new_value))
+    return changes
+
+
+def splice_order(order, object_ids):
+    """
+    Returns the list of IDs in `order` with `object_ids` rearranged, in the
+    given order, across the positions they occupy. Other IDs keep their place.
+    """
+    order = [str(object_id) for object_id in order]
+    present = set(order)
+    object_ids = [
+        object_id
+        for object_id in dict.fromkeys(str(object_id) for object_id in object_ids)
+        if object_id in present
+    ]
+    selected = set(object_ids)
+    replacements = iter(object_ids)
+    return [
+        next(replacements) if object_id in selected else object_id
+        for object_id in order
+    ]
+
+
+def apply_order_values(queryset, field_name, values, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Writes the given `{pk: sort_value}` mapping to `queryset`.
+    Only the rows present in `values` are touched.
+
+    Rows are processed in primary key order, in batches of at most
+    `batch_size`. Each batch locks its rows in that order before issuing a
+    single `UPDATE ... CASE` statement, so overlapping reorders always acquire
+    row locks in the same order and cannot deadlock each other.
+
+    When the field is inherited from a multi-table parent, the parent table is
+    written directly (child and parent share primary key values), avoiding a
+    join and a per-row related update.
+    """
+    output_field = queryset.model._meta.get_field(field_name)
+    owner = get_sort_field_model(queryset.model, field_name)
+    if owner is not queryset.model._meta.concrete_model:
+        queryset = owner._base_manager.using(queryset.db).all()
+    lock_rows = connections[queryset.db].features.has_select_for_update
+    items = sorted(values.items())
+    for start in range(0, len(items), batch_size):
+        batch = items[start : start + batch_size]
+        rows = queryset.filter(pk__in=[pk for pk, value in batch])
+        if lock_rows:
+            list(rows.order_by("pk").select_for_update().values_list("pk", flat=True))
+        rows.update(
+            **{
+                field_name: Case(
+                    *[When(pk=pk, then=Value(value)) for pk, value in batch],
+                    output_field=output_field,
+                )
+            }
+        )
+
+
+def supports_update_join(connection):
+    """
+    Whether `connection` can update a table from a join with a derived table,
+    with `UPDATE ... FROM` (PostgreSQL, SQLite 3.33+) or `UPDATE ... JOIN`
+    (MySQL, MariaDB).
+    """
+    if connection.vendor == "sqlite":
+        return connection.Database.sqlite_version_info >= (3, 33)
+    return connection.vendor in ("postgresql", "mysql")
+
+
+def reseed_order(
+    queryset,
+    field_name,
+    ordering,
+    start=1,
+    batch_size=DEFAULT_BATCH_SIZE,
+    descending=False,
+):
+    """
+    Renumbers every row of `queryset` from `start`, sorted by `ordering` (a
+    list of field names, optionally prefixed with "-"), with the primary key as
+    a tie-breaker. Returns the number of rows in the new order. With
+    `descending`, the rows are numbered in reverse, for an ordering listed from
+    the highest value down.
+
+    Where the database supports window functions and joined updates this is a
+    single statement joining the table to its `ROW_NUMBER() OVER (ORDER BY ...)`
+    ranking, which is computed once. Otherwise the sorted IDs are fetched and
+    written through `apply_order_values`.
+    """
+    ordering = [*ordering, "pk"]
+    if descending:
+        ordering = [
+            term[1:] if term.startswith("-") else f"-{term}" for term in ordering
+        ]
+    connection = connections[queryset.db]
+    queryset = queryset.order_by()
+
+    if not (
+        connection.features.supports_over_clause and supports_update_join(connection)
+    ):
+        object_ids = list(queryset.order_by(*ordering).values_list("pk", flat=True))
+        changes = get_order_changes(queryset, field_name, object_ids, start)
+        apply_order_values(
+            queryset,
+            field_name,
+            {pk: new for pk, old, new in changes},
+            batch_size=batch_size,
+        )
+        return len(object_ids)
+
+    ranked = queryset.annotate(
+        reseed_rank=Window(RowNumber(), order_by=ordering)
+    ).values("reseed_rank", reseed_pk=F("pk"))
+    ranked_sql, ranked_params = ranked.query.get_compiler(using=queryset.db).as_sql()
+
+    # Write to the table that stores the field (a parent for multi-table
+    # inheritance); its primary key values match those of `queryset`.
+    owner = get_sort_field_model(queryset.model, field_name)
+    qn = connection.ops.quote_name
+    table = qn(owner._meta.db_table)
+    pk_column = qn(owner._meta.pk.column)
+    column = qn(owner._meta.get_field(field_name).column)
+    rank, pk = qn("reseed_rank"), qn("reseed_pk")
+    if connection.vendor == "mysql":
+        sql = (
+            f"UPDATE {table} INNER JOIN ({ranked_sql}) ranked "
+            f"ON ranked.{pk} = {table}.{pk_column} "
+            f"SET {table}.{column} = ranked.{rank} + %s"
+        )
+        params = (*ranked_params, start - 1)
+    else:
+        sql = (
+            f"UPDATE {table} SET {column} = ranked.{rank} + %s "
+            f"FROM ({ranked_sql}) ranked WHERE ranked.{pk} = {table}.{pk_column}"
+        )
+        params = (start - 1, *ranked_params)
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        return cursor.rowcount
+
+
+def copy_order_from_locale(queryset, field_name, locale):
+    """
+    Copies the sort values of the objects of `queryset` in `locale` to their
+    translations in every other locale, matched by `translation_key`, with a
+    single `UPDATE ... SET field = (SELECT ...)` statement. Translations whose
+    source object does not exist keep their value. Returns the number of rows
+    matched.
+
+    MySQL refuses subqueries reading the table being updated, so there the
+    source values are fetched first and written through `apply_order_values`.
+    """
+    if connections[queryset.db].vendor == "mysql":
+        values = dict(
+            queryset.filter(locale=locale).values_list("translation_key", field_name)
+        )
+        targets = (
+            queryset.exclude(locale=locale)
+            .filter(translation_key__in=list(values))
+            .values_list("pk", "translation_key")
+        )
+        targets = {pk: values[key] for pk, key in targets}
+        apply_order_values(queryset, field_name, targets)
+        return len(targets)
+
+    source = queryset.model._base_manager.filter(
+        locale=locale, translation_key=OuterRef("translation_key")
+    )
+    return (
+        queryset.exclude(locale=locale)
+        .filter(Exists(source))
+        .update(**{field_name: Subquery(source.values(field_name)[:1])})
+    )
+
+
+def is_retryable_error(exc):
+    """
+    Whether `exc` is a deadlock, serialization or lock timeout failure that is
+    likely to succeed if the transaction is run again.
+    """
+    cause = exc.__cause__
+    code = getattr(cause, "sqlstate", None) or getattr(cause, "pgcode", None)
+    if code in RETRYABLE_SQLSTATES:
+        return True
+    args = getattr(cause, "args", ())
+    if args and args[0] in RETRYABLE_MYSQL_ERRORS:
+        return True
+    # SQLite reports lock contention as "database is locked" or, for shared
+    # cache connections, "database table is locked".
+    return "is locked" in str(exc)
+
+
+def atomic_with_retry(func, attempts=3, backoff=0.05, using=None):
+    """
+    Runs `func` in a transaction, retrying it with exponential backoff when it
+    fails with a retryable database error. Returns the result of `func`.
+
+    A failed statement aborts any enclosing transaction too, so retries only
+    happen when this is the outermost atomic block.
+    """
+    connection = transaction.get_connection(using)
+    for attempt in range(attempts):
+        try:
+            with transaction.atomic(using=using):
+                return func()
+        except DatabaseError as e:
+            if (
+                attempt + 1 >= attempts
+                or connection.in_atomic_block
+                or not is_retryable_error(e)
+            ):
+                raise
+        time.sleep(backoff * 2**attempt)
@@ -0,0 +1,68 @@
+"""
+Per-phase timings of the order views, for finding out where a slow order page
+spends its time.
+
+Enable with `order_profiling_enabled` on the viewset. Timings are sent in a
+`Server-Timing` header (shown in the browser's network panel), listed on the
+order page and added to the JSON responses of the write endpoints. Set
+`order_profile_dir` to also dump cProfile statistics for each request, to be
+read with `pstats` or a viewer such as snakeviz.
+"""
+
+import cProfile
+import os
+import time
+from contextlib import contextmanager
+
+
+class OrderProfiler:
+    """
+    Records the wall-clock time spent in named phases, in milliseconds. When
+    disabled, phases are not timed and nothing is recorded.
+
+    Used as a context manager around a whole request, it also profiles the
+    request with cProfile if `profile_path` is set.
+    """
+
+    def __init__(self, enabled=True, profile_path=None):
+        self.enabled = enabled
+        self.profile_path = profile_path if enabled else None
+        self.timings = {}
+        self.profile = None
+
+    @contextmanager
+    def phase(self, name):
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = (time.perf_counter() - start) * 1000
+            self.timings[name] = round(self.timings.get(name, 0) + elapsed, 3)
+
+    def __enter__(self):
+        if self.profile_path:
+            self.profile = cProfile.Profile()
+            self.profile.enable()
+        return self
+
+    def __exit__(self, *exc_info):
+        if self.profile is not None:
+            self.profile.disable()
+            os.makedirs(os.path.dirname(self.profile_path) or ".", exist_ok=True)
+            self.profile.dump_stats(self.profile_path)
+
+    def get_server_timing(self):
+        """
+        Returns the timings as a `Server-Timing` header value.
+        """
+        return ", ".join(
+            f"{name};dur={duration:.1f}" for name, duration in self.timings.items()
+        )
+
+    def add_to_response(self, response):
+        if self.enabled and self.timings:
+            response["Server-Timing"] = self.get_server_timing()
+        return response
@@ -0,0 +1,81 @@
+"""
+Targeted frontend cache purging after a reorder.
+
+Register the pages or URLs that render an orderable model, and every reorder
+of that model purges just those from the frontend caches configured in
+`WAGTAILFRONTENDCACHE`, in a single batch once the transaction commits:
+
+    register_purge_targets(Testimonial, "https://example.com/about/")
+
+    @register_purge_targets(TeamMember)
+    def team_pages(model, pks):
+        return TeamPage.objects.live()
+
+A target is a page, an iterable of pages (e.g. a queryset), a full URL, or a
+callable `fn(model, pks)` returning any of these. Targets registered for a
+multi-table parent model also apply to its children.
+"""
+
+from wagtail.contrib.frontend_cache.utils import PurgeBatch
+from wagtail.models import Page
+
+_registry = {}
+
+
+def register_purge_targets(model, *targets):
+    """
+    Registers the pages or URLs rendering `model`. Called with only a model,
+    returns a decorator registering the decorated callable.
+    """
+    if not targets:
+
+        def decorator(fn):
+            register_purge_targets(model, fn)
+            return fn
+
+        return decorator
+
+    _registry.setdefault(model, []).extend(targets)
+
+
+def get_purge_targets(model):
+    """
+    Returns the targets registered for `model` and its multi-table parents.
+    """
+    return [
+        target
+        for cls in (model, *model._meta.get_parent_list())
+        for target in _registry.get(cls, ())
+    ]
+
+
+def get_purge_batch(model, pks):
+    """
+    Returns a `PurgeBatch` of the URLs to purge after reordering `pks` of
+    `model`, or None if nothing is registered.
+    """
+    targets = get_purge_targets(model)
+    if not targets:
+        return None
+
+    batch = PurgeBatch()
+    while targets:
+        target = targets.pop()
+        if callable(target):
+            targets.append(target(model, pks))
+        elif isinstance(target, str):
+            batch.add_url(target)
+        elif isinstance(target, Page):
+            batch.add_page(target)
+        elif target is not None:
+            targets.extend(target)
+    return batch
+
+
+def purge_after_reorder(sender, pks, **kwargs):
+    """
+    `post_reorder` receiver purging the targets registered for `sender`.
+    """
+    batch = get_purge_batch(sender, pks)
+    if batch is not None and batch.urls:
+        batch.purge()
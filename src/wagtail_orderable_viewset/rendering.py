@@ -0,0 +1,70 @@
+"""
+Fast rendering of the rows of the order view.
+
+Rendering the row template once per object dominates the cost of a large order
+page. `OrderRowRenderer` renders it once per request, with placeholders for the
+values that change from row to row, and fills the resulting fragment for each
+object with plain string formatting. The page around the rows is still rendered
+by the order template.
+
+The row template may only vary per object through `obj.order_key`, `obj.pk`,
+`obj.order_title` and `obj.order_value`; anything else is evaluated once, for
+the placeholder row. Set `order_fast_rows = False` on the viewset for a row
+template that needs more, so that it is rendered for each object.
+"""
+
+from html import escape
+
+from django.template.loader import render_to_string
+from django.utils.safestring import SafeData, mark_safe
+
+PLACEHOLDER = "__orderable_row_{}__"
+
+# Per-row values, by the name used in the compiled fragment
+ROW_FIELDS = ("id", "title", "value")
+
+
+def conditional_escape(value):
+    """
+    Escapes `value` as the template engine does, leaving safe strings alone.
+    Faster than Django's own for the plain strings and numbers of the rows.
+    """
+    if isinstance(value, SafeData):
+        return value
+    return escape(str(value))
+
+
+class OrderRowRenderer:
+    """
+    Renders `template_name` once for a placeholder object, in `context`, and
+    fills the result for each row passed to `render()`.
+    """
+
+    def __init__(self, template_name, context=None, request=None):
+        placeholder = {
+            "pk": PLACEHOLDER.format("id"),
+            "order_title": PLACEHOLDER.format("title"),
+            "order_value": PLACEHOLDER.format("value"),
+        }
+        fragment = render_to_string(
+            template_name, {**(context or {}), "obj": placeholder}, request=request
+        )
+        # Turn the fragment into a %-format string
+        fragment = fragment.replace("%", "%%")
+        for field in ROW_FIELDS:
+            fragment = fragment.replace(PLACEHOLDER.format(field), f"%({field})s")
+        self.fragment = fragment
+
+    def render_row(self, obj):
+        value = getattr(obj, "order_value", None)
+        return self.fragment % {
+            "id": conditional_escape(getattr(obj, "order_key", None) or obj.pk),
+            "title": conditional_escape(getattr(obj, "order_title", None) or obj),
+            "value": "None" if value is None else conditional_escape(value),
+        }
+
+    def render(self, objects):
+        """
+        Returns the HTML of the rows of `objects`, as a safe string.
+        """
+        return mark_safe("".join(map(self.render_row, objects)))
@@ -0,0 +1,52 @@
+"""
+Signals and hooks sent once per reorder operation, rather than once per row.
+
+Reorders are written with bulk `UPDATE` statements, so no model signals fire
+for the affected objects. Subscribe to these instead to batch downstream work
+such as cache purges or search reindexing.
+
+Both signals are sent with the reordered model as `sender` and the keyword
+arguments:
+
+- `pks`: primary keys of the objects whose sort value changes. For
+  `pre_reorder` this is None when the new values are computed by the database
+  (a reseed), as every object in the scope may be renumbered.
+- `scope`: the subset of objects being ordered (see
+  `OrderableViewSetMixin.get_order_scope`), or None for the whole model.
+- `operation`: what caused the reorder, e.g. "order", "move", "reseed",
+  "import", "undo" or "redo".
+- `user`: the user making the change, if any.
+
+`pre_reorder` is sent inside the transaction, just before the write.
+`post_reorder` and the `after_reorder` Wagtail hook are sent once the
+transaction commits, and not at all if it is rolled back. Hook functions are
+called as `fn(model, pks, scope=..., operation=..., user=...)`.
+"""
+
+from django.db import transaction
+from django.dispatch import Signal
+from wagtail import hooks
+
+pre_reorder = Signal()
+post_reorder = Signal()
+
+
+def send_pre_reorder(model, pks, scope=None, operation=None, user=None):
+    pre_reorder.send(sender=model, pks=pks, scope=scope, operation=operation, user=user)
+
+
+def send_post_reorder(model, pks, scope=None, operation=None, user=None, using=None):
+    """
+    Sends `post_reorder` and runs the `after_reorder` hooks when the current
+    transaction commits (immediately outside a transaction).
+    """
+    pks = list(pks)
+
+    def send():
+        post_reorder.send(
+            sender=model, pks=pks, scope=scope, operation=operation, user=user
+        )
+        for fn in hooks.get_hooks("after_reorder"):
+            fn(model, pks, scope=scope, operation=operation, user=user)
+
+    transaction.on_commit(send, using=using)
@@ -0,0 +1,80 @@
+// Drag-and-drop reordering of the rows on one page of an orderable listing.
+// The page's row IDs are sent in their new order and reconciled with the
+// global order by the server, so rows on other pages keep their place.
+const container = document.getElementById('orderable-listing');
+
+if (container) {
+    const { Sortable } = await import(container.dataset.sortableUrl);
+    const config = JSON.parse(document.getElementById('wagtail-config')?.textContent || '{}');
+
+    // Server-provided text is set as text, never parsed as HTML
+    function showStatus(message, type) {
+        const messages = document.createElement('div');
+        messages.className = 'messages';
+        const item = document.createElement('div');
+        item.className = `message ${type === 'success' ? 'success' : 'error'}`;
+        const text = document.createElement('p');
+        text.textContent = message;
+        item.append(text);
+        messages.append(item);
+        container.replaceChildren(messages);
+        setTimeout(() => {
+            container.replaceChildren();
+        }, 3000);
+    }
+
+    // Requests are sent one at a time, in the order the rows were dropped
+    let requestQueue = Promise.resolve();
+
+    function saveOrder(tbody) {
+        const formData = new URLSearchParams();
+        tbody.querySelectorAll('.orderable-listing-handle').forEach((handle) => {
+            formData.append('object_ids[]', handle.dataset.orderId);
+        });
+        // Forward the listing's scope parameters (e.g. locale) to the endpoint
+        const url = container.dataset.url + window.location.search;
+
+        requestQueue = requestQueue.then(() => fetch(url, {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/x-www-form-urlencoded;charset=UTF-8',
+                'X-CSRFToken': config.CSRF_TOKEN,
+            },
+            body: formData,
+            credentials: 'same-origin',
+        })
+            .then((response) => response.json())
+            .then((data) => {
+                if (data.success) {
+                    showStatus(data.draft ? 'Order saved as a draft' : 'Order saved successfully', 'success');
+                } else {
+                    showStatus('Error saving order: ' + (data.error || 'Unknown error'), 'error');
+                }
+            })
+            .catch((error) => {
+                console.error('Error:', error);
+                showStatus('Error saving order', 'error');
+            }));
+    }
+
+    // Make the table bodies holding drag handles sortable. Called again when
+    // the results are swapped in after filtering or changing page.
+    function init() {
+        document.querySelectorAll('.orderable-listing-handle').forEach((handle) => {
+            const tbody = handle.closest('tbody');
+            if (!tbody || tbody.dataset.orderableListing) return;
+            tbody.dataset.orderableListing = 'true';
+            Sortable.create(tbody, {
+                handle: '.orderable-listing-handle',
+                draggable: 'tr',
+                animation: 150,
+                onEnd: (evt) => {
+                    if (evt.oldIndex !== evt.newIndex) saveOrder(tbody);
+                },
+            });
+        });
+    }
+
+    init();
+    document.addEventListener('w-swap:success', init);
+}
@@ -1,21 +1,24 @@
-import Sortable from "https://cdn.jsdelivr.net/npm/sortablejs@1.15.0/+esm";
-
-document.addEventListener('DOMContentLoaded', function () {
+document.addEventListener('DOMContentLoaded', async function () {
     const orderableList = document.getElementById('orderable-list');
     const saveStatus = document.getElementById('save-status');
     if (!orderableList) return;
-    let isSaving = false;
 
     // Function to show status message
+    // The message may hold server-provided text (e.g. another user's name),
+    // so it is set as text rather than parsed as HTML.
     function showStatus(message, type) {
-        saveStatus.innerHTML = `
-          <div class="messages">
-            <div class="message ${type}">
-              <a href="#" class="icon icon-${type === 'success' ? 'success' : 'warning'}"></a>
-              <p>${message}</p>
-            </div>
-          </div>
-        `;
+        const messages = document.createElement('div');
+        messages.className = 'messages';
+        const item = document.createElement('div');
+        item.className = `message ${type === 'success' ? 'success' : 'error'}`;
+        const icon = document.createElement('a');
+        icon.href = '#';
+        icon.className = `icon icon-${type === 'success' ? 'success' : 'warning'}`;
+        const text = document.createElement('p');
+        text.textContent = message;
+        item.append(icon, text);
+        messages.append(item);
+        saveStatus.replaceChildren(messages);
         saveStatus.style.display = 'block';
 
         // Hide after 3 seconds
@@ -24,43 +27,65 @@ document.addEventListener('DOMContentLoaded', function () {
         }, 3000);
     }
 
-    // Function to save the order
-    function saveOrder() {
-        if (isSaving) return; // Prevent multiple simultaneous saves
+    // Extract CSRF token from hidden form field
+    function getCsrfToken() {
+        const csrfInput = document.querySelector('input[name="csrfmiddlewaretoken"]');
+        return csrfInput ? csrfInput.value : undefined;
+    }
 
-        const items = orderableList.querySelectorAll("li");
-        const order = Array.from(items).map((item) => item.getAttribute("data-id"));
+    // Requests are sent one at a time, in the order the changes were made.
+    // Live updates received while requests are pending are applied once the
+    // queue drains, so they do not fight the editor's own changes.
+    let requestQueue = Promise.resolve();
+    let pendingRequests = 0;
+    let deferredUpdate = null;
 
-        isSaving = true;
+    function enqueue(task) {
+        pendingRequests++;
+        requestQueue = requestQueue.then(task).finally(() => {
+            pendingRequests--;
+            if (!pendingRequests && deferredUpdate) {
+                const update = deferredUpdate;
+                deferredUpdate = null;
+                update();
+            }
+        });
+        return requestQueue;
+    }
 
-        // Extract CSRF token from hidden form field
-        const csrfInput = document.querySelector('input[name="csrfmiddlewaretoken"]');
-        const csrfToken = csrfInput ? csrfInput.value : undefined;
+    // POST form data and return the parsed JSON response
+    // (multipart FormData sets its own Content-Type). Scoped orderings, e.g.
+    // per locale or per parent, send their scope with every request.
+    const scopeParams = new URLSearchParams(orderableList.dataset.scope || '');
+    function postForm(url, formData) {
+        const csrfToken = getCsrfToken();
+        scopeParams.forEach((value, key) => {
+            if (!formData.has(key)) formData.append(key, value);
+        });
 
-        // Prepare headers, only set X-CSRFToken if token is found
-        const headers = {
-            "Content-Type": "application/x-www-form-urlencoded;charset=UTF-8"
-        };
+        // Prepare headers, only set X-CSRFToken if token is found. Wagtail
+        // answers XMLHttpRequests it denies with a 403 instead of a redirect.
+        const headers = {"X-Requested-With": "XMLHttpRequest"};
+        if (!(formData instanceof FormData)) {
+            headers["Content-Type"] = "application/x-www-form-urlencoded;charset=UTF-8";
+        }
         if (csrfToken) {
             headers["X-CSRFToken"] = csrfToken;
         }
-        const formData = new URLSearchParams();
-        order.forEach((id) => formData.append('object_ids[]', id));
-
-        const updateUrl = orderableList.dataset.updateUrl;
-        fetch(updateUrl, {
+        return fetch(url, {
             method: "POST",
-            headers: {
-                "Content-Type": "application/x-www-form-urlencoded;charset=UTF-8",
-                "X-CSRFToken": csrfToken,
-            },
+            headers: headers,
             body: formData,
             credentials: 'same-origin',
-        })
-            .then(response => response.json())
+        }).then(response => response.json());
+    }
+
+    // POST a change and report the outcome
+    function sendChange(url, formData, successMessage) {
+        return postForm(url, formData)
             .then(data => {
                 if (data.success) {
-                    showStatus("Order saved successfully", "success");
+                    showStatus(data.draft ? successMessage + " as a draft" : successMessage, "success");
                 } else {
                     console.error("Error saving order:", data.error || "Unknown error");
                     showStatus("Error saving order: " + (data.error || "Unknown error"), "error");
@@ -69,90 +94,398 @@ document.addEventListener('DOMContentLoaded', function () {
             .catch(error => {
                 console.error('Error:', error);
                 showStatus("Error saving order", "error");
-            })
-            .finally(() => {
-                isSaving = false;
             });
     }
 
-    // Function to update button visibility based on position
-    function updateButtonVisibility() {
-        const items = orderableList.querySelectorAll("li");
+    // Current order of item IDs, kept in step with the DOM so that saving
+    // does not need to re-scan the list
+    const order = Array.from(orderableList.children, (item) => item.dataset.id);
+    const itemsById = new Map(Array.from(orderableList.children, (item) => [item.dataset.id, item]));
+    let saveQueued = false;
 
-        items.forEach((item, index) => {
-            const moveFirstBtn = item.querySelector('.move-first');
-            const moveLastBtn = item.querySelector('.move-last');
+    // Move an ID within the order array
+    function moveId(fromIndex, toIndex) {
+        const [id] = order.splice(fromIndex, 1);
+        order.splice(toIndex, 0, id);
+    }
 
-            // Hide/show Move First button
-            if (index === 0) {
-                moveFirstBtn.style.display = 'none';
-            } else {
-                moveFirstBtn.style.display = 'inline-flex';
-            }
+    // Function to save the full order. Several saves requested while another
+    // request is in flight are coalesced into one, sent with the latest order.
+    function saveOrder() {
+        if (saveQueued) return;
+        saveQueued = true;
 
-            // Hide/show Move Last button
-            if (index === items.length - 1) {
-                moveLastBtn.style.display = 'none';
-            } else {
-                moveLastBtn.style.display = 'inline-flex';
-            }
+        enqueue(() => {
+            saveQueued = false;
+            const formData = new URLSearchParams();
+            order.forEach((id) => formData.append('object_ids[]', id));
+            return sendChange(orderableList.dataset.updateUrl, formData, "Order saved successfully");
         });
     }
 
-    // Function to move item to specific position
-    function moveItem(itemId, position) {
-        const item = orderableList.querySelector(`li[data-id="${itemId}"]`);
-        if (!item) return;
+    // Function to move item to specific position. Move First/Last button
+    // visibility follows from the :first-child/:last-child CSS rules.
+    function moveItem(item, position) {
+        const fromIndex = order.indexOf(item.dataset.id);
 
         if (position === 'first') {
-            orderableList.insertBefore(item, orderableList.firstChild);
+            orderableList.prepend(item);
+            moveId(fromIndex, 0);
             // Scroll to top of the list
             setTimeout(() => {
                 orderableList.scrollIntoView({ behavior: 'smooth', block: 'start' });
             }, 100);
         } else if (position === 'last') {
-            orderableList.appendChild(item);
+            orderableList.append(item);
+            moveId(fromIndex, order.length - 1);
             // Scroll to bottom of the list
             setTimeout(() => {
                 orderableList.scrollIntoView({ behavior: 'smooth', block: 'end' });
             }, 100);
         }
 
-        // Update button visibility after moving
-        updateButtonVisibility();
-
         // Save the new order
         saveOrder();
     }
 
-    // Add event listeners for Move First/Last buttons
-    orderableList.addEventListener('click', function (e) {
-        e.preventDefault();
+    // Returns the order with the given IDs moved together as one block,
+    // matching move_block() on the server
+    function moveBlock(ids, move, value) {
+        const selected = new Set(ids);
+        const block = order.filter((id) => selected.has(id));
+        const rest = order.filter((id) => !selected.has(id));
+        if (!block.length) return order.slice();
+
+        let index;
+        if (move === 'first') {
+            index = 0;
+        } else if (move === 'last') {
+            index = rest.length;
+        } else if (move === 'to') {
+            index = value - 1;
+        } else {
+            index = order.indexOf(block[0]) + value;
+        }
+        index = Math.max(0, Math.min(index, rest.length));
+        return rest.slice(0, index).concat(block, rest.slice(index));
+    }
+
+    // Move several items in one go and send a single compact request
+    function moveSelection(ids, move, value) {
+        if (!ids.length) return;
+        const moveUrl = orderableList.dataset.moveUrl;
+        const newOrder = moveBlock(ids, move, value);
 
+        // Only the moved items are re-inserted, in front of their new neighbour
+        const selected = new Set(ids);
+        const block = newOrder.filter((id) => selected.has(id));
+        const next = newOrder[newOrder.indexOf(block[block.length - 1]) + 1];
+        const reference = next === undefined ? null : itemsById.get(next);
+        block.forEach((id) => orderableList.insertBefore(itemsById.get(id), reference));
+        order.splice(0, order.length, ...newOrder);
+
+        enqueue(() => {
+            const formData = new URLSearchParams();
+            ids.forEach((id) => formData.append('object_ids[]', id));
+            formData.append('move', move);
+            if (value !== undefined) formData.append('value', value);
+            return sendChange(moveUrl, formData, `Moved ${ids.length} item${ids.length === 1 ? '' : 's'}`);
+        });
+    }
+
+    // Multi-select state
+    const selection = new Set();
+    const selectedCount = document.getElementById('orderable-selected-count');
+
+    function setSelected(item, isSelected) {
+        const id = item.dataset.id;
+        if (isSelected) {
+            selection.add(id);
+        } else {
+            selection.delete(id);
+        }
+        item.classList.toggle('is-selected', isSelected);
+        item.querySelector('.orderable-select').checked = isSelected;
+        if (selectedCount) {
+            selectedCount.textContent = `${selection.size} selected`;
+        }
+    }
+
+    // Selected IDs in list order, or the given item when nothing is selected
+    function getSelectedIds(fallbackItem) {
+        if (selection.size) return order.filter((id) => selection.has(id));
+        return fallbackItem ? [fallbackItem.dataset.id] : [];
+    }
+
+    // Add event listeners for Move First/Last buttons and selection checkboxes
+    orderableList.addEventListener('click', function (e) {
+        const item = e.target.closest('li');
         if (e.target.closest('.move-first')) {
-            const itemId = e.target.closest('.move-first').getAttribute('data-id');
-            moveItem(itemId, 'first');
+            e.preventDefault();
+            moveItem(item, 'first');
         } else if (e.target.closest('.move-last')) {
-            const itemId = e.target.closest('.move-last').getAttribute('data-id');
-            moveItem(itemId, 'last');
+            e.preventDefault();
+            moveItem(item, 'last');
+        }
+    });
+
+    orderableList.addEventListener('change', function (e) {
+        if (e.target.classList.contains('orderable-select')) {
+            setSelected(e.target.closest('li'), e.target.checked);
         }
     });
 
+    // Keyboard: Space selects, Alt+Up/Down moves one place, Alt+Home/End moves
+    // first/last. Moves apply to the selection, or to the focused item.
+    orderableList.addEventListener('keydown', function (e) {
+        const item = e.target.closest('li');
+        if (!item || e.target !== item) return;
+
+        let move;
+        let value;
+        if (e.key === ' ') {
+            e.preventDefault();
+            setSelected(item, !selection.has(item.dataset.id));
+            return;
+        } else if (e.altKey && e.key === 'ArrowUp') {
+            move = 'by';
+            value = -1;
+        } else if (e.altKey && e.key === 'ArrowDown') {
+            move = 'by';
+            value = 1;
+        } else if (e.altKey && e.key === 'Home') {
+            move = 'first';
+        } else if (e.altKey && e.key === 'End') {
+            move = 'last';
+        } else {
+            return;
+        }
+        e.preventDefault();
+        moveSelection(getSelectedIds(item), move, value);
+        item.focus();
+    });
+
+    // Batch action toolbar
+    const batchActions = document.getElementById('orderable-batch-actions');
+    if (batchActions) {
+        batchActions.addEventListener('click', function (e) {
+            const button = e.target.closest('[data-move]');
+            if (!button) return;
+
+            const move = button.dataset.move;
+            let value;
+            if (move === 'to' || move === 'by') {
+                value = parseInt(document.getElementById('orderable-move-value').value, 10);
+                if (Number.isNaN(value)) {
+                    showStatus("Enter a number first", "error");
+                    return;
+                }
+            }
+            moveSelection(getSelectedIds(), move, value);
+        });
+    }
+
+    // Undo/redo the last reorder, then reload to show the restored order
+    function replayHistory(button, emptyMessage) {
+        enqueue(() => postForm(button.dataset.url, new URLSearchParams())
+            .then(data => {
+                if (!data.success) {
+                    showStatus("Error: " + (data.error || "Unknown error"), "error");
+                } else if ((data.undone || data.redone || 0) > 0) {
+                    window.location.reload();
+                } else {
+                    showStatus(emptyMessage, "error");
+                }
+            })
+            .catch(error => {
+                console.error('Error:', error);
+                showStatus("Error restoring order", "error");
+            }));
+    }
+
+    const undoButton = document.getElementById('orderable-undo');
+    const redoButton = document.getElementById('orderable-redo');
+    if (undoButton) {
+        undoButton.addEventListener('click', () => replayHistory(undoButton, "Nothing to undo"));
+    }
+    if (redoButton) {
+        redoButton.addEventListener('click', () => replayHistory(redoButton, "Nothing to redo"));
+    }
+
+    // Reset the whole order from a model field, then reload to show it
+    const reseed = document.getElementById('orderable-reseed');
+    if (reseed) {
+        document.getElementById('orderable-reseed-button').addEventListener('click', function () {
+            const select = document.getElementById('orderable-reseed-ordering');
+            const label = select.options[select.selectedIndex].text;
+            if (!window.confirm(`Replace the current order with one sorted by ${label}?`)) return;
+
+            const formData = new URLSearchParams();
+            formData.append('ordering', select.value);
+            enqueue(() => postForm(reseed.dataset.url, formData)
+                .then(data => {
+                    if (data.success) {
+                        window.location.reload();
+                    } else {
+                        showStatus("Error: " + (data.error || "Unknown error"), "error");
+                    }
+                })
+                .catch(error => {
+                    console.error('Error:', error);
+                    showStatus("Error resetting order", "error");
+                }));
+        });
+    }
+
+    // Publish or discard an unpublished (draft) order, then reload
+    const draft = document.getElementById('orderable-draft');
+    function sendDraftAction(url, errorMessage) {
+        enqueue(() => postForm(url, new URLSearchParams())
+            .then(data => {
+                if (data.success) {
+                    window.location.reload();
+                } else {
+                    showStatus("Error: " + (data.error || "Unknown error"), "error");
+                }
+            })
+            .catch(error => {
+                console.error('Error:', error);
+                showStatus(errorMessage, "error");
+            }));
+    }
+    if (draft) {
+        const publishButton = document.getElementById('orderable-publish');
+        if (publishButton) {
+            publishButton.addEventListener('click', () => {
+                sendDraftAction(draft.dataset.publishUrl, "Error publishing order");
+            });
+        }
+        document.getElementById('orderable-discard').addEventListener('click', () => {
+            if (!window.confirm("Discard the unpublished order?")) return;
+            sendDraftAction(draft.dataset.discardUrl, "Error discarding order");
+        });
+    }
+
+    // Copy the order of this locale to every other locale
+    const locales = document.getElementById('orderable-locales');
+    if (locales && locales.dataset.syncUrl) {
+        document.getElementById('orderable-sync-locales').addEventListener('click', function () {
+            if (!window.confirm("Replace the order in all other locales with this one?")) return;
+            enqueue(() => postForm(locales.dataset.syncUrl, new URLSearchParams())
+                .then(data => {
+                    if (data.success) {
+                        showStatus(`Order copied to ${data.updated} translation${data.updated === 1 ? '' : 's'}`, "success");
+                    } else {
+                        showStatus("Error: " + (data.error || "Unknown error"), "error");
+                    }
+                })
+                .catch(error => {
+                    console.error('Error:', error);
+                    showStatus("Error copying order", "error");
+                }));
+        });
+    }
+
+    // Upload an exported ordering, then reload to show it
+    const transfer = document.getElementById('orderable-transfer');
+    if (transfer) {
+        document.getElementById('orderable-import-button').addEventListener('click', function () {
+            const file = document.getElementById('orderable-import-file').files[0];
+            if (!file) {
+                showStatus("Choose a file to import first", "error");
+                return;
+            }
+            if (!window.confirm(`Replace the current order with the one in ${file.name}?`)) return;
+
+            const formData = new FormData();
+            formData.append('file', file);
+            enqueue(() => postForm(transfer.dataset.url, formData)
+                .then(data => {
+                    if (data.success) {
+                        window.location.reload();
+                    } else {
+                        showStatus("Error: " + (data.error || "Unknown error"), "error");
+                    }
+                })
+                .catch(error => {
+                    console.error('Error:', error);
+                    showStatus("Error importing order", "error");
+                }));
+        });
+    }
+
+    // Live updates: reorders by other editors arrive as server-sent events
+    // and only the items that moved are re-inserted
+    const eventsUrl = orderableList.dataset.eventsUrl;
+    if (eventsUrl && window.EventSource) {
+        const isDraft = orderableList.dataset.draft === 'true';
+        const direction = orderableList.dataset.descending === 'true' ? -1 : 1;
+        const values = new Map(order.map((id) => [id, Number(itemsById.get(id).dataset.value)]));
+
+        function applyOrder(newOrder) {
+            newOrder = newOrder.filter((id) => itemsById.has(id));
+            const listed = new Set(newOrder);
+            newOrder = newOrder.concat(order.filter((id) => !listed.has(id)));
+            let moved = false;
+            newOrder.forEach((id, index) => {
+                const item = itemsById.get(id);
+                const current = orderableList.children[index];
+                if (item !== current) {
+                    orderableList.insertBefore(item, current);
+                    moved = true;
+                }
+            });
+            order.splice(0, order.length, ...newOrder);
+            if (moved) showStatus("Order updated by another editor", "success");
+        }
+
+        function applyValues() {
+            // Array sort is stable, so items with equal values keep their place
+            applyOrder(order.slice().sort((a, b) => direction * (values.get(a) - values.get(b))));
+        }
+
+        function handleEvent(event) {
+            let update;
+            if (event.reload) {
+                update = () => window.location.reload();
+            } else if (event.order) {
+                update = () => applyOrder(event.order);
+            } else if (event.changes) {
+                event.changes.forEach(([id, value]) => values.set(id, value));
+                // Unpublished orders are sent in full; live values don't apply
+                if (isDraft) return;
+                update = applyValues;
+            } else {
+                return;
+            }
+            if (pendingRequests) {
+                deferredUpdate = update;
+            } else {
+                update();
+            }
+        }
+
+        const params = new URLSearchParams(scopeParams);
+        params.set('after', orderableList.dataset.lastEventId || '0');
+        const source = new EventSource(`${eventsUrl}?${params}`);
+        source.onmessage = (e) => handleEvent(JSON.parse(e.data));
+    }
+
+    // Load the self-hosted SortableJS bundle (preloaded by the template)
+    const { Sortable } = await import(orderableList.dataset.sortableUrl);
+
     // Initialize Sortable with auto-save on end
-    const sortable = Sortable.create(orderableList, {
+    Sortable.create(orderableList, {
         handle: ".listing__item__drag-handle",
         animation: 150,
         ghostClass: "sortable-ghost",
         chosenClass: "sortable-chosen",
         dragClass: "sortable-drag",
-        onEnd: function () {
-            // Update button visibility after drag ends
-            updateButtonVisibility();
+        onEnd: function (evt) {
+            if (evt.oldIndex === evt.newIndex) return;
+            moveId(evt.oldIndex, evt.newIndex);
             // Auto-save when drag ends
             saveOrder();
         }
     });
-
-    // Initial button visibility setup
-    updateButtonVisibility();
 });
@@ -0,0 +1,7 @@
+/**!
+ * Sortable 1.15.7
+ * @author	RubaXa   <trash@rubaxa.org>
+ * @author	owenm    <owen23355@gmail.com>
+ * @license MIT
+ */
+function t(t,e,n){return(e=function(t){var e=function(t,e){if("object"!=typeof t||!t)return t;var n=t[Symbol.toPrimitive];if(void 0!==n){var o=n.call(t,e);if("object"!=typeof o)return o;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===e?String:Number)(t)}(t,"string");return"symbol"==typeof e?e:e+""}(e))in t?Object.defineProperty(t,e,{value:n,enumerable:!0,configurable:!0,writable:!0}):t[e]=n,t}function e(){return e=Object.assign?Object.assign.bind():function(t){for(var e=1;e<arguments.length;e++){var n=arguments[e];for(var o in n)({}).hasOwnProperty.call(n,o)&&(t[o]=n[o])}return t},e.apply(null,arguments)}function n(t,e){var n=Object.keys(t);if(Object.getOwnPropertySymbols){var o=Object.getOwnPropertySymbols(t);e&&(o=o.filter(function(e){return Object.getOwnPropertyDescriptor(t,e).enumerable})),n.push.apply(n,o)}return n}function o(e){for(var o=1;o<arguments.length;o++){var i=null!=arguments[o]?arguments[o]:{};o%2?n(Object(i),!0).forEach(function(n){t(e,n,i[n])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(i)):n(Object(i)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(i,t))})}return e}function i(t){return i="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},i(t)}function r(t){if("undefined"!=typeof window&&window.navigator)return!!navigator.userAgent.match(t)}var a=r(/(?:Trident.*rv[ :]?11\.|msie|iemobile|Windows Phone)/i),l=r(/Edge/i),s=r(/firefox/i),c=r(/safari/i)&&!r(/chrome/i)&&!r(/android/i),u=r(/iP(ad|od|hone)/i),d=r(/chrome/i)&&r(/android/i),h={capture:!1,passive:!1};function f(t,e,n){t.addEventListener(e,n,!a&&h)}function p(t,e,n){t.removeEventListener(e,n,!a&&h)}function g(t,e){if(e){if(">"===e[0]&&(e=e.substring(1)),t)try{if(t.matches)return t.matches(e);if(t.msMatchesSelector)return t.msMatchesSelector(e);if(t.webkitMatchesSelector)return t.webkitMatchesSelector(e)}catch(t){return!1}return!1}}function v(t){return t.host&&t!==document&&t.host.nodeType&&t.host!==t?t.host:t.parentNode}function m(t,e,n,o){if(t){n=n||document;do{if(null!=e&&(">"===e[0]?t.parentNode===n&&g(t,e):g(t,e))||o&&t===n)return t;if(t===n)break}while(t=v(t))}return null}var b,y=/\s+/g;function w(t,e,n){if(t&&e)if(t.classList)t.classList[n?"add":"remove"](e);else{var o=(" "+t.className+" ").replace(y," ").replace(" "+e+" "," ");t.className=(o+(n?" "+e:"")).replace(y," ")}}function E(t,e,n){var o=t&&t.style;if(o){if(void 0===n)return document.defaultView&&document.defaultView.getComputedStyle?n=document.defaultView.getComputedStyle(t,""):t.currentStyle&&(n=t.currentStyle),void 0===e?n:n[e];e in o||-1!==e.indexOf("webkit")||(e="-webkit-"+e),o[e]=n+("string"==typeof n?"":"px")}}function D(t,e){var n="";if("string"==typeof t)n=t;else do{var o=E(t,"transform");o&&"none"!==o&&(n=o+" "+n)}while(!e&&(t=t.parentNode));var i=window.DOMMatrix||window.WebKitCSSMatrix||window.CSSMatrix||window.MSCSSMatrix;return i&&new i(n)}function S(t,e,n){if(t){var o=t.getElementsByTagName(e),i=0,r=o.length;if(n)for(;i<r;i++)n(o[i],i);return o}return[]}function _(){var t=document.scrollingElement;return t||document.documentElement}function T(t,e,n,o,i){if(t.getBoundingClientRect||t===window){var r,l,s,c,u,d,h;if(t!==window&&t.parentNode&&t!==_()?(l=(r=t.getBoundingClientRect()).top,s=r.left,c=r.bottom,u=r.right,d=r.height,h=r.width):(l=0,s=0,c=window.innerHeight,u=window.innerWidth,d=window.innerHeight,h=window.innerWidth),(e||n)&&t!==window&&(i=i||t.parentNode,!a))do{if(i&&i.getBoundingClientRect&&("none"!==E(i,"transform")||n&&"static"!==E(i,"position"))){var f=i.getBoundingClientRect();l-=f.top+parseInt(E(i,"border-top-width")),s-=f.left+parseInt(E(i,"border-left-width")),c=l+r.height,u=s+r.width;break}}while(i=i.parentNode);if(o&&t!==window){var p=D(i||t),g=p&&p.a,v=p&&p.d;p&&(c=(l/=v)+(d/=v),u=(s/=g)+(h/=g))}return{top:l,left:s,bottom:c,right:u,width:h,height:d}}}function C(t,e,n){for(var o=N(t,!0),i=T(t)[e];o;){if(!(i>=T(o)[n]))return o;if(o===_())break;o=N(o,!1)}return!1}function x(t,e,n,o){for(var i=0,r=0,a=t.children;r<a.length;){if("none"!==a[r].style.display&&a[r]!==Xt.ghost&&(o||a[r]!==Xt.dragged)&&m(a[r],n.draggable,t,!1)){if(i===e)return a[r];i++}r++}return null}function O(t,e){for(var n=t.lastElementChild;n&&(n===Xt.ghost||"none"===E(n,"display")||e&&!g(n,e));)n=n.previousElementSibling;return n||null}function M(t,e){var n=0;if(!t||!t.parentNode)return-1;for(;t=t.previousElementSibling;)"TEMPLATE"===t.nodeName.toUpperCase()||t===Xt.clone||e&&!g(t,e)||n++;return n}function P(t){var e=0,n=0,o=_();if(t)do{var i=D(t),r=i.a,a=i.d;e+=t.scrollLeft*r,n+=t.scrollTop*a}while(t!==o&&(t=t.parentNode));return[e,n]}function N(t,e){if(!t||!t.getBoundingClientRect)return _();var n=t,o=!1;do{if(n.clientWidth<n.scrollWidth||n.clientHeight<n.scrollHeight){var i=E(n);if(n.clientWidth<n.scrollWidth&&("auto"==i.overflowX||"scroll"==i.overflowX)||n.clientHeight<n.scrollHeight&&("auto"==i.overflowY||"scroll"==i.overflowY)){if(!n.getBoundingClientRect||n===document.body)return _();if(o||e)return n;o=!0}}}while(n=n.parentNode);return _()}function A(t,e){return Math.round(t.top)===Math.round(e.top)&&Math.round(t.left)===Math.round(e.left)&&Math.round(t.height)===Math.round(e.height)&&Math.round(t.width)===Math.round(e.width)}function I(t,e){return function(){if(!b){var n=arguments;1===n.length?t.call(this,n[0]):t.apply(this,n),b=setTimeout(function(){b=void 0},e)}}}function k(t,e,n){t.scrollLeft+=e,t.scrollTop+=n}function X(t){var e=window.Polymer,n=window.jQuery||window.Zepto;return e&&e.dom?e.dom(t).cloneNode(!0):n?n(t).clone(!0)[0]:t.cloneNode(!0)}function Y(t,e,n){var o={};return Array.from(t.children).forEach(function(i){var r,a,l,s;if(m(i,e.draggable,t,!1)&&!i.animated&&i!==n){var c=T(i);o.left=Math.min(null!==(r=o.left)&&void 0!==r?r:1/0,c.left),o.top=Math.min(null!==(a=o.top)&&void 0!==a?a:1/0,c.top),o.right=Math.max(null!==(l=o.right)&&void 0!==l?l:-1/0,c.right),o.bottom=Math.max(null!==(s=o.bottom)&&void 0!==s?s:-1/0,c.bottom)}}),o.width=o.right-o.left,o.height=o.bottom-o.top,o.x=o.left,o.y=o.top,o}var R="Sortable"+(new Date).getTime();function B(){var t,e=[];return{captureAnimationState:function(){(e=[],this.options.animation)&&[].slice.call(this.el.children).forEach(function(t){if("none"!==E(t,"display")&&t!==Xt.ghost){e.push({target:t,rect:T(t)});var n=o({},e[e.length-1].rect);if(t.thisAnimationDuration){var i=D(t,!0);i&&(n.top-=i.f,n.left-=i.e)}t.fromRect=n}})},addAnimationState:function(t){e.push(t)},removeAnimationState:function(t){e.splice(function(t,e){for(var n in t)if(t.hasOwnProperty(n))for(var o in e)if(e.hasOwnProperty(o)&&e[o]===t[n][o])return Number(n);return-1}(e,{target:t}),1)},animateAll:function(n){var o=this;if(!this.options.animation)return clearTimeout(t),void("function"==typeof n&&n());var i=!1,r=0;e.forEach(function(t){var e=0,n=t.target,a=n.fromRect,l=T(n),s=n.prevFromRect,c=n.prevToRect,u=t.rect,d=D(n,!0);d&&(l.top-=d.f,l.left-=d.e),n.toRect=l,n.thisAnimationDuration&&A(s,l)&&!A(a,l)&&(u.top-l.top)/(u.left-l.left)===(a.top-l.top)/(a.left-l.left)&&(e=function(t,e,n,o){return Math.sqrt(Math.pow(e.top-t.top,2)+Math.pow(e.left-t.left,2))/Math.sqrt(Math.pow(e.top-n.top,2)+Math.pow(e.left-n.left,2))*o.animation}(u,s,c,o.options)),A(l,a)||(n.prevFromRect=a,n.prevToRect=l,e||(e=o.options.animation),o.animate(n,u,l,e)),e&&(i=!0,r=Math.max(r,e),clearTimeout(n.animationResetTimer),n.animationResetTimer=setTimeout(function(){n.animationTime=0,n.prevFromRect=null,n.fromRect=null,n.prevToRect=null,n.thisAnimationDuration=null},e),n.thisAnimationDuration=e)}),clearTimeout(t),i?t=setTimeout(function(){"function"==typeof n&&n()},r):"function"==typeof n&&n(),e=[]},animate:function(t,e,n,o){if(o){E(t,"transition",""),E(t,"transform","");var i=D(this.el),r=i&&i.a,a=i&&i.d,l=(e.left-n.left)/(r||1),s=(e.top-n.top)/(a||1);t.animatingX=!!l,t.animatingY=!!s,E(t,"transform","translate3d("+l+"px,"+s+"px,0)"),this.forRepaintDummy=function(t){return t.offsetWidth}(t),E(t,"transition","transform "+o+"ms"+(this.options.easing?" "+this.options.easing:"")),E(t,"transform","translate3d(0,0,0)"),"number"==typeof t.animated&&clearTimeout(t.animated),t.animated=setTimeout(function(){E(t,"transition",""),E(t,"transform",""),t.animated=!1,t.animatingX=!1,t.animatingY=!1},o)}}}}var F=[],j={initializeByDefault:!0},H={mount:function(t){for(var e in j)j.hasOwnProperty(e)&&!(e in t)&&(t[e]=j[e]);F.forEach(function(e){if(e.pluginName===t.pluginName)throw"Sortable: Cannot mount plugin ".concat(t.pluginName," more than once")}),F.push(t)},pluginEvent:function(t,e,n){var i=this;this.eventCanceled=!1,n.cancel=function(){i.eventCanceled=!0};var r=t+"Global";F.forEach(function(i){e[i.pluginName]&&(e[i.pluginName][r]&&e[i.pluginName][r](o({sortable:e},n)),e.options[i.pluginName]&&e[i.pluginName][t]&&e[i.pluginName][t](o({sortable:e},n)))})},initializePlugins:function(t,n,o,i){for(var r in F.forEach(function(i){var r=i.pluginName;if(t.options[r]||i.initializeByDefault){var a=new i(t,n,t.options);a.sortable=t,a.options=t.options,t[r]=a,e(o,a.defaults)}}),t.options)if(t.options.hasOwnProperty(r)){var a=this.modifyOption(t,r,t.options[r]);void 0!==a&&(t.options[r]=a)}},getEventProperties:function(t,n){var o={};return F.forEach(function(i){"function"==typeof i.eventProperties&&e(o,i.eventProperties.call(n[i.pluginName],t))}),o},modifyOption:function(t,e,n){var o;return F.forEach(function(i){t[i.pluginName]&&i.optionListeners&&"function"==typeof i.optionListeners[e]&&(o=i.optionListeners[e].call(t[i.pluginName],n))}),o}};var L=["evt"],W=function(t,e){var n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:{},i=n.evt,r=function(t,e){if(null==t)return{};var n,o,i=function(t,e){if(null==t)return{};var n={};for(var o in t)if({}.hasOwnProperty.call(t,o)){if(-1!==e.indexOf(o))continue;n[o]=t[o]}return n}(t,e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(t);for(o=0;o<r.length;o++)n=r[o],-1===e.indexOf(n)&&{}.propertyIsEnumerable.call(t,n)&&(i[n]=t[n])}return i}(n,L);H.pluginEvent.bind(Xt)(t,e,o({dragEl:G,parentEl:U,ghostEl:V,rootEl:q,nextEl:Z,lastDownEl:K,cloneEl:Q,cloneHidden:$,dragStarted:dt,putSortable:it,activeSortable:Xt.active,originalEvent:i,oldIndex:J,oldDraggableIndex:et,newIndex:tt,newDraggableIndex:nt,hideGhostForTarget:Nt,unhideGhostForTarget:At,cloneNowHidden:function(){$=!0},cloneNowShown:function(){$=!1},dispatchSortableEvent:function(t){z({sortable:e,name:t,originalEvent:i})}},r))};function z(t){!function(t){var e=t.sortable,n=t.rootEl,i=t.name,r=t.targetEl,s=t.cloneEl,c=t.toEl,u=t.fromEl,d=t.oldIndex,h=t.newIndex,f=t.oldDraggableIndex,p=t.newDraggableIndex,g=t.originalEvent,v=t.putSortable,m=t.extraEventProperties;if(e=e||n&&n[R]){var b,y=e.options,w="on"+i.charAt(0).toUpperCase()+i.substr(1);!window.CustomEvent||a||l?(b=document.createEvent("Event")).initEvent(i,!0,!0):b=new CustomEvent(i,{bubbles:!0,cancelable:!0}),b.to=c||n,b.from=u||n,b.item=r||n,b.clone=s,b.oldIndex=d,b.newIndex=h,b.oldDraggableIndex=f,b.newDraggableIndex=p,b.originalEvent=g,b.pullMode=v?v.lastPutMode:void 0;var E=o(o({},m),H.getEventProperties(i,e));for(var D in E)b[D]=E[D];n&&n.dispatchEvent(b),y[w]&&y[w].call(e,b)}}(o({putSortable:it,cloneEl:Q,targetEl:G,rootEl:q,oldIndex:J,oldDraggableIndex:et,newIndex:tt,newDraggableIndex:nt},t))}var G,U,V,q,Z,K,Q,$,J,tt,et,nt,ot,it,rt,at,lt,st,ct,ut,dt,ht,ft,pt,gt,vt=!1,mt=!1,bt=[],yt=!1,wt=!1,Et=[],Dt=!1,St=[],_t="undefined"!=typeof document,Tt=u,Ct=l||a?"cssFloat":"float",xt=_t&&!d&&!u&&"draggable"in document.createElement("div"),Ot=function(){if(_t){if(a)return!1;var t=document.createElement("x");return t.style.cssText="pointer-events:auto","auto"===t.style.pointerEvents}}(),Mt=function(t,e){var n=E(t),o=parseInt(n.width)-parseInt(n.paddingLeft)-parseInt(n.paddingRight)-parseInt(n.borderLeftWidth)-parseInt(n.borderRightWidth),i=x(t,0,e),r=x(t,1,e),a=i&&E(i),l=r&&E(r),s=a&&parseInt(a.marginLeft)+parseInt(a.marginRight)+T(i).width,c=l&&parseInt(l.marginLeft)+parseInt(l.marginRight)+T(r).width;if("flex"===n.display)return"column"===n.flexDirection||"column-reverse"===n.flexDirection?"vertical":"horizontal";if("grid"===n.display)return n.gridTemplateColumns.split(" ").length<=1?"vertical":"horizontal";if(i&&a.float&&"none"!==a.float){var u="left"===a.float?"left":"right";return!r||"both"!==l.clear&&l.clear!==u?"horizontal":"vertical"}return i&&("block"===a.display||"flex"===a.display||"table"===a.display||"grid"===a.display||s>=o&&"none"===n[Ct]||r&&"none"===n[Ct]&&s+c>o)?"vertical":"horizontal"},Pt=function(t){function e(t,n){return function(o,i,r,a){var l=o.options.group.name&&i.options.group.name&&o.options.group.name===i.options.group.name;if(null==t&&(n||l))return!0;if(null==t||!1===t)return!1;if(n&&"clone"===t)return t;if("function"==typeof t)return e(t(o,i,r,a),n)(o,i,r,a);var s=(n?o:i).options.group.name;return!0===t||"string"==typeof t&&t===s||t.join&&t.indexOf(s)>-1}}var n={},o=t.group;o&&"object"==i(o)||(o={name:o}),n.name=o.name,n.checkPull=e(o.pull,!0),n.checkPut=e(o.put),n.revertClone=o.revertClone,t.group=n},Nt=function(){!Ot&&V&&E(V,"display","none")},At=function(){!Ot&&V&&E(V,"display","")};_t&&!d&&document.addEventListener("click",function(t){if(mt)return t.preventDefault(),t.stopPropagation&&t.stopPropagation(),t.stopImmediatePropagation&&t.stopImmediatePropagation(),mt=!1,!1},!0);var It=function(t){if(G){t=t.touches?t.touches[0]:t;var e=(i=t.clientX,r=t.clientY,bt.some(function(t){var e=t[R].options.emptyInsertThreshold;if(e&&!O(t)){var n=T(t),o=i>=n.left-e&&i<=n.right+e,l=r>=n.top-e&&r<=n.bottom+e;return o&&l?a=t:void 0}}),a);if(e){var n={};for(var o in t)t.hasOwnProperty(o)&&(n[o]=t[o]);n.target=n.rootEl=e,n.preventDefault=void 0,n.stopPropagation=void 0,e[R]._onDragOver(n)}}var i,r,a},kt=function(t){G&&G.parentNode[R]._isOutsideThisEl(t.target)};function Xt(t,n){if(!t||!t.nodeType||1!==t.nodeType)throw"Sortable: `el` must be an HTMLElement, not ".concat({}.toString.call(t));this.el=t,this.options=n=e({},n),t[R]=this;var o={group:null,sort:!0,disabled:!1,store:null,handle:null,draggable:/^[uo]l$/i.test(t.nodeName)?">li":">*",swapThreshold:1,invertSwap:!1,invertedSwapThreshold:null,removeCloneOnHide:!0,direction:function(){return Mt(t,this.options)},ghostClass:"sortable-ghost",chosenClass:"sortable-chosen",dragClass:"sortable-drag",ignore:"a, img",filter:null,preventOnFilter:!0,animation:0,easing:null,setData:function(t,e){t.setData("Text",e.textContent)},dropBubble:!1,dragoverBubble:!1,dataIdAttr:"data-id",delay:0,delayOnTouchOnly:!1,touchStartThreshold:(Number.parseInt?Number:window).parseInt(window.devicePixelRatio,10)||1,forceFallback:!1,fallbackClass:"sortable-fallback",fallbackOnBody:!1,fallbackTolerance:0,fallbackOffset:{x:0,y:0},supportPointer:!1!==Xt.supportPointer&&"PointerEvent"in window&&(!c||u),emptyInsertThreshold:5};for(var i in H.initializePlugins(this,t,o),o)!(i in n)&&(n[i]=o[i]);for(var r in Pt(n),this)"_"===r.charAt(0)&&"function"==typeof this[r]&&(this[r]=this[r].bind(this));this.nativeDraggable=!n.forceFallback&&xt,this.nativeDraggable&&(this.options.touchStartThreshold=1),n.supportPointer?f(t,"pointerdown",this._onTapStart):(f(t,"mousedown",this._onTapStart),f(t,"touchstart",this._onTapStart)),this.nativeDraggable&&(f(t,"dragover",this),f(t,"dragenter",this)),bt.push(this.el),n.store&&n.store.get&&this.sort(n.store.get(this)||[]),e(this,B())}function Yt(t,e,n,o,i,r,s,c){var u,d,h=t[R],f=h.options.onMove;return!window.CustomEvent||a||l?(u=document.createEvent("Event")).initEvent("move",!0,!0):u=new CustomEvent("move",{bubbles:!0,cancelable:!0}),u.to=e,u.from=t,u.dragged=n,u.draggedRect=o,u.related=i||e,u.relatedRect=r||T(e),u.willInsertAfter=c,u.originalEvent=s,t.dispatchEvent(u),f&&(d=f.call(h,u,s)),d}function Rt(t){t.draggable=!1}function Bt(){Dt=!1}function Ft(t){for(var e=t.tagName+t.className+t.src+t.href+t.textContent,n=e.length,o=0;n--;)o+=e.charCodeAt(n);return o.toString(36)}function jt(t){return setTimeout(t,0)}function Ht(t){return clearTimeout(t)}Xt.prototype={constructor:Xt,_isOutsideThisEl:function(t){this.el.contains(t)||t===this.el||(ht=null)},_getDirection:function(t,e){return"function"==typeof this.options.direction?this.options.direction.call(this,t,e,G):this.options.direction},_onTapStart:function(t){if(t.cancelable){var e=this,n=this.el,o=this.options,i=o.preventOnFilter,r=t.type,a=t.touches&&t.touches[0]||t.pointerType&&"touch"===t.pointerType&&t,l=(a||t).target,s=t.target.shadowRoot&&(t.path&&t.path[0]||t.composedPath&&t.composedPath()[0])||l,u=o.filter;if(function(t){St.length=0;var e=t.getElementsByTagName("input"),n=e.length;for(;n--;){var o=e[n];o.checked&&St.push(o)}}(n),!G&&!(/mousedown|pointerdown/.test(r)&&0!==t.button||o.disabled)&&!s.isContentEditable&&(this.nativeDraggable||!c||!l||"SELECT"!==l.tagName.toUpperCase())&&!((l=m(l,o.draggable,n,!1))&&l.animated||K===l)){if(J=M(l),et=M(l,o.draggable),"function"==typeof u){if(u.call(this,t,l,this))return z({sortable:e,rootEl:s,name:"filter",targetEl:l,toEl:n,fromEl:n}),W("filter",e,{evt:t}),void(i&&t.preventDefault())}else if(u&&(u=u.split(",").some(function(o){if(o=m(s,o.trim(),n,!1))return z({sortable:e,rootEl:o,name:"filter",targetEl:l,fromEl:n,toEl:n}),W("filter",e,{evt:t}),!0})))return void(i&&t.preventDefault());o.handle&&!m(s,o.handle,n,!1)||this._prepareDragStart(t,a,l)}}},_prepareDragStart:function(t,e,n){var o,i=this,r=i.el,c=i.options,u=r.ownerDocument;if(n&&!G&&n.parentNode===r){var d=T(n);if(q=r,U=(G=n).parentNode,Z=G.nextSibling,K=n,ot=c.group,Xt.dragged=G,rt={target:G,clientX:(e||t).clientX,clientY:(e||t).clientY},ct=rt.clientX-d.left,ut=rt.clientY-d.top,this._lastX=(e||t).clientX,this._lastY=(e||t).clientY,G.style["will-change"]="all",o=function(){W("delayEnded",i,{evt:t}),Xt.eventCanceled?i._onDrop():(i._disableDelayedDragEvents(),!s&&i.nativeDraggable&&(G.draggable=!0),i._triggerDragStart(t,e),z({sortable:i,name:"choose",originalEvent:t}),w(G,c.chosenClass,!0))},c.ignore.split(",").forEach(function(t){S(G,t.trim(),Rt)}),f(u,"dragover",It),f(u,"mousemove",It),f(u,"touchmove",It),c.supportPointer?(f(u,"pointerup",i._onDrop),!this.nativeDraggable&&f(u,"pointercancel",i._onDrop)):(f(u,"mouseup",i._onDrop),f(u,"touchend",i._onDrop),f(u,"touchcancel",i._onDrop)),s&&this.nativeDraggable&&(this.options.touchStartThreshold=4,G.draggable=!0),W("delayStart",this,{evt:t}),!c.delay||c.delayOnTouchOnly&&!e||this.nativeDraggable&&(l||a))o();else{if(Xt.eventCanceled)return void this._onDrop();c.supportPointer?(f(u,"pointerup",i._disableDelayedDrag),f(u,"pointercancel",i._disableDelayedDrag)):(f(u,"mouseup",i._disableDelayedDrag),f(u,"touchend",i._disableDelayedDrag),f(u,"touchcancel",i._disableDelayedDrag)),f(u,"mousemove",i._delayedDragTouchMoveHandler),f(u,"touchmove",i._delayedDragTouchMoveHandler),c.supportPointer&&f(u,"pointermove",i._delayedDragTouchMoveHandler),i._dragStartTimer=setTimeout(o,c.delay)}}},_delayedDragTouchMoveHandler:function(t){var e=t.touches?t.touches[0]:t;Math.max(Math.abs(e.clientX-this._lastX),Math.abs(e.clientY-this._lastY))>=Math.floor(this.options.touchStartThreshold/(this.nativeDraggable&&window.devicePixelRatio||1))&&this._disableDelayedDrag()},_disableDelayedDrag:function(){G&&Rt(G),clearTimeout(this._dragStartTimer),this._disableDelayedDragEvents()},_disableDelayedDragEvents:function(){var t=this.el.ownerDocument;p(t,"mouseup",this._disableDelayedDrag),p(t,"touchend",this._disableDelayedDrag),p(t,"touchcancel",this._disableDelayedDrag),p(t,"pointerup",this._disableDelayedDrag),p(t,"pointercancel",this._disableDelayedDrag),p(t,"mousemove",this._delayedDragTouchMoveHandler),p(t,"touchmove",this._delayedDragTouchMoveHandler),p(t,"pointermove",this._delayedDragTouchMoveHandler)},_triggerDragStart:function(t,e){e=e||"touch"==t.pointerType&&t,!this.nativeDraggable||e?this.options.supportPointer?f(document,"pointermove",this._onTouchMove):f(document,e?"touchmove":"mousemove",this._onTouchMove):(f(G,"dragend",this),f(q,"dragstart",this._onDragStart));try{document.selection?jt(function(){document.selection.empty()}):window.getSelection().removeAllRanges()}catch(t){}},_dragStarted:function(t,e){if(vt=!1,q&&G){W("dragStarted",this,{evt:e}),this.nativeDraggable&&f(document,"dragover",kt);var n=this.options;!t&&w(G,n.dragClass,!1),w(G,n.ghostClass,!0),Xt.active=this,t&&this._appendGhost(),z({sortable:this,name:"start",originalEvent:e})}else this._nulling()},_emulateDragOver:function(){if(at){this._lastX=at.clientX,this._lastY=at.clientY,Nt();for(var t=document.elementFromPoint(at.clientX,at.clientY),e=t;t&&t.shadowRoot&&(t=t.shadowRoot.elementFromPoint(at.clientX,at.clientY))!==e;)e=t;if(G.parentNode[R]._isOutsideThisEl(t),e)do{if(e[R]){if(e[R]._onDragOver({clientX:at.clientX,clientY:at.clientY,target:t,rootEl:e})&&!this.options.dragoverBubble)break}t=e}while(e=v(e));At()}},_onTouchMove:function(t){if(rt){var e=this.options,n=e.fallbackTolerance,o=e.fallbackOffset,i=t.touches?t.touches[0]:t,r=V&&D(V,!0),a=V&&r&&r.a,l=V&&r&&r.d,s=Tt&&gt&&P(gt),c=(i.clientX-rt.clientX+o.x)/(a||1)+(s?s[0]-Et[0]:0)/(a||1),u=(i.clientY-rt.clientY+o.y)/(l||1)+(s?s[1]-Et[1]:0)/(l||1);if(!Xt.active&&!vt){if(n&&Math.max(Math.abs(i.clientX-this._lastX),Math.abs(i.clientY-this._lastY))<n)return;this._onDragStart(t,!0)}if(V){r?(r.e+=c-(lt||0),r.f+=u-(st||0)):r={a:1,b:0,c:0,d:1,e:c,f:u};var d="matrix(".concat(r.a,",").concat(r.b,",").concat(r.c,",").concat(r.d,",").concat(r.e,",").concat(r.f,")");E(V,"webkitTransform",d),E(V,"mozTransform",d),E(V,"msTransform",d),E(V,"transform",d),lt=c,st=u,at=i}t.cancelable&&t.preventDefault()}},_appendGhost:function(){if(!V){var t=this.options.fallbackOnBody?document.body:q,e=T(G,!0,Tt,!0,t),n=this.options;if(Tt){for(gt=t;"static"===E(gt,"position")&&"none"===E(gt,"transform")&&gt!==document;)gt=gt.parentNode;gt!==document.body&&gt!==document.documentElement?(gt===document&&(gt=_()),e.top+=gt.scrollTop,e.left+=gt.scrollLeft):gt=_(),Et=P(gt)}w(V=G.cloneNode(!0),n.ghostClass,!1),w(V,n.fallbackClass,!0),w(V,n.dragClass,!0),E(V,"transition",""),E(V,"transform",""),E(V,"box-sizing","border-box"),E(V,"margin",0),E(V,"top",e.top),E(V,"left",e.left),E(V,"width",e.width),E(V,"height",e.height),E(V,"opacity","0.8"),E(V,"position",Tt?"absolute":"fixed"),E(V,"zIndex","100000"),E(V,"pointerEvents","none"),Xt.ghost=V,t.appendChild(V),E(V,"transform-origin",ct/parseInt(V.style.width)*100+"% "+ut/parseInt(V.style.height)*100+"%")}},_onDragStart:function(t,e){var n=this,o=t.dataTransfer,i=n.options;W("dragStart",this,{evt:t}),Xt.eventCanceled?this._onDrop():(W("setupClone",this),Xt.eventCanceled||((Q=X(G)).removeAttribute("id"),Q.draggable=!1,Q.style["will-change"]="",this._hideClone(),w(Q,this.options.chosenClass,!1),Xt.clone=Q),n.cloneId=jt(function(){W("clone",n),Xt.eventCanceled||(n.options.removeCloneOnHide||q.insertBefore(Q,G),n._hideClone(),z({sortable:n,name:"clone"}))}),!e&&w(G,i.dragClass,!0),e?(mt=!0,n._loopId=setInterval(n._emulateDragOver,50)):(p(document,"mouseup",n._onDrop),p(document,"touchend",n._onDrop),p(document,"touchcancel",n._onDrop),o&&(o.effectAllowed="move",i.setData&&i.setData.call(n,o,G)),f(document,"drop",n),E(G,"transform","translateZ(0)")),vt=!0,n._dragStartId=jt(n._dragStarted.bind(n,e,t)),f(document,"selectstart",n),dt=!0,window.getSelection().removeAllRanges(),c&&E(document.body,"user-select","none"))},_onDragOver:function(t){var e,n,i,r,a=this.el,l=t.target,s=this.options,c=s.group,u=Xt.active,d=ot===c,h=s.sort,f=it||u,p=this,g=!1;if(!Dt){if(void 0!==t.preventDefault&&t.cancelable&&t.preventDefault(),l=m(l,s.draggable,a,!0),H("dragOver"),Xt.eventCanceled)return g;if(G.contains(t.target)||l.animated&&l.animatingX&&l.animatingY||p._ignoreWhileAnimating===l)return K(!1);if(mt=!1,u&&!s.disabled&&(d?h||(i=U!==q):it===this||(this.lastPutMode=ot.checkPull(this,u,G,t))&&c.checkPut(this,u,G,t))){if(r="vertical"===this._getDirection(t,l),e=T(G),H("dragOverValid"),Xt.eventCanceled)return g;if(i)return U=q,L(),this._hideClone(),H("revert"),Xt.eventCanceled||(Z?q.insertBefore(G,Z):q.appendChild(G)),K(!0);var v=O(a,s.draggable);if(!v||function(t,e,n){var o=T(O(n.el,n.options.draggable)),i=Y(n.el,n.options,V),r=10;return e?t.clientX>i.right+r||t.clientY>o.bottom&&t.clientX>o.left:t.clientY>i.bottom+r||t.clientX>o.right&&t.clientY>o.top}(t,r,this)&&!v.animated){if(v===G)return K(!1);if(v&&a===t.target&&(l=v),l&&(n=T(l)),!1!==Yt(q,a,G,e,l,n,t,!!l))return L(),v&&v.nextSibling?a.insertBefore(G,v.nextSibling):a.appendChild(G),U=a,Q(),K(!0)}else if(v&&function(t,e,n){var o=T(x(n.el,0,n.options,!0)),i=Y(n.el,n.options,V),r=10;return e?t.clientX<i.left-r||t.clientY<o.top&&t.clientX<o.right:t.clientY<i.top-r||t.clientY<o.bottom&&t.clientX<o.left}(t,r,this)){var b=x(a,0,s,!0);if(b===G)return K(!1);if(n=T(l=b),!1!==Yt(q,a,G,e,l,n,t,!1))return L(),a.insertBefore(G,b),U=a,Q(),K(!0)}else if(l.parentNode===a){n=T(l);var y,D,S,_=G.parentNode!==a,P=!function(t,e,n){var o=n?t.left:t.top,i=n?t.right:t.bottom,r=n?t.width:t.height,a=n?e.left:e.top,l=n?e.right:e.bottom,s=n?e.width:e.height;return o===a||i===l||o+r/2===a+s/2}(G.animated&&G.toRect||e,l.animated&&l.toRect||n,r),N=r?"top":"left",A=C(l,"top","top")||C(G,"top","top"),I=A?A.scrollTop:void 0;if(ht!==l&&(D=n[N],yt=!1,wt=!P&&s.invertSwap||_),y=function(t,e,n,o,i,r,a,l){var s=o?t.clientY:t.clientX,c=o?n.height:n.width,u=o?n.top:n.left,d=o?n.bottom:n.right,h=!1;if(!a)if(l&&pt<c*i){if(!yt&&(1===ft?s>u+c*r/2:s<d-c*r/2)&&(yt=!0),yt)h=!0;else if(1===ft?s<u+pt:s>d-pt)return-ft}else if(s>u+c*(1-i)/2&&s<d-c*(1-i)/2)return function(t){return M(G)<M(t)?1:-1}(e);if((h=h||a)&&(s<u+c*r/2||s>d-c*r/2))return s>u+c/2?1:-1;return 0}(t,l,n,r,P?1:s.swapThreshold,null==s.invertedSwapThreshold?s.swapThreshold:s.invertedSwapThreshold,wt,ht===l),0!==y){var X=M(G);do{X-=y,S=U.children[X]}while(S&&("none"===E(S,"display")||S===V))}if(0===y||S===l)return K(!1);ht=l,ft=y;var B=l.nextElementSibling,F=!1,j=Yt(q,a,G,e,l,n,t,F=1===y);if(!1!==j)return 1!==j&&-1!==j||(F=1===j),Dt=!0,setTimeout(Bt,30),L(),F&&!B?a.appendChild(G):l.parentNode.insertBefore(G,F?B:l),A&&k(A,0,I-A.scrollTop),U=G.parentNode,void 0===D||wt||(pt=Math.abs(D-T(l)[N])),Q(),K(!0)}if(a.contains(G))return K(!1)}return!1}function H(s,c){W(s,p,o({evt:t,isOwner:d,axis:r?"vertical":"horizontal",revert:i,dragRect:e,targetRect:n,canSort:h,fromSortable:f,target:l,completed:K,onMove:function(n,o){return Yt(q,a,G,e,n,T(n),t,o)},changed:Q},c))}function L(){H("dragOverAnimationCapture"),p.captureAnimationState(),p!==f&&f.captureAnimationState()}function K(e){return H("dragOverCompleted",{insertion:e}),e&&(d?u._hideClone():u._showClone(p),p!==f&&(w(G,it?it.options.ghostClass:u.options.ghostClass,!1),w(G,s.ghostClass,!0)),it!==p&&p!==Xt.active?it=p:p===Xt.active&&it&&(it=null),f===p&&(p._ignoreWhileAnimating=l),p.animateAll(function(){H("dragOverAnimationComplete"),p._ignoreWhileAnimating=null}),p!==f&&(f.animateAll(),f._ignoreWhileAnimating=null)),(l===G&&!G.animated||l===a&&!l.animated)&&(ht=null),s.dragoverBubble||t.rootEl||l===document||(G.parentNode[R]._isOutsideThisEl(t.target),!e&&It(t)),!s.dragoverBubble&&t.stopPropagation&&t.stopPropagation(),g=!0}function Q(){tt=M(G),nt=M(G,s.draggable),z({sortable:p,name:"change",toEl:a,newIndex:tt,newDraggableIndex:nt,originalEvent:t})}},_ignoreWhileAnimating:null,_offMoveEvents:function(){p(document,"mousemove",this._onTouchMove),p(document,"touchmove",this._onTouchMove),p(document,"pointermove",this._onTouchMove),p(document,"dragover",It),p(document,"mousemove",It),p(document,"touchmove",It)},_offUpEvents:function(){var t=this.el.ownerDocument;p(t,"mouseup",this._onDrop),p(t,"touchend",this._onDrop),p(t,"pointerup",this._onDrop),p(t,"pointercancel",this._onDrop),p(t,"touchcancel",this._onDrop),p(document,"selectstart",this)},_onDrop:function(t){var e=this.el,n=this.options;tt=M(G),nt=M(G,n.draggable),W("drop",this,{evt:t}),U=G&&G.parentNode,tt=M(G),nt=M(G,n.draggable),Xt.eventCanceled||(vt=!1,wt=!1,yt=!1,clearInterval(this._loopId),clearTimeout(this._dragStartTimer),Ht(this.cloneId),Ht(this._dragStartId),this.nativeDraggable&&(p(document,"drop",this),p(e,"dragstart",this._onDragStart)),this._offMoveEvents(),this._offUpEvents(),c&&E(document.body,"user-select",""),E(G,"transform",""),t&&(dt&&(t.cancelable&&t.preventDefault(),!n.dropBubble&&t.stopPropagation()),V&&V.parentNode&&V.parentNode.removeChild(V),(q===U||it&&"clone"!==it.lastPutMode)&&Q&&Q.parentNode&&Q.parentNode.removeChild(Q),G&&(this.nativeDraggable&&p(G,"dragend",this),Rt(G),G.style["will-change"]="",dt&&!vt&&w(G,it?it.options.ghostClass:this.options.ghostClass,!1),w(G,this.options.chosenClass,!1),z({sortable:this,name:"unchoose",toEl:U,newIndex:null,newDraggableIndex:null,originalEvent:t}),q!==U?(tt>=0&&(z({rootEl:U,name:"add",toEl:U,fromEl:q,originalEvent:t}),z({sortable:this,name:"remove",toEl:U,originalEvent:t}),z({rootEl:U,name:"sort",toEl:U,fromEl:q,originalEvent:t}),z({sortable:this,name:"sort",toEl:U,originalEvent:t})),it&&it.save()):tt!==J&&tt>=0&&(z({sortable:this,name:"update",toEl:U,originalEvent:t}),z({sortable:this,name:"sort",toEl:U,originalEvent:t})),Xt.active&&(null!=tt&&-1!==tt||(tt=J,nt=et),z({sortable:this,name:"end",toEl:U,originalEvent:t}),this.save())))),this._nulling()},_nulling:function(){W("nulling",this),q=G=U=V=Z=Q=K=$=rt=at=dt=tt=nt=J=et=ht=ft=it=ot=Xt.dragged=Xt.ghost=Xt.clone=Xt.active=null;var t=this.el;St.forEach(function(e){t.contains(e)&&(e.checked=!0)}),St.length=lt=st=0},handleEvent:function(t){switch(t.type){case"drop":case"dragend":this._onDrop(t);break;case"dragenter":case"dragover":G&&(this._onDragOver(t),function(t){t.dataTransfer&&(t.dataTransfer.dropEffect="move");t.cancelable&&t.preventDefault()}(t));break;case"selectstart":t.preventDefault()}},toArray:function(){for(var t,e=[],n=this.el.children,o=0,i=n.length,r=this.options;o<i;o++)m(t=n[o],r.draggable,this.el,!1)&&e.push(t.getAttribute(r.dataIdAttr)||Ft(t));return e},sort:function(t,e){var n={},o=this.el;this.toArray().forEach(function(t,e){var i=o.children[e];m(i,this.options.draggable,o,!1)&&(n[t]=i)},this),e&&this.captureAnimationState(),t.forEach(function(t){n[t]&&(o.removeChild(n[t]),o.appendChild(n[t]))}),e&&this.animateAll()},save:function(){var t=this.options.store;t&&t.set&&t.set(this)},closest:function(t,e){return m(t,e||this.options.draggable,this.el,!1)},option:function(t,e){var n=this.options;if(void 0===e)return n[t];var o=H.modifyOption(this,t,e);n[t]=void 0!==o?o:e,"group"===t&&Pt(n)},destroy:function(){W("destroy",this);var t=this.el;t[R]=null,p(t,"mousedown",this._onTapStart),p(t,"touchstart",this._onTapStart),p(t,"pointerdown",this._onTapStart),this.nativeDraggable&&(p(t,"dragover",this),p(t,"dragenter",this)),Array.prototype.forEach.call(t.querySelectorAll("[draggable]"),function(t){t.removeAttribute("draggable")}),this._onDrop(),this._disableDelayedDragEvents(),bt.splice(bt.indexOf(this.el),1),this.el=t=null},_hideClone:function(){if(!$){if(W("hideClone",this),Xt.eventCanceled)return;E(Q,"display","none"),this.options.removeCloneOnHide&&Q.parentNode&&Q.parentNode.removeChild(Q),$=!0}},_showClone:function(t){if("clone"===t.lastPutMode){if($){if(W("showClone",this),Xt.eventCanceled)return;G.parentNode!=q||this.options.group.revertClone?Z?q.insertBefore(Q,Z):q.appendChild(Q):q.insertBefore(Q,G),this.options.group.revertClone&&this.animate(G,Q),E(Q,"display",""),$=!1}}else this._hideClone()}},_t&&f(document,"touchmove",function(t){(Xt.active||vt)&&t.cancelable&&t.preventDefault()}),Xt.utils={on:f,off:p,css:E,find:S,is:function(t,e){return!!m(t,e,t,!1)},extend:function(t,e){if(t&&e)for(var n in e)e.hasOwnProperty(n)&&(t[n]=e[n]);return t},throttle:I,closest:m,toggleClass:w,clone:X,index:M,nextTick:jt,cancelNextTick:Ht,detectDirection:Mt,getChild:x,expando:R},Xt.get=function(t){return t[R]},Xt.mount=function(){for(var t=arguments.length,e=new Array(t),n=0;n<t;n++)e[n]=arguments[n];e[0].constructor===Array&&(e=e[0]),e.forEach(function(t){if(!t.prototype||!t.prototype.constructor)throw"Sortable: Mounted plugin must be a constructor function, not ".concat({}.toString.call(t));t.utils&&(Xt.utils=o(o({},Xt.utils),t.utils)),H.mount(t)})},Xt.create=function(t,e){return new Xt(t,e)},Xt.version="1.15.7";var Lt,Wt,zt,Gt,Ut,Vt,qt=[],Zt=!1;function Kt(){qt.forEach(function(t){clearInterval(t.pid)}),qt=[]}function Qt(){clearInterval(Vt)}var $t=I(function(t,e,n,o){if(e.scroll){var i,r=(t.touches?t.touches[0]:t).clientX,a=(t.touches?t.touches[0]:t).clientY,l=e.scrollSensitivity,s=e.scrollSpeed,c=_(),u=!1;Wt!==n&&(Wt=n,Kt(),Lt=e.scroll,i=e.scrollFn,!0===Lt&&(Lt=N(n,!0)));var d=0,h=Lt;do{var f=h,p=T(f),g=p.top,v=p.bottom,m=p.left,b=p.right,y=p.width,w=p.height,D=void 0,S=void 0,C=f.scrollWidth,x=f.scrollHeight,O=E(f),M=f.scrollLeft,P=f.scrollTop;f===c?(D=y<C&&("auto"===O.overflowX||"scroll"===O.overflowX||"visible"===O.overflowX),S=w<x&&("auto"===O.overflowY||"scroll"===O.overflowY||"visible"===O.overflowY)):(D=y<C&&("auto"===O.overflowX||"scroll"===O.overflowX),S=w<x&&("auto"===O.overflowY||"scroll"===O.overflowY));var A=D&&(Math.abs(b-r)<=l&&M+y<C)-(Math.abs(m-r)<=l&&!!M),I=S&&(Math.abs(v-a)<=l&&P+w<x)-(Math.abs(g-a)<=l&&!!P);if(!qt[d])for(var X=0;X<=d;X++)qt[X]||(qt[X]={});qt[d].vx==A&&qt[d].vy==I&&qt[d].el===f||(qt[d].el=f,qt[d].vx=A,qt[d].vy=I,clearInterval(qt[d].pid),0==A&&0==I||(u=!0,qt[d].pid=setInterval(function(){o&&0===this.layer&&Xt.active._onTouchMove(Ut);var e=qt[this.layer].vy?qt[this.layer].vy*s:0,n=qt[this.layer].vx?qt[this.layer].vx*s:0;"function"==typeof i&&"continue"!==i.call(Xt.dragged.parentNode[R],n,e,t,Ut,qt[this.layer].el)||k(qt[this.layer].el,n,e)}.bind({layer:d}),24))),d++}while(e.bubbleScroll&&h!==c&&(h=N(h,!1)));Zt=u}},30),Jt=function(t){var e=t.originalEvent,n=t.putSortable,o=t.dragEl,i=t.activeSortable,r=t.dispatchSortableEvent,a=t.hideGhostForTarget,l=t.unhideGhostForTarget;if(e){var s=n||i;a();var c=e.changedTouches&&e.changedTouches.length?e.changedTouches[0]:e,u=document.elementFromPoint(c.clientX,c.clientY);l(),s&&!s.el.contains(u)&&(r("spill"),this.onSpill({dragEl:o,putSortable:n}))}};function te(){}function ee(){}te.prototype={startIndex:null,dragStart:function(t){var e=t.oldDraggableIndex;this.startIndex=e},onSpill:function(t){var e=t.dragEl,n=t.putSortable;this.sortable.captureAnimationState(),n&&n.captureAnimationState();var o=x(this.sortable.el,this.startIndex,this.options);o?this.sortable.el.insertBefore(e,o):this.sortable.el.appendChild(e),this.sortable.animateAll(),n&&n.animateAll()},drop:Jt},e(te,{pluginName:"revertOnSpill"}),ee.prototype={onSpill:function(t){var e=t.dragEl,n=t.putSortable||this.sortable;n.captureAnimationState(),e.parentNode&&e.parentNode.removeChild(e),n.animateAll()},drop:Jt},e(ee,{pluginName:"removeOnSpill"}),Xt.mount(new function(){function t(){for(var t in this.defaults={scroll:!0,forceAutoScrollFallback:!1,scrollSensitivity:30,scrollSpeed:10,bubbleScroll:!0},this)"_"===t.charAt(0)&&"function"==typeof this[t]&&(this[t]=this[t].bind(this))}return t.prototype={dragStarted:function(t){var e=t.originalEvent;this.sortable.nativeDraggable?f(document,"dragover",this._handleAutoScroll):this.options.supportPointer?f(document,"pointermove",this._handleFallbackAutoScroll):e.touches?f(document,"touchmove",this._handleFallbackAutoScroll):f(document,"mousemove",this._handleFallbackAutoScroll)},dragOverCompleted:function(t){var e=t.originalEvent;this.options.dragOverBubble||e.rootEl||this._handleAutoScroll(e)},drop:function(){this.sortable.nativeDraggable?p(document,"dragover",this._handleAutoScroll):(p(document,"pointermove",this._handleFallbackAutoScroll),p(document,"touchmove",this._handleFallbackAutoScroll),p(document,"mousemove",this._handleFallbackAutoScroll)),Qt(),Kt(),clearTimeout(b),b=void 0},nulling:function(){Ut=Wt=Lt=Zt=Vt=zt=Gt=null,qt.length=0},_handleFallbackAutoScroll:function(t){this._handleAutoScroll(t,!0)},_handleAutoScroll:function(t,e){var n=this,o=(t.touches?t.touches[0]:t).clientX,i=(t.touches?t.touches[0]:t).clientY,r=document.elementFromPoint(o,i);if(Ut=t,e||this.options.forceAutoScrollFallback||l||a||c){$t(t,this.options,r,e);var s=N(r,!0);!Zt||Vt&&o===zt&&i===Gt||(Vt&&Qt(),Vt=setInterval(function(){var r=N(document.elementFromPoint(o,i),!0);r!==s&&(s=r,Kt()),$t(t,n.options,r,e)},10),zt=o,Gt=i)}else{if(!this.options.bubbleScroll||N(r,!0)===_())return void Kt();$t(t,this.options,N(r,!1),!1)}}},e(t,{pluginName:"scroll",initializeByDefault:!0})}),Xt.mount(ee,te);export{Xt as Sortable};
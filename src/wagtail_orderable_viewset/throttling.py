@@ -0,0 +1,53 @@
+"""
+Cache-based rate limits on the reorder endpoints, so that a runaway client,
+such as a script or page saving in a loop, cannot keep the database busy.
+
+Each user may send a number of requests per time window, counted in Django's
+cache. As with the order locks, use a cache shared between processes (e.g.
+Redis or Memcached) in production, otherwise each process counts separately.
+"""
+
+import math
+import time
+
+from django.core.cache import caches
+
+
+class OrderRateLimited(Exception):
+    """
+    Raised when a user has used up their requests for the current window.
+    """
+
+    def __init__(self, retry_after):
+        self.retry_after = retry_after
+        super().__init__(f"Retry after {retry_after} seconds")
+
+
+class OrderRateLimit:
+    """
+    Allows `limit` requests per `period` seconds for `key`, counted in fixed
+    windows starting at multiples of `period`.
+    """
+
+    def __init__(self, key, limit, period=60, cache_alias="default"):
+        self.key = key
+        self.limit = limit
+        self.period = period
+        self.cache = caches[cache_alias]
+
+    def hit(self):
+        """
+        Counts a request. Raises `OrderRateLimited` if it is over the limit.
+        """
+        now = time.time()
+        window = int(now // self.period)
+        key = f"{self.key}:{window}"
+        self.cache.add(key, 0, timeout=self.period + 1)
+        try:
+            count = self.cache.incr(key)
+        except ValueError:
+            # The counter expired between add() and incr()
+            self.cache.set(key, 1, timeout=self.period + 1)
+            count = 1
+        if count > self.limit:
+            raise OrderRateLimited(math.ceil((window + 1) * self.period - now))
@@ -0,0 +1,134 @@
+"""
+Import and export of an ordering, for syncing it between environments.
+
+An ordering is a list of `(key, sort_value)` rows, where the key identifies an
+object by its primary key or by another unique field (a natural key that is
+stable across databases, such as a slug). Two compact formats are supported:
+
+- CSV with a `key,<sort field>` header row
+- JSON Lines with one `{"key": ..., "<sort field>": ...}` object per line
+"""
+
+import csv
+import io
+import json
+
+from django.core.exceptions import ValidationError
+
+FORMATS = ("csv", "jsonl")
+
+# Rows fetched per round trip when exporting.
+EXPORT_CHUNK_SIZE = 2000
+
+
+def get_format(filename, default="csv"):
+    """
+    Guesses the format from a file name, e.g. "order.jsonl" is JSON Lines.
+    """
+    if filename and filename.lower().endswith((".jsonl", ".ndjson")):
+        return "jsonl"
+    if filename and filename.lower().endswith(".csv"):
+        return "csv"
+    return default
+
+
+def export_ordering(queryset, field_name, key_field="pk", format="csv"):
+    """
+    Yields the ordering of `queryset` as lines of text in the given format.
+    Rows are streamed from the database with `iterator()`.
+    """
+    rows = (
+        queryset.order_by(field_name, "pk")
+        .values_list(key_field, field_name)
+        .iterator(chunk_size=EXPORT_CHUNK_SIZE)
+    )
+    if format == "jsonl":
+        for key, value in rows:
+            yield json.dumps({"key": key, field_name: value}, default=str) + "\n"
+        return
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerow(["key", field_name])
+    for key, value in rows:
+        writer.writerow([key, value])
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    yield buffer.getvalue()
+
+
+def read_ordering(lines, field_name, format="csv", limits=None):
+    """
+    Parses lines produced by `export_ordering` into a `{key: sort_value}` dict,
+    with keys as strings. Values outside the `(min_value, max_value)` `limits`
+    of the column (see `get_order_value_limits`) are rejected. Raises
+    `ValidationError` listing every invalid row.
+    """
+    if format == "jsonl":
+        rows = (
+            (number, json.loads(line))
+            for number, line in enumerate(lines, start=1)
+            if line.strip()
+        )
+    else:
+        rows = enumerate(csv.DictReader(lines), start=2)
+
+    ordering = {}
+    errors = []
+    try:
+        for number, row in rows:
+            if not isinstance(row, dict):
+                errors.append(f"Line {number}: expected a JSON object")
+                continue
+            key, value = row.get("key"), row.get(field_name)
+            if key in (None, ""):
+                errors.append(f"Line {number}: missing key")
+                continue
+            try:
+                value = int(value)
+            except (TypeError, ValueError):
+                errors.append(f"Line {number}: {field_name} must be an integer")
+                continue
+            if limits is not None and not limits[0] <= value <= limits[1]:
+                errors.append(
+                    f"Line {number}: {field_name} must be between "
+                    f"{limits[0]} and {limits[1]}"
+                )
+                continue
+            if str(key) in ordering:
+                errors.append(f"Line {number}: duplicate key {key!r}")
+                continue
+            ordering[str(key)] = value
+    except (csv.Error, json.JSONDecodeError, UnicodeDecodeError) as e:
+        errors.append(f"Could not parse file: {e}")
+
+    if errors:
+        raise ValidationError(errors)
+    return ordering
+
+
+def get_import_changes(queryset, field_name, ordering, key_field="pk"):
+    """
+    Returns the `(pk, old_value, new_value)` changes needed to apply a
+    `{key: sort_value}` ordering to `queryset`, leaving out unchanged rows.
+
+    Raises `ValidationError` if a key does not match an object.
+    """
+    current = {
+        str(key): (pk, value)
+        for key, pk, value in queryset.order_by()
+        .values_list(key_field, "pk", field_name)
+        .iterator(chunk_size=EXPORT_CHUNK_SIZE)
+    }
+    unknown = [key for key in ordering if key not in current]
+    if unknown:
+        shown = ", ".join(repr(key) for key in unknown[:10])
+        raise ValidationError(f"{len(unknown)} unknown key(s) for {key_field}: {shown}")
+
+    changes = []
+    for key, new_value in ordering.items():
+        pk, old_value = current[key]
+        if old_value != new_value:
+            changes.append((pk, old_value, new_value))
+    return changes
@@ -0,0 +1,51 @@
+from django.urls import reverse
+from django.utils.functional import cached_property
+from django.utils.text import capfirst
+from wagtail.admin.views.generic import IndexView
+from wagtail.admin.widgets.button import HeaderButton
+from wagtail.snippets.views.snippets import IndexView as SnippetIndexView
+
+
+class OrderableIndexViewMixin:
+    """
+    Adds a Reorder button to the header of a listing view, rendered with the
+    other header buttons when the ordering holds at least two objects.
+    """
+
+    # The viewset providing the order view, passed in by the viewset.
+    order_viewset = None
+
+    @cached_property
+    def is_reorderable(self):
+        return (
+            self.order_viewset is not None
+            and self.order_viewset.is_reorderable()
+            and self.order_viewset.user_has_order_permission(self.request)
+        )
+
+    @cached_property
+    def header_buttons(self):
+        buttons = list(super().header_buttons)
+        if self.is_reorderable:
+            buttons.append(
+                HeaderButton(
+                    f"Reorder {capfirst(self.model._meta.verbose_name_plural)}",
+                    url=reverse(self.order_viewset.get_url_name("order")),
+                    icon_name="list-ol",
+                    priority=100,
+                )
+            )
+        return buttons
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context["is_reorderable"] = self.is_reorderable
+        return context
+
+
+class OrderableIndexView(OrderableIndexViewMixin, IndexView):
+    pass
+
+
+class OrderableSnippetIndexView(OrderableIndexViewMixin, SnippetIndexView):
+    pass
@@ -1,16 +1,154 @@
-from django.http import JsonResponse
+import codecs
+import json
+import os
+import time
+from collections import defaultdict
+from contextlib import ExitStack, nullcontext
+from functools import partial, wraps
+from operator import attrgetter, itemgetter
+
+from django.core.exceptions import (
+    FieldDoesNotExist,
+    ObjectDoesNotExist,
+    PermissionDenied,
+    ValidationError,
+)
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connections, transaction
+from django.http import Http404, JsonResponse, StreamingHttpResponse
 from django.views.decorators.csrf import csrf_protect
 from django.views.decorators.http import require_POST
 from django.utils.decorators import method_decorator
 from django.shortcuts import render
 from django.urls import path, reverse
 from django.utils.functional import cached_property
+from django.utils.http import urlencode
+from django.utils.text import capfirst
 
 from wagtail import VERSION as WAGTAIL_VERSION
 
+from wagtail.admin.admin_url_finder import AdminURLFinder
+from wagtail.admin.viewsets.base import ViewSet
 from wagtail.admin.viewsets.model import ModelViewSet
+from wagtail.models import Locale, Page, Revision, RevisionMixin, TranslatableMixin
+from wagtail.permission_policies import ModelPermissionPolicy
 from wagtail.snippets.views.snippets import SnippetViewSet
 
+from .audit import log_reorder, log_reorders, make_reorder_log_entry
+from .columns import OrderHandleColumn
+from .events import get_default_broker
+from .locks import OrderLock, OrderLocked
+from .models import OrderHistory, OrderRevision, compact_model_order, get_scope_key
+from .ordering import (
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_RANGE_THRESHOLD,
+    MOVES,
+    apply_order_values,
+    atomic_with_retry,
+    copy_order_from_locale,
+    get_combined_order_changes,
+    get_end_move_changes,
+    get_order_by,
+    get_order_changes,
+    get_order_key,
+    get_order_value_limits,
+    get_page_order_changes,
+    get_sort_key,
+    is_near_order_limits,
+    make_order_key,
+    merge_ordered,
+    move_block,
+    reseed_order,
+    splice_order,
+    start_order_compaction,
+)
+from .profiling import OrderProfiler
+from .rendering import OrderRowRenderer
+from .signals import send_post_reorder, send_pre_reorder
+from .throttling import OrderRateLimit, OrderRateLimited
+from .transfer import (
+    FORMATS,
+    export_ordering,
+    get_format,
+    get_import_changes,
+    read_ordering,
+)
+from .views import (
+    OrderableIndexView,
+    OrderableIndexViewMixin,
+    OrderableSnippetIndexView,
+)
+
+_registry = {}
+
+
+def get_order_viewset(model):
+    """
+    Returns the registered orderable viewset of `model`, or None.
+    """
+    return _registry.get(model)
+
+
+def limit_order_request(view_func):
+    """
+    Decorates a bulk reorder view so that `check_order_request` rejects
+    oversized and rate limited requests before the body is parsed. The CSRF
+    check reads `request.POST`, so it is run here, after the limits, rather
+    than by the middleware.
+    """
+
+    @wraps(view_func)
+    def wrapper(self, request, *args, **kwargs):
+        error = self.check_order_request(request)
+        if error is not None:
+            return error
+        return csrf_protect(partial(view_func, self))(request, *args, **kwargs)
+
+    wrapper.csrf_exempt = True
+    return wrapper
+
+
+def order_permission_required(action="change"):
+    """
+    Decorates an order view so that it is only run for users passing
+    `user_has_order_permission(request, action)`. Denied POST requests get a
+    403 JSON response; other requests go through Wagtail's permission denied
+    handling.
+    """
+
+    def decorator(view_func):
+        @wraps(view_func)
+        def wrapper(self, request, *args, **kwargs):
+            if not self.user_has_order_permission(request, action):
+                if request.method != "POST":
+                    raise PermissionDenied
+                return JsonResponse(
+                    {"error": "You do not have permission to reorder these items"},
+                    status=403,
+                )
+            return view_func(self, request, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+class OrderRow:
+    """
+    A row of the order view read with `values_list()`, standing in for a model
+    instance when labels are stored in an `order_label` field.
+    """
+
+    __slots__ = ("order_title", "order_value", "pk")
+
+    def __init__(self, pk, order_title, order_value=None):
+        self.pk = pk
+        self.order_title = order_title
+        self.order_value = order_value
+
+    def __str__(self):
+        return self.order_title
+
 
 class OrderableViewSetMixin:
     """
@@ -25,21 +163,152 @@ class OrderableViewSetMixin:
     # Name of the field used for ordering. Override in subclasses if needed.
     sort_order_field_name = "sort_order"
 
+    # List the objects from the highest sort value down, e.g. for "newest
+    # first" lists. None follows the model's `sort_order_descending`.
+    order_descending = None
+
+    # Where objects without a sort value are listed: "first", "last", or None
+    # for where the database puts them, which a plain index can serve.
+    order_nulls = None
+
     # Template used for the dedicated order view (drag-and-drop UI)
     order_template_name = "wagtail_orderable_viewset/order.html"
 
+    # Template of one row of the order view.
+    order_row_template_name = "wagtail_orderable_viewset/_order_row.html"
+
+    # Render the row template once per request and fill it for each object
+    # (see `rendering`). Disable if the row template has per-object logic
+    # beyond the object's key, title and sort value.
+    order_fast_rows = True
+
+    # Further models listed and ordered together with `model`, sharing its sort
+    # field. Objects are then identified by "<app_label>.<model_name>:<pk>" keys.
+    # Combined orderings are not recorded in the order history.
+    order_extra_models = ()
+
+    # Record each reorder so it can be undone/redone from the order view.
+    order_history_enabled = True
+
+    # Number of history entries kept per model; older entries are pruned.
+    order_history_limit = 100
+
+    # Save reorders as a single unpublished order revision, applied to the live
+    # sort values only when published. Intended for models using Wagtail's
+    # DraftStateMixin/RevisionMixin. Not supported for combined orderings.
+    order_drafts_enabled = False
+
+    # Order translatable models separately in each locale, picked with a
+    # `locale` parameter. Opt-in, since it changes the scope of existing
+    # orders; only applies to TranslatableMixin models.
+    order_per_locale = False
+
+    # Log each reorder operation as one entry in Wagtail's audit log.
+    order_audit_log_enabled = True
+
+    # Soft lock so that only one editor reorders a model at a time. Other
+    # editors' saves fail fast with a 409 response while the lock is held.
+    order_lock_enabled = True
+
+    # Seconds after which a lock expires if its write never completes.
+    order_lock_timeout = 30
+
+    # Maximum number of rows written by a single UPDATE statement.
+    order_write_batch_size = DEFAULT_BATCH_SIZE
+
+    # Attempts made for a reorder that fails with a deadlock or serialization error.
+    order_write_attempts = 3
+
+    # Orderings editors may reset the manual order from, e.g. ["name", "-pk"].
+    # A "-" prefix sorts descending. Empty disables the reseed action.
+    order_reseed_fields = ()
+
+    # Field identifying objects in imported and exported orderings. Use a unique
+    # field that is stable across databases (e.g. a slug) to sync environments.
+    order_transfer_key_field = "pk"
+
+    # Django cache alias used to store order locks and rate limit counters.
+    order_lock_cache_alias = "default"
+
+    # Per-user limit on the requests to the bulk reorder endpoints, as
+    # `(requests, seconds)`, e.g. `(30, 60)`. None disables it.
+    order_rate_limit = None
+
+    # Largest request body, in bytes, and number of object IDs accepted by the
+    # bulk reorder endpoints. None disables the check.
+    order_max_request_size = None
+    order_max_ids = None
+
+    # Push reorders to editors with the order view open, as server-sent events
+    # applied to their list in place.
+    order_live_updates_enabled = False
+
+    # Broker carrying live update events (see `events`). None uses a broker
+    # local to the process; use a `CacheOrderEventBroker` with several processes.
+    order_event_broker = None
+
+    # Seconds an event stream stays open before the browser reconnects. Each
+    # open stream occupies a worker thread under WSGI.
+    order_event_stream_timeout = 60
+
+    # Seconds between keep-alive comments on an idle event stream.
+    order_event_keepalive = 15
+
+    # Time the phases of the order and update views (see `profiling`), sent in
+    # a Server-Timing header, shown on the order page and in JSON responses.
+    order_profiling_enabled = False
+
+    # Directory to dump cProfile statistics of each profiled request to.
+    order_profile_dir = None
+
+    # Fraction of the sort field's integer range that writes may reach before
+    # the ordering is compacted (renumbered from 1 without changing it).
+    order_range_threshold = DEFAULT_RANGE_THRESHOLD
+
+    # Compact in a background thread once the write commits, in short chunked
+    # transactions. Otherwise compaction runs within the write's transaction.
+    order_compact_in_background = True
+
+    # Add a sort value column to the listing, with drag handles for reordering
+    # the rows of the current page when the listing is sorted by that column.
+    order_inline_listing = False
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        view_class = getattr(self, "index_view_class", None)
+        if view_class is not None and not issubclass(
+            view_class, OrderableIndexViewMixin
+        ):
+            # A custom listing view needs the mixin to accept `order_viewset`
+            # and render the Reorder button, so add it rather than drop both.
+            self.index_view_class = type(
+                view_class.__name__,
+                (OrderableIndexViewMixin, view_class),
+                {"__module__": view_class.__module__},
+            )
+
     def get_index_view_kwargs(self, **kwargs):
         """
         Inject extra context for the index (listing) view.
         Enables the reorder button and JS hooks in the template.
         Merges with any existing extra_context.
+
+        The viewset is passed to the view as `order_viewset`, which renders
+        the Reorder header button when `is_reorderable()` (see
+        `OrderableIndexViewMixin`). The check needs a query per request, so
+        it is made by the view rather than here, once per viewset.
         """
-        context_kwargs = super().get_index_view_kwargs(**kwargs)
+        context_kwargs = super().get_index_view_kwargs(order_viewset=self, **kwargs)
         extra_context = {
             "order_url_name": self.get_url_name("order"),
             "is_orderable": True,
             "sort_order_field": self.sort_order_field_name,
         }
+        if self.order_inline_listing:
+            extra_context["order_page_url_name"] = self.get_url_name("page_order")
+            context_kwargs["list_display"] = self.get_inline_list_display(
+                context_kwargs.get("list_display")
+            )
         # Merge/override any existing extra_context
         if "extra_context" in context_kwargs and isinstance(
             context_kwargs["extra_context"], dict
@@ -49,6 +318,32 @@ class OrderableViewSetMixin:
             context_kwargs["extra_context"] = extra_context
         return context_kwargs
 
+    def is_reorderable(self, scope=None):
+        """
+        Whether the ordering holds at least two objects, checked with a
+        `LIMIT 2` query per model rather than counting or loading them all.
+        """
+        found = 0
+        for queryset in self.get_order_querysets(scope):
+            found += len(queryset.order_by().values_list("pk", flat=True)[:2])
+            if found > 1:
+                return True
+        return False
+
+    def get_inline_list_display(self, list_display):
+        """
+        Returns `list_display` with an `OrderHandleColumn` added after the
+        title column, for `order_inline_listing`.
+        """
+        list_display = list(list_display or ["__str__"])
+        list_display.insert(
+            1,
+            OrderHandleColumn(
+                self.sort_order_field_name, descending=self.is_order_descending
+            ),
+        )
+        return list_display
+
     def get_urlpatterns(self):
         """
         Append ordering routes to the viewset's URL patterns.
@@ -56,12 +351,32 @@ class OrderableViewSetMixin:
         Adds:
         - /order/ for the order view (drag-and-drop UI)
         - /update-order/ for the AJAX endpoint to update order
+        - /move-order/ for batch moves of several selected objects
+        - /page-order/ for reordering one page of the listing (see
+          `order_inline_listing`)
+        - /reseed-order/ to reset the order from one of `order_reseed_fields`
+        - /export-order/ and /import-order/ to download and upload the ordering
+        - /publish-order/ and /discard-order/ for unpublished (draft) orders
+        - /sync-order/ to copy the order of one locale to all other locales
+        - /undo-order/ and /redo-order/ for the order history endpoints
+        - /order-events/ for the live update event stream
         """
         url_patterns = super().get_urlpatterns()
 
         ordering_patterns = [
             path("order/", self.order_view, name="order"),
             path("update-order/", self.update_order_view, name="update_order"),
+            path("move-order/", self.move_order_view, name="move_order"),
+            path("page-order/", self.page_order_view, name="page_order"),
+            path("reseed-order/", self.reseed_order_view, name="reseed_order"),
+            path("export-order/", self.export_order_view, name="export_order"),
+            path("import-order/", self.import_order_view, name="import_order"),
+            path("publish-order/", self.publish_order_view, name="publish_order"),
+            path("sync-order/", self.sync_order_view, name="sync_order"),
+            path("discard-order/", self.discard_order_view, name="discard_order"),
+            path("undo-order/", self.undo_order_view, name="undo_order"),
+            path("redo-order/", self.redo_order_view, name="redo_order"),
+            path("order-events/", self.order_events_view, name="order_events"),
         ]
 
         # Compatibility note:
@@ -90,77 +405,1425 @@ class OrderableViewSetMixin:
         view_name = getattr(self.index_view_class, "view_name", None)
         return view_name or "index"
 
-    def get_order_queryset(self):
+    @property
+    def is_order_descending(self):
+        if self.order_descending is not None:
+            return self.order_descending
+        return getattr(self.model, "sort_order_descending", False)
+
+    @property
+    def is_order_nulls_first(self):
+        if self.order_nulls is not None:
+            return self.order_nulls == "first"
+        # The database default: PostgreSQL and Oracle sort NULL as the largest
+        # value, SQLite and MySQL as the smallest.
+        features = connections[self.model._default_manager.db].features
+        return features.nulls_order_largest == self.is_order_descending
+
+    def get_order_by(self):
+        """
+        Returns the `order_by()` expression of the ordering, following
+        `is_order_descending` and `order_nulls`.
+        """
+        return get_order_by(
+            self.sort_order_field_name,
+            descending=self.is_order_descending,
+            nulls=self.order_nulls,
+        )
+
+    def get_order_queryset(self, scope=None):
         """
-        Returns a queryset of model instances ordered by the sort field.
+        Returns a queryset of model instances ordered by the sort field,
+        limited to `scope` (see `get_order_scope`).
         Used for displaying objects in the order view.
         """
-        return self.model.objects.order_by(self.sort_order_field_name)
+        queryset = self.model.objects.order_by(self.get_order_by())
+        if scope is None:
+            return queryset
+        return self.filter_order_queryset(queryset, scope)
+
+    def filter_order_queryset(self, queryset, scope):
+        """
+        Limits `queryset` to the objects ordered together within `scope`.
+        """
+        if isinstance(scope, Locale):
+            return queryset.filter(locale=scope)
+        return queryset
+
+    @property
+    def is_ordered_per_locale(self):
+        return bool(self.order_per_locale) and issubclass(self.model, TranslatableMixin)
+
+    def get_order_scope(self, request):
+        """
+        Returns the subset of objects ordered by `request`, or None for the
+        whole model. Each scope has an independent order; the scope is passed
+        on to the reorder signals and hooks.
+
+        When ordering per locale this is the `Locale` named by the `locale`
+        parameter, defaulting to the default locale.
+        """
+        if not self.is_ordered_per_locale:
+            return None
+        language_code = request.GET.get("locale") or request.POST.get("locale")
+        if not language_code:
+            return Locale.get_default()
+        try:
+            return Locale.objects.get_for_language(language_code)
+        except (Locale.DoesNotExist, LookupError):
+            raise Http404(f"No locale with language code {language_code!r}") from None
+
+    def get_order_scope_params(self, scope):
+        """
+        Returns the request parameters identifying `scope`, sent back with
+        every request made from the order view.
+        """
+        if isinstance(scope, Locale):
+            return {"locale": scope.language_code}
+        return {}
+
+    def get_order_querysets(self, scope=None):
+        """
+        Returns the ordered querysets of every model in the ordering,
+        starting with `get_order_queryset()`.
+        """
+        return [self.get_order_queryset(scope)] + [
+            model._default_manager.order_by(self.get_order_by())
+            for model in self.order_extra_models
+        ]
+
+    def get_order_draft(self, scope=None):
+        """
+        Returns the unpublished `OrderRevision` of the model, or None.
+        """
+        if not self.order_drafts_enabled or self.order_extra_models:
+            return None
+        return OrderRevision.objects.draft_for(self.model, scope)
+
+    def get_order_ids(self, scope=None):
+        """
+        Returns the IDs of all objects in their current order, as strings,
+        following the unpublished order if there is one.
+        For combined orderings these are the "<app_label>.<model_name>:<pk>" keys.
+        """
+        if not self.order_extra_models:
+            object_ids = [
+                str(pk)
+                for pk in self.get_order_queryset(scope).values_list("pk", flat=True)
+            ]
+            draft = self.get_order_draft(scope)
+            return draft.sort_ids(object_ids) if draft else object_ids
+        rows = [
+            (
+                (value, make_order_key(queryset.model, pk))
+                for pk, value in queryset.values_list("pk", self.sort_order_field_name)
+            )
+            for queryset in self.get_order_querysets(scope)
+        ]
+        merged = merge_ordered(
+            rows,
+            key=itemgetter(0),
+            descending=self.is_order_descending,
+            nulls_first=self.is_order_nulls_first,
+        )
+        return [key for value, key in merged]
+
+    @cached_property
+    def uses_order_labels(self):
+        """
+        Whether the order view reads stored labels (see `OrderLabelMixin`)
+        rather than loading every object. Not used for combined orderings.
+        """
+        if self.order_extra_models:
+            return False
+        try:
+            self.model._meta.get_field("order_label")
+        except FieldDoesNotExist:
+            return False
+        return True
+
+    def get_order_rows(self, scope=None):
+        """
+        Returns `OrderRow`s of the objects listed in the order view, read from
+        their `order_label` and sort fields without loading full instances.
+        """
+        rows = [
+            OrderRow(pk, label, value)
+            for pk, label, value in self.get_order_queryset(scope).values_list(
+                "pk", "order_label", self.sort_order_field_name
+            )
+        ]
+        draft = self.get_order_draft(scope)
+        return draft.sort(rows) if draft else rows
+
+    def get_order_objects(self, scope=None):
+        """
+        Returns the objects listed in the order view. For combined orderings
+        this is a single list merged by sort value, with each object's key in
+        its `order_key` attribute.
+        """
+        if not self.order_extra_models:
+            draft = self.get_order_draft(scope)
+            queryset = self.get_order_queryset(scope)
+            return draft.sort(queryset) if draft else queryset
+        querysets = self.get_order_querysets(scope)
+        for queryset in querysets:
+            for obj in queryset:
+                obj.order_key = get_order_key(obj)
+        return merge_ordered(
+            querysets,
+            key=attrgetter(self.sort_order_field_name),
+            descending=self.is_order_descending,
+            nulls_first=self.is_order_nulls_first,
+        )
+
+    def on_register(self):
+        """
+        Precompute the static order view metadata once the viewset is registered,
+        so that per-request work is limited to fetching the objects.
+        """
+        super().on_register()
+        self.order_metadata = self.get_order_metadata()
+        _registry[self.model] = self
+
+    @cached_property
+    def order_metadata(self):
+        # Fallback for viewsets whose URLs are included without being registered.
+        return self.get_order_metadata()
+
+    def get_order_metadata(self):
+        """
+        Returns the static, per-model context for the order view template.
+        Computed once per viewset instance and shared by every request.
+        """
+        opts = self.model._meta
+        return {
+            "model_name": opts.verbose_name_plural,
+            "model_verbose_name": opts.verbose_name,
+            "model_verbose_name_plural": opts.verbose_name_plural,
+            "model_opts": opts,
+            "sort_field": self.sort_order_field_name,
+            "reseed_choices": self.get_reseed_choices(),
+        }
 
-    def get_order_context_data(self, objects):
+    def get_reseed_choices(self):
+        """
+        Returns `(ordering, label)` pairs for the allowed reseed orderings.
+        """
+        choices = []
+        for ordering in self.order_reseed_fields:
+            field = self.model._meta.get_field(ordering.lstrip("-"))
+            label = capfirst(field.verbose_name)
+            if ordering.startswith("-"):
+                label = f"{label} (descending)"
+            choices.append((ordering, label))
+        return choices
+
+    @cached_property
+    def order_index_url(self):
+        """
+        Resolved URL of the index (listing) view.
+        Reversed lazily on first use, as the admin URLconf is still being built
+        while viewsets are registered, then memoized for the viewset's lifetime.
+        """
+        return reverse(self.get_url_name(self.get_index_url_name()))
+
+    @cached_property
+    def order_update_url(self):
+        """
+        Resolved URL of the AJAX update endpoint, memoized like `order_index_url`.
+        """
+        return reverse(self.get_url_name("update_order"))
+
+    @cached_property
+    def order_move_url(self):
+        return reverse(self.get_url_name("move_order"))
+
+    @cached_property
+    def order_reseed_url(self):
+        return reverse(self.get_url_name("reseed_order"))
+
+    @cached_property
+    def order_export_url(self):
+        return reverse(self.get_url_name("export_order"))
+
+    @cached_property
+    def order_import_url(self):
+        return reverse(self.get_url_name("import_order"))
+
+    @cached_property
+    def order_publish_url(self):
+        return reverse(self.get_url_name("publish_order"))
+
+    @cached_property
+    def order_discard_url(self):
+        return reverse(self.get_url_name("discard_order"))
+
+    @cached_property
+    def order_sync_url(self):
+        return reverse(self.get_url_name("sync_order"))
+
+    @cached_property
+    def order_undo_url(self):
+        return reverse(self.get_url_name("undo_order"))
+
+    @cached_property
+    def order_redo_url(self):
+        return reverse(self.get_url_name("redo_order"))
+
+    @cached_property
+    def order_events_url(self):
+        return reverse(self.get_url_name("order_events"))
+
+    def get_order_context_data(self, objects, scope=None):
         """
         Returns context data for the order view template.
 
         Includes:
         - objects: ordered queryset
-        - model metadata and verbose names
+        - model metadata and verbose names (see `order_metadata`)
         - URLs for index and update endpoints
+        - the locale being ordered and the other locales, when ordering per locale
         """
-        return {
+        context = {
+            **self.order_metadata,
             "objects": objects,
             "object_list": objects,
-            "model_name": self.model._meta.verbose_name_plural,
-            "model_verbose_name": self.model._meta.verbose_name,
-            "model_verbose_name_plural": self.model._meta.verbose_name_plural,
-            "model_opts": self.model._meta,
-            "sort_field": self.sort_order_field_name,
-            "index_url": reverse(self.get_url_name(self.get_index_url_name())),
-            "update_url": reverse(self.get_url_name("update_order")),
+            "index_url": self.order_index_url,
+            "update_url": self.order_update_url,
+            "move_url": self.order_move_url,
+            "reseed_url": self.order_reseed_url if self.order_reseed_fields else None,
+            "export_url": self.order_export_url,
+            "import_url": self.order_import_url,
+            "publish_url": self.order_publish_url
+            if self.order_drafts_enabled
+            else None,
+            "discard_url": self.order_discard_url
+            if self.order_drafts_enabled
+            else None,
+            "undo_url": self.order_undo_url if self.is_order_undoable() else None,
+            "redo_url": self.order_redo_url if self.is_order_undoable() else None,
+            "order_scope_query": urlencode(self.get_order_scope_params(scope)),
+            "order_descending": self.is_order_descending,
+            "events_url": self.order_events_url
+            if self.order_live_updates_enabled
+            else None,
+        }
+        if isinstance(scope, Locale):
+            context["order_locale"] = scope
+            context["order_locales"] = Locale.objects.all()
+            if not self.order_drafts_enabled:
+                context["sync_url"] = self.order_sync_url
+        return context
+
+    @cached_property
+    def order_permission_policy(self):
+        """
+        The permission policy of the ordered model: the viewset's own where
+        it has one, otherwise the model's standard permissions.
+        """
+        return getattr(self, "permission_policy", None) or ModelPermissionPolicy(
+            self.model
+        )
+
+    def user_has_order_permission(self, request, action="change"):
+        """
+        Whether the requesting user may perform `action` on the ordering (see
+        `order_permission_required`): "change" to view and reorder, or to
+        save and discard a draft, and "publish" to publish a draft.
+        Combined orderings also need the permission on each of
+        `order_extra_models`.
+        """
+        policies = [self.order_permission_policy] + [
+            ModelPermissionPolicy(model) for model in self.order_extra_models
+        ]
+        return all(
+            policy.user_has_permission(request.user, action) for policy in policies
+        )
+
+    def get_order_lock_key(self, scope=None):
+        """
+        Returns the cache key of the lock guarding the ordering of `scope`, so
+        that orderings of other locales or parents can be saved meanwhile.
+        """
+        key = f"wagtail_orderable_viewset:lock:{self.model._meta.label_lower}"
+        scope_key = get_scope_key(scope)
+        return f"{key}:{scope_key}" if scope_key else key
+
+    def get_order_lock(self, user, scope=None):
+        """
+        Returns a context manager that holds the order lock of `scope` for
+        `user` and raises `OrderLocked` if another user holds it.
+        """
+        if not self.order_lock_enabled:
+            return nullcontext()
+        return OrderLock(
+            self.get_order_lock_key(scope),
+            user,
+            timeout=self.order_lock_timeout,
+            cache_alias=self.order_lock_cache_alias,
+        )
+
+    def get_order_locked_response(self, exc):
+        name = exc.holder_name
+        return JsonResponse(
+            {
+                "error": f"{name} is currently reordering these items. "
+                "Please try again in a moment.",
+                "locked_by": name,
+            },
+            status=409,
+        )
+
+    def get_order_rate_limit(self, request):
+        """
+        Returns the `OrderRateLimit` of the requesting user, or None if
+        `order_rate_limit` is not set.
+        """
+        if not self.order_rate_limit:
+            return None
+        limit, period = self.order_rate_limit
+        label = self.model._meta.label_lower
+        return OrderRateLimit(
+            f"wagtail_orderable_viewset:rate:{label}:{request.user.pk}",
+            limit,
+            period,
+            cache_alias=self.order_lock_cache_alias,
+        )
+
+    def check_order_request(self, request):
+        """
+        Returns an error response if a bulk reorder request is larger than
+        `order_max_request_size` or over the user's `order_rate_limit`,
+        otherwise None. Called before the request body is parsed (see
+        `limit_order_request`).
+        """
+        max_size = self.order_max_request_size
+        if max_size is not None:
+            try:
+                size = int(request.META.get("CONTENT_LENGTH") or 0)
+            except ValueError:
+                size = 0
+            if size > max_size:
+                return JsonResponse(
+                    {"error": f"The request is larger than {max_size} bytes"},
+                    status=413,
+                )
+
+        rate_limit = self.get_order_rate_limit(request)
+        if rate_limit is not None:
+            try:
+                rate_limit.hit()
+            except OrderRateLimited as e:
+                response = JsonResponse(
+                    {
+                        "error": "Too many reorder requests. "
+                        f"Please try again in {e.retry_after} seconds.",
+                        "retry_after": e.retry_after,
+                    },
+                    status=429,
+                )
+                response["Retry-After"] = str(e.retry_after)
+                return response
+        return None
+
+    def check_order_ids(self, object_ids):
+        """
+        Returns an error response if more than `order_max_ids` objects are
+        submitted, otherwise None. Called before any query is made.
+        """
+        max_ids = self.order_max_ids
+        if max_ids is not None and len(object_ids) > max_ids:
+            return JsonResponse(
+                {"error": f"At most {max_ids} objects can be reordered at once"},
+                status=413,
+            )
+        return None
+
+    def clean_order_ids(self, object_ids):
+        """
+        Returns the submitted `object_ids` as the strings listed by
+        `get_order_ids`, checking each with the primary key field's
+        `to_python()`. For combined orderings these are the
+        "<app_label>.<model_name>:<pk>" keys of the ordered models.
+        Raises `ValidationError` for an ID that is not valid.
+        """
+        models = {
+            model._meta.label_lower: model
+            for model in (self.model, *self.order_extra_models)
         }
+        cleaned = []
+        for key in object_ids:
+            model, object_id = self.model, key
+            if self.order_extra_models:
+                label, _, object_id = key.rpartition(":")
+                model = models.get(label)
+            try:
+                pk = model._meta.pk.to_python(object_id) if model else None
+            except ValidationError:
+                pk = None
+            if pk is None:
+                raise ValidationError(f"Invalid object ID: {object_id!r}")
+            if self.order_extra_models:
+                cleaned.append(make_order_key(model, pk))
+            else:
+                cleaned.append(str(pk))
+        return cleaned
+
+    def get_order_saved_response(self, **data):
+        # Reorders saved as an unpublished order are flagged for the client.
+        if self.order_drafts_enabled and not self.order_extra_models:
+            data["draft"] = True
+        return JsonResponse({"success": True, **data})
 
+    @order_permission_required("change")
     def order_view(self, request):
         """
         Renders the order view template with the ordered objects and context.
         Used for drag-and-drop reordering in the admin UI.
+
+        With `order_fast_rows`, the rows are rendered by an `OrderRowRenderer`
+        rather than once each by the template.
+
+        With `order_profiling_enabled`, the time spent fetching the objects,
+        computing their labels and rendering the template is measured.
         """
-        objects = self.get_order_queryset()
-        context = self.get_order_context_data(objects)
-        return render(request, self.order_template_name, context)
+        profiler = self.get_order_profiler("order")
+        with profiler:
+            scope = self.get_order_scope(request)
+            if self.order_live_updates_enabled:
+                # Read before the objects are fetched, so that no event is missed
+                last_event_id = self.get_order_event_broker().last_event_id(
+                    self.get_order_event_channel(scope)
+                )
+            with profiler.phase("query"):
+                if self.uses_order_labels:
+                    objects = self.get_order_rows(scope)
+                else:
+                    objects = list(self.get_order_objects(scope))
+            with profiler.phase("labels"):
+                self.set_order_titles(objects)
+
+            context = self.get_order_context_data(objects, scope)
+            context["order_draft"] = self.get_order_draft(scope)
+            context["can_publish_order"] = bool(
+                context["publish_url"]
+            ) and self.user_has_order_permission(request, "publish")
+            if self.order_live_updates_enabled:
+                context["order_last_event_id"] = last_event_id
+                for obj in objects:
+                    if not isinstance(obj, OrderRow):
+                        obj.order_value = getattr(obj, self.sort_order_field_name)
+            if self.order_lock_enabled:
+                holder = self.get_order_lock(request.user, scope).other_holder()
+                if holder:
+                    context["order_lock_holder"] = OrderLocked(holder).holder_name
+            context["order_row_template_name"] = self.order_row_template_name
+            if profiler.enabled:
+                # Rendering is still to come; its time is in the header only
+                context["order_timings"] = dict(profiler.timings)
+            with profiler.phase("render"):
+                if self.order_fast_rows:
+                    renderer = OrderRowRenderer(
+                        self.order_row_template_name, context, request=request
+                    )
+                    context["order_rows_html"] = renderer.render(objects)
+                response = render(request, self.order_template_name, context)
+        return profiler.add_to_response(response)
+
+    def get_order_label(self, obj):
+        """
+        Returns the label of `obj` in the order view.
+        """
+        if hasattr(obj, "get_order_label"):
+            return obj.get_order_label()
+        return str(obj)
+
+    def set_order_titles(self, objects):
+        """
+        Sets the `order_title` of each object listed in the order view. Rows
+        read from a blank `order_label`, e.g. for objects saved before the
+        field was added, have their objects loaded in one query instead.
+        """
+        untitled = {}
+        for obj in objects:
+            if not isinstance(obj, OrderRow):
+                obj.order_title = self.get_order_label(obj)
+            elif not obj.order_title:
+                untitled[obj.pk] = obj
+        if untitled:
+            for instance in self.model._default_manager.filter(pk__in=list(untitled)):
+                untitled[instance.pk].order_title = self.get_order_label(instance)
+
+    def get_order_profiler(self, view_name):
+        """
+        Returns an `OrderProfiler` for a request to `view_name`, dumping
+        cProfile statistics to `order_profile_dir` if it is set.
+        """
+        path = None
+        if self.order_profile_dir:
+            path = os.path.join(
+                self.order_profile_dir,
+                f"{self.model._meta.label_lower}-{view_name}-{time.time_ns()}.prof",
+            )
+        return OrderProfiler(self.order_profiling_enabled, profile_path=path)
 
-    @method_decorator(csrf_protect)
     @method_decorator(require_POST)
+    @limit_order_request
+    @order_permission_required("change")
     def update_order_view(self, request):
         """
         AJAX endpoint to update the order of objects in bulk.
         Expects a POST request with a list of object IDs in the desired order.
-        Updates the sort field for each object in a transaction.
-        Returns a success response or error if an exception occurs.
+        Updates the sort field of the objects whose position changed in a
+        transaction, and records the change in the order history.
+        Returns a success response, or a 400 response for invalid IDs.
+
+        Oversized and rate limited requests are rejected before the body is
+        parsed (see `limit_order_request`).
         """
+        object_ids = request.POST.getlist("object_ids[]") or request.POST.getlist(
+            "object_ids"
+        )
+        error = self.check_order_ids(object_ids)
+        if error is not None:
+            return error
+        if not object_ids:
+            return JsonResponse({"error": "object_ids is required"}, status=400)
         try:
-            # Bulk reorder support: handle array of object IDs from the client
-            object_ids = request.POST.getlist("object_ids[]") or request.POST.getlist(
-                "object_ids"
-            )
+            object_ids = self.clean_order_ids(object_ids)
+        except ValidationError as e:
+            return JsonResponse({"error": " ".join(e.messages)}, status=400)
 
-            if object_ids:
+        scope = self.get_order_scope(request)
+        profiler = self.get_order_profiler("update_order")
+        try:
+            with profiler, self.get_order_lock(request.user, scope):
                 # Update order based on the submitted sequence
-                from django.db import transaction
-
-                with transaction.atomic():
-                    for index, pk in enumerate(object_ids, start=1):
-                        self.model.objects.filter(pk=pk).update(
-                            **{self.sort_order_field_name: index}
+                with profiler.phase("write"):
+                    self.run_order_write(
+                        lambda: self.save_order(
+                            object_ids, user=request.user, scope=scope
                         )
-                return JsonResponse({"success": True, "updated": len(object_ids)})
+                    )
+                data = {"updated": len(object_ids)}
+                if profiler.enabled:
+                    data["timings"] = profiler.timings
+                return profiler.add_to_response(self.get_order_saved_response(**data))
 
-        except Exception as e:
-            return JsonResponse({"error": f"Server error: {e}"}, status=500)
+        except OrderLocked as e:
+            return self.get_order_locked_response(e)
+
+    @method_decorator(require_POST)
+    @limit_order_request
+    @order_permission_required("change")
+    def move_order_view(self, request):
+        """
+        AJAX endpoint to move several objects with one request.
+        Expects the selected `object_ids`, a `move` of "first", "last", "to" or
+        "by", and an integer `value` for "to" (1-based target position) and
+        "by" (number of places, negative to move up). The selection is moved as
+        one block and the resulting order applied in a single transaction.
+        """
+        object_ids = request.POST.getlist("object_ids[]") or request.POST.getlist(
+            "object_ids"
+        )
+        error = self.check_order_ids(object_ids)
+        if error is not None:
+            return error
+        try:
+            object_ids = self.clean_order_ids(object_ids)
+        except ValidationError as e:
+            return JsonResponse({"error": " ".join(e.messages)}, status=400)
+        move = request.POST.get("move")
+        if move not in MOVES:
+            return JsonResponse(
+                {"error": f"move must be one of: {', '.join(MOVES)}"}, status=400
+            )
+        value = None
+        if move in ("to", "by"):
+            try:
+                value = int(request.POST.get("value", ""))
+            except ValueError:
+                return JsonResponse({"error": "value must be an integer"}, status=400)
+
+        scope = self.get_order_scope(request)
+        try:
+            with self.get_order_lock(request.user, scope):
+                self.run_order_write(
+                    lambda: self.apply_move(
+                        object_ids, move, value, user=request.user, scope=scope
+                    )
+                )
+        except OrderLocked as e:
+            return self.get_order_locked_response(e)
+
+        return self.get_order_saved_response(moved=len(object_ids))
+
+    @method_decorator(require_POST)
+    @limit_order_request
+    @order_permission_required("change")
+    def page_order_view(self, request):
+        """
+        AJAX endpoint for drag-and-drop on a page of the listing.
+        Expects the `object_ids` of every row on the page, in their new order,
+        and reconciles them with the global order (see `apply_page_order`).
+        """
+        object_ids = request.POST.getlist("object_ids[]") or request.POST.getlist(
+            "object_ids"
+        )
+        error = self.check_order_ids(object_ids)
+        if error is not None:
+            return error
+        if not object_ids:
+            return JsonResponse({"error": "object_ids is required"}, status=400)
+        if self.order_extra_models:
+            return JsonResponse(
+                {"error": "Combined orderings cannot be reordered from the listing"},
+                status=400,
+            )
+        try:
+            object_ids = self.clean_order_ids(object_ids)
+        except ValidationError as e:
+            return JsonResponse({"error": " ".join(e.messages)}, status=400)
+
+        scope = self.get_order_scope(request)
+        try:
+            with self.get_order_lock(request.user, scope):
+                self.run_order_write(
+                    lambda: self.apply_page_order(
+                        object_ids, user=request.user, scope=scope
+                    )
+                )
+        except OrderLocked as e:
+            return self.get_order_locked_response(e)
+
+        return self.get_order_saved_response(updated=len(object_ids))
+
+    @method_decorator(csrf_protect)
+    @method_decorator(require_POST)
+    @order_permission_required("change")
+    def reseed_order_view(self, request):
+        """
+        AJAX endpoint to reset the order by sorting on a model field.
+        Expects an `ordering` listed in `order_reseed_fields`; the new sort
+        values are computed and written by the database.
+        """
+        ordering = request.POST.get("ordering")
+        if ordering not in self.order_reseed_fields:
+            return JsonResponse({"error": "ordering is not allowed"}, status=400)
+        if self.order_extra_models:
+            return JsonResponse(
+                {"error": "Combined orderings cannot be reseeded"}, status=400
+            )
+
+        scope = self.get_order_scope(request)
+        try:
+            with self.get_order_lock(request.user, scope):
+                updated = self.run_order_write(
+                    lambda: self.apply_reseed(ordering, user=request.user, scope=scope)
+                )
+        except OrderLocked as e:
+            return self.get_order_locked_response(e)
+
+        return self.get_order_saved_response(updated=updated)
+
+    @order_permission_required("change")
+    def export_order_view(self, request):
+        """
+        Streams the ordering as a CSV (default) or JSON Lines (`?format=jsonl`)
+        download, keyed by `order_transfer_key_field`.
+        """
+        format = request.GET.get("format", "csv")
+        if format not in FORMATS:
+            return JsonResponse(
+                {"error": f"format must be one of: {', '.join(FORMATS)}"}, status=400
+            )
+        response = StreamingHttpResponse(
+            export_ordering(
+                self.get_order_queryset(self.get_order_scope(request)),
+                self.sort_order_field_name,
+                key_field=self.order_transfer_key_field,
+                format=format,
+            ),
+            content_type="text/csv" if format == "csv" else "application/jsonl",
+        )
+        filename = f"{self.model._meta.label_lower}-ordering.{format}"
+        response["Content-Disposition"] = f'attachment; filename="{filename}"'
+        return response
+
+    @method_decorator(require_POST)
+    @limit_order_request
+    @order_permission_required("change")
+    def import_order_view(self, request):
+        """
+        AJAX endpoint to apply an uploaded ordering `file` produced by the
+        export view or the `export_ordering` management command. The file is
+        validated in full before anything is written. Oversized and rate
+        limited uploads are rejected before the body is parsed.
+        """
+        upload = request.FILES.get("file")
+        if upload is None:
+            return JsonResponse({"error": "No file uploaded"}, status=400)
+
+        try:
+            ordering, changes = self.import_order(
+                codecs.iterdecode(upload, "utf-8"),
+                format=get_format(upload.name),
+                user=request.user,
+                scope=self.get_order_scope(request),
+            )
+        except ValidationError as e:
+            return JsonResponse({"error": " ".join(e.messages)}, status=400)
+        except OrderLocked as e:
+            return self.get_order_locked_response(e)
+
+        return self.get_order_saved_response(
+            imported=len(ordering), updated=len(changes)
+        )
+
+    @method_decorator(csrf_protect)
+    @method_decorator(require_POST)
+    @order_permission_required("publish")
+    def publish_order_view(self, request):
+        """
+        AJAX endpoint to publish the unpublished order, writing the live sort
+        values in one transaction through the bulk write path.
+        """
+        scope = self.get_order_scope(request)
+        try:
+            with self.get_order_lock(request.user, scope):
+                changes = self.run_order_write(
+                    lambda: self.publish_order_draft(user=request.user, scope=scope)
+                )
+        except OrderLocked as e:
+            return self.get_order_locked_response(e)
+
+        if changes is None:
+            return JsonResponse({"error": "There is no unpublished order"}, status=400)
+        return JsonResponse({"success": True, "updated": len(changes)})
+
+    @method_decorator(csrf_protect)
+    @method_decorator(require_POST)
+    @order_permission_required("change")
+    def discard_order_view(self, request):
+        """
+        AJAX endpoint to discard the unpublished order, keeping the live one.
+        """
+        scope = self.get_order_scope(request)
+        try:
+            with self.get_order_lock(request.user, scope):
+                deleted, _ = OrderRevision.objects.for_model(self.model, scope).delete()
+                if deleted:
+                    self.publish_order_event(
+                        {"operation": "discard", "order": self.get_order_ids(scope)},
+                        scope=scope,
+                    )
+        except OrderLocked as e:
+            return self.get_order_locked_response(e)
+        return JsonResponse({"success": True, "discarded": bool(deleted)})
+
+    @method_decorator(csrf_protect)
+    @method_decorator(require_POST)
+    @order_permission_required("change")
+    def sync_order_view(self, request):
+        """
+        AJAX endpoint to copy the order of the requested `locale` to every
+        other locale, matching translations by their translation key.
+        """
+        scope = self.get_order_scope(request)
+        if not isinstance(scope, Locale):
+            return JsonResponse(
+                {"error": "This ordering is not kept per locale"}, status=400
+            )
+        if self.order_drafts_enabled:
+            return JsonResponse(
+                {"error": "Orders saved as drafts cannot be copied to other locales"},
+                status=400,
+            )
+
+        try:
+            # The copy writes every locale, so it holds all of their locks
+            with ExitStack() as stack:
+                for locale in Locale.objects.order_by("pk"):
+                    stack.enter_context(self.get_order_lock(request.user, locale))
+                changes = self.run_order_write(
+                    lambda: self.apply_locale_sync(scope, user=request.user)
+                )
+        except OrderLocked as e:
+            return self.get_order_locked_response(e)
+
+        return JsonResponse({"success": True, "updated": len(changes)})
+
+    @order_permission_required("change")
+    def order_events_view(self, request):
+        """
+        Server-sent event stream of the reorders of the requested scope,
+        starting after the `Last-Event-ID` header or `after` parameter. The
+        stream closes after `order_event_stream_timeout` seconds and the
+        browser reconnects from the last event it received.
+        """
+        if not self.order_live_updates_enabled:
+            raise Http404("Live updates are not enabled")
+        scope = self.get_order_scope(request)
+        try:
+            after = int(
+                request.headers.get("Last-Event-ID") or request.GET.get("after") or 0
+            )
+        except ValueError:
+            after = 0
+
+        response = StreamingHttpResponse(
+            self.stream_order_events(scope, after), content_type="text/event-stream"
+        )
+        response["Cache-Control"] = "no-cache"
+        # Stop nginx from buffering the stream
+        response["X-Accel-Buffering"] = "no"
+        return response
+
+    def stream_order_events(self, scope, after=0):
+        """
+        Yields the server-sent event lines of the events published after the
+        ID `after`, with keep-alive comments while idle.
+        """
+        broker = self.get_order_event_broker()
+        channel = self.get_order_event_channel(scope)
+        deadline = time.monotonic() + self.order_event_stream_timeout
+        yield "retry: 1000\n\n"
+        while (remaining := deadline - time.monotonic()) > 0:
+            events = broker.listen(
+                channel, after, timeout=min(self.order_event_keepalive, remaining)
+            )
+            if not events:
+                yield ": keep-alive\n\n"
+            for event_id, event in events:
+                data = json.dumps(event, cls=DjangoJSONEncoder)
+                yield f"id: {event_id}\ndata: {data}\n\n"
+            if events:
+                # Listen for the events published after the last one sent
+                after = events[-1][0]
+
+    @method_decorator(csrf_protect)
+    @method_decorator(require_POST)
+    @order_permission_required("change")
+    def undo_order_view(self, request):
+        """
+        AJAX endpoint to undo the last `steps` reorder operations (default 1).
+        The recorded deltas are merged so that each affected row is written once.
+        """
+        return self.replay_order_history(request, undo=True)
+
+    @method_decorator(csrf_protect)
+    @method_decorator(require_POST)
+    @order_permission_required("change")
+    def redo_order_view(self, request):
+        """
+        AJAX endpoint to redo the last `steps` undone reorder operations (default 1).
+        """
+        return self.replay_order_history(request, undo=False)
+
+    def replay_order_history(self, request, undo):
+        """
+        Applies (or reverts) a run of recorded history entries as one write.
+        """
+        if not self.is_order_undoable():
+            return JsonResponse(
+                {"error": "Undo and redo are not available for this ordering"},
+                status=400,
+            )
+        try:
+            steps = int(request.POST.get("steps", 1))
+        except ValueError:
+            return JsonResponse({"error": "steps must be an integer"}, status=400)
+        if steps < 1:
+            return JsonResponse({"error": "steps must be at least 1"}, status=400)
+
+        scope = self.get_order_scope(request)
+        try:
+            with self.get_order_lock(request.user, scope):
+                entries = self.run_order_write(
+                    lambda: self.apply_order_history(
+                        undo, steps, user=request.user, scope=scope
+                    )
+                )
+        except OrderLocked as e:
+            return self.get_order_locked_response(e)
+
+        key = "undone" if undo else "redone"
+        return JsonResponse({"success": True, key: len(entries)})
+
+    def is_order_undoable(self):
+        """
+        Whether reorders can be undone. The history holds live sort values, so
+        undo and redo are not offered when reorders are saved as drafts, nor
+        for combined orderings, which are not recorded in the history.
+        """
+        return (
+            self.order_history_enabled
+            and not self.order_drafts_enabled
+            and not self.order_extra_models
+        )
+
+    def apply_order_history(self, undo, steps, user=None, scope=None):
+        """
+        Undoes or redoes up to `steps` history entries in a single write.
+        Only the entries recorded for `scope` are replayed.
+        Returns the entries that were applied.
+        """
+        if undo:
+            entries = OrderHistory.objects.undoable(self.model, scope)
+        else:
+            entries = OrderHistory.objects.redoable(self.model, scope)
+        entries = list(entries.select_for_update()[:steps])
+
+        # Entries are in replay order, so later entries overwrite earlier
+        # ones and each row ends up with its value from the furthest step.
+        values = {}
+        for entry in entries:
+            for pk, old, new in entry.changes:
+                values[pk] = old if undo else new
+
+        if values:
+            operation = "undo" if undo else "redo"
+            self.send_pre_reorder(list(values), operation, user=user, scope=scope)
+            self.write_order_values(values)
+            self.log_reorder(list(values), operation, user=user)
+            self.send_post_reorder(list(values), operation, user=user, scope=scope)
+            self.publish_order_changes(
+                [(pk, None, value) for pk, value in values.items()],
+                operation,
+                scope=scope,
+            )
+        OrderHistory.objects.filter(pk__in=[entry.pk for entry in entries]).update(
+            undone=undo
+        )
+        return entries
+
+    def save_order(self, object_ids, user=None, operation="order", scope=None):
+        """
+        Applies the order of `object_ids`, or saves it as the unpublished order
+        when `order_drafts_enabled` is set. Should be called inside a transaction.
+        """
+        if self.order_drafts_enabled and not self.order_extra_models:
+            draft = OrderRevision.objects.save_draft(
+                self.model, object_ids, user=user, scope=scope
+            )
+            self.publish_order_event(
+                {"operation": operation, "order": draft.object_ids}, scope=scope
+            )
+            return []
+        return self.apply_order(object_ids, user=user, operation=operation, scope=scope)
+
+    def publish_order_draft(self, user=None, scope=None):
+        """
+        Applies the unpublished order to the live sort values and deletes it.
+        Should be called inside a transaction; returns the list of changes, or
+        None if there is no unpublished order.
+        """
+        draft = (
+            OrderRevision.objects.for_model(self.model, scope)
+            .select_for_update()
+            .first()
+        )
+        if draft is None:
+            return None
+        changes = self.apply_order(
+            self.get_order_ids(scope), user=user, operation="publish", scope=scope
+        )
+        draft.delete()
+        return changes
+
+    def apply_order(
+        self, object_ids, user=None, start=1, operation="order", scope=None
+    ):
+        """
+        Numbers `object_ids` sequentially from `start`, writing only the rows
+        whose value changes, and records the change in the order history.
+        A descending ordering is numbered from its last object up.
+        Should be called inside a transaction; returns the list of changes.
+        """
+        if self.is_order_descending:
+            object_ids = list(reversed(object_ids))
+        if self.order_extra_models:
+            return self.apply_combined_order(
+                object_ids, start, operation, user=user, scope=scope
+            )
+
+        changes = get_order_changes(
+            self.get_order_queryset(scope),
+            self.sort_order_field_name,
+            object_ids,
+            start,
+        )
+        return self.write_order_changes(changes, operation, user=user, scope=scope)
+
+    def apply_move(self, object_ids, move, value=None, user=None, scope=None):
+        """
+        Moves the given objects as one block (see `move_block`) and applies the
+        resulting order. Should be called inside a transaction.
+
+        Moves to the start or end of a live ordering write only the moved rows,
+        with values below or above all others (see `get_end_move_changes`).
+        """
+        if not self.order_drafts_enabled and not self.order_extra_models:
+            changes = get_end_move_changes(
+                self.get_order_queryset(scope),
+                self.sort_order_field_name,
+                object_ids,
+                move,
+                descending=self.is_order_descending,
+            )
+            if changes is not None:
+                return self.write_order_changes(changes, "move", user=user, scope=scope)
+
+        order = move_block(self.get_order_ids(scope), object_ids, move, value)
+        return self.save_order(order, user=user, operation="move", scope=scope)
+
+    def apply_page_order(self, object_ids, user=None, scope=None):
+        """
+        Reorders the rows of one listing page. The rows swap the sort values
+        they already hold (see `get_page_order_changes`), leaving every other
+        row alone. If those values are not distinct, or the order is saved as
+        a draft, the rows are instead rearranged across the positions they
+        occupy in the full order. Should be called inside a transaction.
+        """
+        if not self.order_drafts_enabled:
+            changes = get_page_order_changes(
+                self.get_order_queryset(scope),
+                self.sort_order_field_name,
+                object_ids,
+                descending=self.is_order_descending,
+            )
+            if changes is not None:
+                return self.write_order_changes(changes, "page", user=user, scope=scope)
+
+        order = splice_order(self.get_order_ids(scope), object_ids)
+        return self.save_order(order, user=user, operation="page", scope=scope)
+
+    def apply_reseed(self, ordering, user=None, scope=None):
+        """
+        Renumbers all objects sorted by `ordering` (see `reseed_order`) and
+        records the change in the order history. A descending ordering is
+        numbered in reverse, so that it lists the objects sorted by `ordering`.
+        With `order_drafts_enabled` the new order is saved as the draft instead.
+        Should be called inside a transaction; returns the number of objects
+        renumbered.
+        """
+        queryset = self.get_order_queryset(scope)
+        if self.order_drafts_enabled and not self.order_extra_models:
+            order = [
+                str(pk)
+                for pk in queryset.order_by(ordering, "pk").values_list("pk", flat=True)
+            ]
+            self.save_order(order, user=user, operation="reseed", scope=scope)
+            return len(order)
+
+        field_name = self.sort_order_field_name
+        before = dict(queryset.values_list("pk", field_name))
+
+        # The new values are only known once the database has computed them.
+        self.send_pre_reorder(None, "reseed", user=user, scope=scope)
+        updated = reseed_order(
+            queryset,
+            field_name,
+            [ordering],
+            descending=self.is_order_descending,
+            batch_size=self.order_write_batch_size,
+        )
+
+        changes = [
+            (pk, before[pk], value)
+            for pk, value in queryset.values_list("pk", field_name)
+            if pk in before and before[pk] != value
+        ]
+        if changes:
+            self.record_order_changes(changes, user=user, scope=scope)
+            self.log_reorder([pk for pk, old, new in changes], "reseed", user=user)
+            self.send_post_reorder(
+                [pk for pk, old, new in changes], "reseed", user=user, scope=scope
+            )
+            self.publish_order_changes(changes, "reseed", scope=scope)
+        return updated
+
+    def apply_locale_sync(self, locale, user=None):
+        """
+        Copies the sort values of `locale` to the translations of its objects
+        in every other locale, with a single UPDATE (see
+        `copy_order_from_locale`), and records the change in the order history
+        of each locale. Should be called inside a transaction; returns the list
+        of changes.
+        """
+        queryset = self.model._default_manager.exclude(locale=locale)
+        field_name = self.sort_order_field_name
+        before = dict(queryset.values_list("pk", field_name))
+
+        self.send_pre_reorder(None, "sync_locales", user=user, scope=locale)
+        copy_order_from_locale(self.model._default_manager.all(), field_name, locale)
+
+        changes = []
+        changes_by_locale = defaultdict(list)
+        for pk, locale_id, value in queryset.values_list("pk", "locale", field_name):
+            if pk in before and before[pk] != value:
+                changes.append((pk, before[pk], value))
+                changes_by_locale[locale_id].append((pk, before[pk], value))
+        if changes:
+            pks = [pk for pk, old, new in changes]
+            self.log_reorder(pks, "sync_locales", user=user)
+            self.send_post_reorder(pks, "sync_locales", user=user, scope=locale)
+            for other in Locale.objects.filter(pk__in=changes_by_locale):
+                other_changes = changes_by_locale[other.pk]
+                self.record_order_changes(other_changes, user=user, scope=other)
+                self.publish_order_changes(other_changes, "sync_locales", scope=other)
+        return changes
+
+    def import_order(
+        self, lines, format="csv", user=None, scope=None, key_field=None, history=True
+    ):
+        """
+        Validates an ordering read from `lines` in full, then applies it under
+        the order lock of `scope`. Used by the import view and the
+        `import_ordering` management command. Returns the ordering read and
+        the changes written; raises `ValidationError` or `OrderLocked`.
+        """
+        ordering = read_ordering(
+            lines,
+            self.sort_order_field_name,
+            format=format,
+            limits=get_order_value_limits(
+                self.get_order_queryset(scope), self.sort_order_field_name
+            ),
+        )
+        with self.get_order_lock(user, scope):
+            changes = self.run_order_write(
+                lambda: self.apply_import(
+                    ordering,
+                    user=user,
+                    scope=scope,
+                    key_field=key_field,
+                    history=history,
+                )
+            )
+        return ordering, changes
+
+    def apply_import(
+        self, ordering, user=None, scope=None, key_field=None, history=True
+    ):
+        """
+        Applies an imported `{key: sort_value}` ordering, keyed by `key_field`
+        (default: `order_transfer_key_field`), and records the change in the
+        order history unless `history` is False. With `order_drafts_enabled`
+        the order the imported values give is saved as the draft instead.
+        Should be called inside a transaction.
+        """
+        queryset = self.get_order_queryset(scope)
+        changes = get_import_changes(
+            queryset,
+            self.sort_order_field_name,
+            ordering,
+            key_field=key_field or self.order_transfer_key_field,
+        )
+        if self.order_drafts_enabled and not self.order_extra_models:
+            values = dict(queryset.values_list("pk", self.sort_order_field_name))
+            values.update({pk: new for pk, old, new in changes})
+            order = sorted(
+                sorted(values),
+                key=get_sort_key(
+                    values.get,
+                    descending=self.is_order_descending,
+                    nulls_first=self.is_order_nulls_first,
+                ),
+            )
+            return self.save_order(
+                [str(pk) for pk in order], user=user, operation="import", scope=scope
+            )
+        return self.write_order_changes(
+            changes, "import", user=user, scope=scope, history=history
+        )
+
+    def apply_combined_order(
+        self, order_keys, start=1, operation="order", user=None, scope=None
+    ):
+        """
+        Numbers the objects identified by `order_keys` across all models of a
+        combined ordering, with one batched write per model. The reorder
+        signals are sent once per model whose rows change.
+        """
+        all_changes = []
+        event_changes = []
+        log_entries = []
+        for queryset, changes in get_combined_order_changes(
+            self.get_order_querysets(scope),
+            self.sort_order_field_name,
+            order_keys,
+            start,
+        ):
+            if not changes:
+                continue
+            pks = [pk for pk, old, new in changes]
+            send_pre_reorder(
+                queryset.model, pks, scope=scope, operation=operation, user=user
+            )
+            apply_order_values(
+                queryset,
+                self.sort_order_field_name,
+                {pk: new for pk, old, new in changes},
+                batch_size=self.order_write_batch_size,
+            )
+            send_post_reorder(
+                queryset.model, pks, scope=scope, operation=operation, user=user
+            )
+            if self.order_audit_log_enabled:
+                log_entries.append(
+                    make_reorder_log_entry(queryset.model, pks, operation, user=user)
+                )
+            all_changes += changes
+            event_changes += [
+                (make_order_key(queryset.model, pk), old, new)
+                for pk, old, new in changes
+            ]
+        if log_entries:
+            log_reorders(log_entries)
+        self.publish_order_changes(event_changes, operation, scope=scope)
+        return all_changes
+
+    def write_order_changes(
+        self, changes, operation, user=None, scope=None, history=True
+    ):
+        """
+        Writes a list of `(pk, old_value, new_value)` changes, records them in
+        the order history (unless `history` is False) and sends the reorder
+        signals. Returns the changes.
+        """
+        if not changes:
+            return changes
+        pks = [pk for pk, old, new in changes]
+        self.send_pre_reorder(pks, operation, user=user, scope=scope)
+        self.write_order_values({pk: new for pk, old, new in changes})
+        if history:
+            self.record_order_changes(changes, user=user, scope=scope)
+        self.log_reorder(pks, operation, user=user)
+        self.send_post_reorder(pks, operation, user=user, scope=scope)
+        self.publish_order_changes(changes, operation, scope=scope)
+        self.check_order_range(changes, scope=scope)
+        return changes
+
+    def check_order_range(self, changes, scope=None):
+        """
+        Compacts the ordering of `scope` if a new value of `changes` is beyond
+        `order_range_threshold` of the limits of the sort field's column.
+        """
+        limits = get_order_value_limits(
+            self.get_order_queryset(scope), self.sort_order_field_name
+        )
+        new_values = [new for pk, old, new in changes]
+        if is_near_order_limits(new_values, limits, self.order_range_threshold):
+            self.apply_compaction(scope=scope)
+
+    def apply_compaction(self, scope=None):
+        """
+        Renumbers the ordering of `scope` from 1 without changing it (see
+        `compact_model_order`), then makes open order pages reload. Runs in
+        the background with `order_compact_in_background`, returning None;
+        otherwise returns the number of rows written.
+        """
+
+        def compact():
+            written = compact_model_order(
+                self.get_order_queryset(scope),
+                self.sort_order_field_name,
+                batch_size=self.order_write_batch_size,
+                scope=scope,
+            )
+            if written:
+                self.publish_order_event(
+                    {"operation": "compact", "reload": True}, scope=scope
+                )
+            return written
+
+        if not self.order_compact_in_background:
+            return compact()
+        key = f"{self.model._meta.label_lower}:{get_scope_key(scope)}"
+        start_order_compaction(key, compact)
+
+    def record_order_changes(self, changes, user=None, scope=None):
+        if self.order_history_enabled:
+            OrderHistory.objects.record(
+                self.model,
+                changes,
+                user=user,
+                limit=self.order_history_limit,
+                scope=scope,
+            )
+
+    def log_reorder(self, pks, operation, user=None):
+        if self.order_audit_log_enabled:
+            log_reorder(self.model, pks, operation, user=user)
+
+    def send_pre_reorder(self, pks, operation, user=None, scope=None):
+        send_pre_reorder(self.model, pks, scope=scope, operation=operation, user=user)
+
+    def send_post_reorder(self, pks, operation, user=None, scope=None):
+        send_post_reorder(self.model, pks, scope=scope, operation=operation, user=user)
+
+    def get_order_event_broker(self):
+        return self.order_event_broker or get_default_broker()
+
+    def get_order_event_channel(self, scope=None):
+        """
+        Returns the name of the live update channel of `scope`.
+        """
+        label = self.model._meta.label_lower
+        return f"wagtail_orderable_viewset:events:{label}:{get_scope_key(scope)}"
+
+    def publish_order_event(self, event, scope=None):
+        """
+        Publishes a live update event once the current transaction commits,
+        if `order_live_updates_enabled` is set.
+        """
+        if not self.order_live_updates_enabled:
+            return
+        broker = self.get_order_event_broker()
+        channel = self.get_order_event_channel(scope)
+        transaction.on_commit(lambda: broker.publish(channel, event))
+
+    def publish_order_changes(self, changes, operation, scope=None):
+        """
+        Publishes the new sort values of a list of `(key, old_value,
+        new_value)` changes as one live update event.
+        """
+        if changes:
+            self.publish_order_event(
+                {
+                    "operation": operation,
+                    "changes": [[str(key), new] for key, old, new in changes],
+                },
+                scope=scope,
+            )
+
+    def write_order_values(self, values):
+        """
+        Writes a `{pk: sort_value}` mapping through the batched write path.
+        """
+        apply_order_values(
+            self.get_order_queryset(),
+            self.sort_order_field_name,
+            values,
+            batch_size=self.order_write_batch_size,
+        )
+
+    def run_order_write(self, func):
+        """
+        Runs `func` in a transaction, retrying on deadlocks and serialization
+        failures up to `order_write_attempts` times.
+        """
+        return atomic_with_retry(func, attempts=self.order_write_attempts)
 
     @cached_property
     def menu_url(self):
-        if WAGTAIL_VERSION < (7, 0):
-            return reverse(self.get_url_name(self.get_index_url_name()))
-        return reverse(self.get_url_name(self.get_urlpatterns()[0].name))
+        # The first URL pattern is the index view on Wagtail >= 7.0 and the order
+        # view on older versions (see `get_urlpatterns`), so resolve the index
+        # route directly rather than rebuilding the whole pattern list.
+        return self.order_index_url
 
 
 class OrderableModelViewSet(OrderableViewSetMixin, ModelViewSet):
@@ -169,9 +1832,11 @@ class OrderableModelViewSet(OrderableViewSetMixin, ModelViewSet):
 
     - Adds a dedicated order view and AJAX endpoint for bulk reordering.
     - Injects order-related context into the listing view.
+    - Renders a Reorder button in the listing's header.
     - Uses a custom index template for the listing page.
     """
 
+    index_view_class = OrderableIndexView
     index_template_name = "wagtail_orderable_viewset/list.html"
 
 
@@ -181,7 +1846,133 @@ class OrderableSnippetViewSet(OrderableViewSetMixin, SnippetViewSet):
 
     - Adds a dedicated order view and AJAX endpoint for bulk reordering.
     - Injects order-related context into the listing view.
+    - Renders a Reorder button in the listing's header.
     - Uses a custom index template for the snippets listing page.
     """
 
+    index_view_class = OrderableSnippetIndexView
     index_template_name = "wagtail_orderable_viewset/snippets_list.html"
+
+
+class OrderableChildViewSet(OrderableViewSetMixin, ViewSet):
+    """
+    Viewset ordering the children of one parent object at a time, such as the
+    items of an `InlinePanel` (a `ParentalKey` relation of a `ClusterableModel`).
+
+    Reorders go straight to the children's sort field through the scoped bulk
+    write path, skipping the parent's form and formset save cycle. Set `model`
+    to the child model and `parent_field_name` to its `ParentalKey`, register
+    the viewset with the `register_admin_viewset` hook and link to
+    `get_order_url(parent)`, e.g. from the parent's edit view.
+
+    - Only the order endpoints are provided; "Back to" links to the parent's
+      edit view.
+    - The parent is passed as the `parent` parameter of every request, and
+      the user needs permission to edit it.
+    - If the parent has unpublished changes, the new order is also written to
+      its latest revision, so that publishing the draft keeps it.
+    """
+
+    # Child model being ordered, e.g. a gallery image model.
+    model = None
+
+    # Name of the child model's ForeignKey/ParentalKey to the parent.
+    parent_field_name = None
+
+    @cached_property
+    def parent_model(self):
+        return self.model._meta.get_field(self.parent_field_name).related_model
+
+    def get_order_scope(self, request):
+        """
+        Returns the parent object named by the `parent` parameter.
+        """
+        parent_id = request.GET.get("parent") or request.POST.get("parent")
+        try:
+            parent = self.parent_model._default_manager.get(pk=parent_id)
+        except (ObjectDoesNotExist, ValueError, ValidationError):
+            raise Http404(
+                f"No {self.parent_model._meta.verbose_name} {parent_id!r}"
+            ) from None
+        return parent
+
+    def user_has_order_permission(self, request, action="change"):
+        # Reordering children is part of editing the parent, whatever the action
+        return self.user_can_edit_parent(request.user, self.get_order_scope(request))
+
+    def user_can_edit_parent(self, user, parent):
+        """
+        Whether `user` may edit `parent`, and so reorder its children.
+        """
+        if isinstance(parent, Page):
+            return parent.permissions_for_user(user).can_edit()
+        policy = ModelPermissionPolicy(self.parent_model)
+        return policy.user_has_permission_for_instance(user, "change", parent)
+
+    def send_post_reorder(self, pks, operation, user=None, scope=None):
+        # Every write path ends here, once the new values are written.
+        self.update_parent_revision(scope)
+        super().send_post_reorder(pks, operation, user=user, scope=scope)
+
+    def update_parent_revision(self, parent):
+        """
+        Copies the children's live sort values into the latest revision of
+        `parent` if it has unpublished changes. Otherwise publishing that draft
+        would write back the order it was saved with.
+        """
+        if not isinstance(parent, RevisionMixin):
+            return
+        if not getattr(parent, "has_unpublished_changes", False):
+            return
+        revision = (
+            Revision.objects.select_for_update()
+            .filter(pk=parent.latest_revision_id)
+            .first()
+        )
+        relation = self.model._meta.get_field(self.parent_field_name).remote_field
+        items = revision and revision.content.get(relation.get_accessor_name())
+        if not items:
+            return
+
+        field_name = self.sort_order_field_name
+        values = {
+            str(pk): value
+            for pk, value in self.get_order_queryset(parent).values_list(
+                "pk", field_name
+            )
+        }
+        for item in items:
+            if str(item.get("pk")) in values:
+                item[field_name] = values[str(item["pk"])]
+        # Children added in the draft keep their value and relative place.
+        items.sort(
+            key=get_sort_key(
+                lambda item: item.get(field_name),
+                descending=self.is_order_descending,
+                nulls_first=self.is_order_nulls_first,
+            )
+        )
+        revision.save(update_fields=["content"])
+
+    def filter_order_queryset(self, queryset, scope):
+        return queryset.filter(**{self.parent_field_name: scope})
+
+    def get_order_scope_params(self, scope):
+        return {"parent": scope.pk}
+
+    def get_order_url(self, parent):
+        """
+        Returns the URL of the order view for the children of `parent`.
+        """
+        return f"{reverse(self.get_url_name('order'))}?parent={parent.pk}"
+
+    def get_order_context_data(self, objects, scope=None):
+        context = super().get_order_context_data(objects, scope)
+        context["order_parent"] = scope
+        context["index_url"] = AdminURLFinder().get_edit_url(scope)
+        return context
+
+    @cached_property
+    def order_index_url(self):
+        # There is no listing of children; the order view links to the parent.
+        return None
@@ -0,0 +1,22 @@
+from django.utils.translation import gettext_lazy as _
+from django.utils.translation import ngettext
+from wagtail import hooks
+from wagtail.log_actions import LogFormatter
+
+from .audit import REORDER_ACTION
+
+
+@hooks.register("register_log_actions")
+def register_reorder_log_actions(actions):
+    @actions.register_action(REORDER_ACTION)
+    class ReorderActionFormatter(LogFormatter):
+        label = _("Reorder")
+
+        def format_message(self, log_entry):
+            try:
+                count = log_entry.data["count"]
+            except KeyError:
+                return _("Reordered")
+            return ngettext(
+                "Reordered %(count)s item", "Reordered %(count)s items", count
+            ) % {"count": count}
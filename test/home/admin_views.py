@@ -1,8 +1,17 @@
 from wagtail_orderable_viewset.viewsets import (
+    OrderableChildViewSet,
     OrderableModelViewSet,
     OrderableSnippetViewSet,
 )
-from .models import Testimonial, TeamMember, Person
+from .models import (
+    Testimonial,
+    TeamMember,
+    Person,
+    Office,
+    Event,
+    Sponsor,
+    HomePageGalleryItem,
+)
 
 
 class TestimonialViewSet(OrderableModelViewSet):
@@ -27,6 +36,9 @@ class TestimonialViewSet(OrderableModelViewSet):
     search_fields = ["name", "company", "content"]
     order_by = ["name"]
 
+    # Editors can reset the manual order alphabetically or by rating
+    order_reseed_fields = ["name", "-rating"]
+
     menu_label = "Testimonials"
     icon = "folder-open-1"
     menu_order = 100
@@ -55,6 +67,9 @@ class TeamMemberViewSet(OrderableModelViewSet):
 
     order_by = ["name"]
 
+    # Other editors' reorders show up on an open order page without reloading
+    order_live_updates_enabled = True
+
     menu_label = "Team members"
     icon = "user"
     menu_order = 110
@@ -88,3 +103,79 @@ class PersonViewSet(OrderableSnippetViewSet):
 
 
 person_viewset = PersonViewSet()
+
+
+class OfficeViewSet(OrderableModelViewSet):
+    """
+    This viewset orders the Office model, whose sort_order field lives on its
+    multi-table inheritance parent, Location.
+
+    `order_inline_listing` adds the sort order column, with drag handles on
+    each page of the listing when it is sorted by that column.
+    """
+
+    model = Office
+
+    list_display = ["name", "city"]
+    form_fields = ["name", "city"]
+
+    order_inline_listing = True
+
+    menu_label = "Offices"
+    icon = "site"
+    menu_order = 120
+    add_to_admin_menu = True
+
+
+office_viewset = OfficeViewSet("office")
+
+
+class EventViewSet(OrderableSnippetViewSet):
+    """
+    This viewset orders the Event snippet, which uses drafts and revisions.
+    Reorders are saved as an unpublished order until an editor publishes it.
+    """
+
+    model = Event
+
+    list_display = ["name", "live", "sort_order"]
+
+    order_drafts_enabled = True
+
+    icon = "date"
+
+
+event_viewset = EventViewSet()
+
+
+class SponsorViewSet(OrderableSnippetViewSet):
+    """
+    This viewset orders the translatable Sponsor snippet, with an independent
+    order per locale that can be copied to the other locales.
+    """
+
+    model = Sponsor
+
+    list_display = ["name", "locale", "sort_order"]
+
+    order_per_locale = True
+
+    icon = "pick"
+
+
+sponsor_viewset = SponsorViewSet()
+
+
+class GalleryItemViewSet(OrderableChildViewSet):
+    """
+    This viewset orders the gallery items (an InlinePanel) of one home page at
+    a time, without saving the page form.
+    """
+
+    model = HomePageGalleryItem
+    parent_field_name = "page"
+
+    icon = "image"
+
+
+gallery_item_viewset = GalleryItemViewSet("gallery_item")
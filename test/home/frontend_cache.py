@@ -0,0 +1,15 @@
+from wagtail.contrib.frontend_cache.backends import BaseBackend
+
+
+class RecordingBackend(BaseBackend):
+    """
+    Frontend cache backend for tests, recording each batch of purged URLs.
+    """
+
+    batches = []
+
+    def purge(self, url):
+        self.purge_batch([url])
+
+    def purge_batch(self, urls):
+        self.batches.append(sorted(urls))
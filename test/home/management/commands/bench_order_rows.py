@@ -0,0 +1,58 @@
+import timeit
+
+from django.core.management.base import BaseCommand
+from django.template import engines
+
+from wagtail_orderable_viewset.rendering import OrderRowRenderer
+from wagtail_orderable_viewset.viewsets import OrderRow
+
+ROW_TEMPLATE = "wagtail_orderable_viewset/_order_row.html"
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare the cost of rendering the order view's rows with the template "
+        "and the fast renderer"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--rows", type=int, default=5000, help="Number of rows rendered per run"
+        )
+        parser.add_argument(
+            "--repeat", type=int, default=5, help="Runs per renderer (best is kept)"
+        )
+        parser.add_argument(
+            "--live",
+            action="store_true",
+            help="Include the sort values, as with live updates enabled",
+        )
+
+    def handle(self, *args, **options):
+        rows = [
+            OrderRow(pk, f"Row <{pk}> & co", pk * 10)
+            for pk in range(1, options["rows"] + 1)
+        ]
+        context = {"object_list": rows, "order_row_template_name": ROW_TEMPLATE}
+        if options["live"]:
+            context["events_url"] = "/events/"
+
+        loop = engines["django"].from_string(
+            "{% for obj in object_list %}"
+            "{% include order_row_template_name %}"
+            "{% endfor %}"
+        )
+
+        def render_template():
+            return loop.render(context)
+
+        def render_fast():
+            return OrderRowRenderer(ROW_TEMPLATE, context).render(rows)
+
+        if render_template() != render_fast():
+            self.stderr.write("The renderers' output differs")
+
+        per_1k = 1000 / len(rows)
+        for name, func in (("template", render_template), ("fast", render_fast)):
+            best = min(timeit.repeat(func, number=1, repeat=options["repeat"]))
+            self.stdout.write(f"{name:>8}: {best * 1000 * per_1k:8.2f} ms per 1k rows")
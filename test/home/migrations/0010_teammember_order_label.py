@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-19 16:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("home", "0009_homepagegalleryitem"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="teammember",
+            name="order_label",
+            field=models.CharField(blank=True, editable=False, max_length=255),
+        ),
+    ]
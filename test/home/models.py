@@ -1,11 +1,33 @@
 from django.db import models
-from wagtail_orderable_viewset.models import IncrementingOrderable
+from modelcluster.fields import ParentalKey
+from wagtail.admin.panels import FieldPanel, InlinePanel
+from wagtail_orderable_viewset.models import IncrementingOrderable, OrderLabelMixin
 
-from wagtail.models import Page
+from wagtail.models import (
+    DraftStateMixin,
+    Orderable,
+    Page,
+    RevisionMixin,
+    TranslatableMixin,
+)
 
 
 class HomePage(Page):
-    pass
+    content_panels = [*Page.content_panels, InlinePanel("gallery_items")]
+
+
+class HomePageGalleryItem(Orderable):
+    """
+    Example InlinePanel child, ordered through an OrderableChildViewSet.
+    """
+
+    page = ParentalKey(HomePage, on_delete=models.CASCADE, related_name="gallery_items")
+    caption = models.CharField(max_length=100)
+
+    panels = [FieldPanel("caption")]
+
+    def __str__(self):
+        return self.caption
 
 
 class Testimonial(IncrementingOrderable):
@@ -26,9 +48,11 @@ class Testimonial(IncrementingOrderable):
         return f"{self.name} - {self.company}"
 
 
-class TeamMember(IncrementingOrderable):
+class TeamMember(OrderLabelMixin, IncrementingOrderable):
     """
     Example model for team members which includes a incrementing sort_order field.
+
+    Its label in the order view is stored in `order_label` when it is saved.
     """
 
     name = models.CharField(max_length=100)
@@ -70,3 +94,50 @@ class Person(IncrementingOrderable):
 
     def __str__(self):
         return self.name
+
+
+class Location(IncrementingOrderable):
+    """
+    Example concrete parent model which holds the incrementing sort_order field.
+    """
+
+    name = models.CharField(max_length=100)
+
+    def __str__(self):
+        return self.name
+
+
+class Office(Location):
+    """
+    Example multi-table inheritance child, ordered through its parent's sort_order.
+    """
+
+    city = models.CharField(max_length=100)
+
+
+class Event(DraftStateMixin, RevisionMixin, IncrementingOrderable):
+    """
+    Example snippet with drafts and revisions, whose order is published separately.
+    """
+
+    name = models.CharField(max_length=100)
+
+    class Meta:
+        ordering = ["name"]
+
+    def __str__(self):
+        return self.name
+
+
+class Sponsor(TranslatableMixin, IncrementingOrderable):
+    """
+    Example translatable snippet, ordered separately in each locale.
+    """
+
+    name = models.CharField(max_length=100)
+
+    class Meta(TranslatableMixin.Meta):
+        ordering = ["name"]
+
+    def __str__(self):
+        return self.name
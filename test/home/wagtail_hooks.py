@@ -1,9 +1,15 @@
 from wagtail import hooks
+from wagtail_orderable_viewset.purge import register_purge_targets
 from home.admin_views import (
+    event_viewset,
+    gallery_item_viewset,
+    office_viewset,
     person_viewset,
+    sponsor_viewset,
     testimonial_viewset,
     team_member_viewset,
 )
+from home.models import HomePage, Location, Testimonial
 
 from wagtail.snippets.models import register_snippet
 
@@ -18,4 +24,24 @@ def register_team_member_viewset():
     return team_member_viewset
 
 
+@hooks.register("register_admin_viewset")
+def register_office_viewset():
+    return office_viewset
+
+
+@hooks.register("register_admin_viewset")
+def register_gallery_item_viewset():
+    return gallery_item_viewset
+
+
 register_snippet(person_viewset)
+register_snippet(event_viewset)
+register_snippet(sponsor_viewset)
+
+
+@register_purge_targets(Testimonial)
+def testimonial_pages(model, pks):
+    return HomePage.objects.live()
+
+
+register_purge_targets(Location, "http://localhost/locations/")
@@ -0,0 +1,74 @@
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from home.admin_views import team_member_viewset
+from home.models import TeamMember, Testimonial
+from wagtail.log_actions import registry
+from wagtail.models import ModelLogEntry
+from wagtail.test.utils import WagtailTestUtils
+
+from wagtail_orderable_viewset.audit import REORDER_ACTION
+
+
+class ReorderAuditLogTests(WagtailTestUtils, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.user = self.login()
+        self.pks = [
+            Testimonial.objects.create(
+                name=f"T{i}", company="Co", content="x", rating=5
+            ).pk
+            for i in range(30)
+        ]
+
+    def reorder_entries(self):
+        return ModelLogEntry.objects.filter(action=REORDER_ACTION)
+
+    def test_one_entry_per_operation(self):
+        with CaptureQueriesContext(connection) as ctx:
+            self.client.post(
+                "/admin/testimonial/update-order/", {"object_ids[]": self.pks[::-1]}
+            )
+        inserts = [
+            q
+            for q in ctx.captured_queries
+            if q["sql"].startswith('INSERT INTO "wagtailcore_modellogentry"')
+        ]
+        self.assertEqual(len(inserts), 1)
+
+        entry = self.reorder_entries().get()
+        self.assertEqual(entry.user, self.user)
+        self.assertEqual(entry.label, "testimonials")
+        self.assertEqual(entry.data["operation"], "order")
+        self.assertEqual(entry.data["count"], 30)
+        self.assertEqual(len(entry.data["pks"]), 20)
+        self.assertEqual(
+            registry.get_formatter(entry).format_message(entry), "Reordered 30 items"
+        )
+
+    def test_undo_and_move_are_logged(self):
+        self.client.post(
+            "/admin/testimonial/move-order/",
+            {"object_ids[]": [self.pks[-1]], "move": "first"},
+        )
+        self.client.post("/admin/testimonial/undo-order/")
+        self.assertEqual(
+            [entry.data["operation"] for entry in self.reorder_entries()],
+            ["undo", "move"],
+        )
+
+    def test_unchanged_order_is_not_logged(self):
+        self.client.post("/admin/testimonial/update-order/", {"object_ids[]": self.pks})
+        self.assertFalse(self.reorder_entries().exists())
+
+    def test_can_be_disabled(self):
+        pks = [
+            TeamMember.objects.create(name=name, position="Dev", bio="x").pk
+            for name in ["Abe", "Bea"]
+        ]
+        team_member_viewset.order_audit_log_enabled = False
+        self.addCleanup(delattr, team_member_viewset, "order_audit_log_enabled")
+        self.client.post(
+            "/admin/team_member/update-order/", {"object_ids[]": pks[::-1]}
+        )
+        self.assertFalse(self.reorder_entries().exists())
@@ -0,0 +1,93 @@
+from django.test import SimpleTestCase, TestCase
+from home.models import Testimonial
+from wagtail.test.utils import WagtailTestUtils
+
+from wagtail_orderable_viewset.ordering import move_block
+
+
+class MoveBlockTests(SimpleTestCase):
+    order = ("1", "2", "3", "4", "5", "6")
+
+    def test_first_and_last(self):
+        self.assertEqual(
+            move_block(self.order, ["5", "2"], "first"), ["2", "5", "1", "3", "4", "6"]
+        )
+        self.assertEqual(
+            move_block(self.order, ["1", "3"], "last"), ["2", "4", "5", "6", "1", "3"]
+        )
+
+    def test_to_position(self):
+        self.assertEqual(
+            move_block(self.order, ["6"], "to", 2), ["1", "6", "2", "3", "4", "5"]
+        )
+        self.assertEqual(
+            move_block(self.order, ["1"], "to", 99), ["2", "3", "4", "5", "6", "1"]
+        )
+
+    def test_by_places(self):
+        self.assertEqual(
+            move_block(self.order, ["3", "4"], "by", -1), ["1", "3", "4", "2", "5", "6"]
+        )
+        self.assertEqual(
+            move_block(self.order, ["3", "4"], "by", 2), ["1", "2", "5", "6", "3", "4"]
+        )
+        self.assertEqual(
+            move_block(self.order, ["2"], "by", -5), ["2", "1", "3", "4", "5", "6"]
+        )
+
+    def test_unknown_ids_are_ignored(self):
+        self.assertEqual(move_block(self.order, ["9"], "first"), list(self.order))
+
+
+class MoveOrderViewTests(WagtailTestUtils, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.login()
+        self.items = [
+            Testimonial.objects.create(name=name, company="Co", content="x")
+            for name in "ABCDE"
+        ]
+
+    def current_order(self):
+        return "".join(
+            Testimonial.objects.order_by("sort_order").values_list("name", flat=True)
+        )
+
+    def test_batch_move_is_one_request(self):
+        _, b, _, d, e = self.items
+        resp = self.client.post(
+            "/admin/testimonial/move-order/",
+            {"object_ids": [d.pk, b.pk], "move": "first"},
+        )
+        self.assertJSONEqual(resp.content.decode(), {"success": True, "moved": 2})
+        self.assertEqual(self.current_order(), "BDACE")
+
+        self.client.post(
+            "/admin/testimonial/move-order/",
+            {"object_ids": [b.pk, d.pk], "move": "by", "value": 2},
+        )
+        self.assertEqual(self.current_order(), "ACBDE")
+
+        self.client.post(
+            "/admin/testimonial/move-order/",
+            {"object_ids": [e.pk], "move": "to", "value": 1},
+        )
+        self.assertEqual(self.current_order(), "EACBD")
+
+    def test_invalid_requests(self):
+        resp = self.client.post("/admin/testimonial/move-order/", {"move": "sideways"})
+        self.assertEqual(resp.status_code, 400)
+        resp = self.client.post(
+            "/admin/testimonial/move-order/", {"move": "to", "value": "x"}
+        )
+        self.assertEqual(resp.status_code, 400)
+
+    def test_invalid_ids(self):
+        for url in ("move-order/", "update-order/"):
+            resp = self.client.post(
+                "/admin/testimonial/" + url,
+                {"object_ids[]": [self.items[0].pk, "abc"], "move": "first"},
+            )
+            self.assertEqual(resp.status_code, 400)
+            self.assertEqual(resp.json()["error"], "Invalid object ID: 'abc'")
+        self.assertEqual(self.current_order(), "ABCDE")
@@ -0,0 +1,128 @@
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Permission
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from home.admin_views import gallery_item_viewset
+from home.models import HomePage, HomePageGalleryItem
+from wagtail.models import Page
+from wagtail.test.utils import WagtailTestUtils
+
+BASE_URL = "/admin/gallery_item/"
+
+
+class OrderableChildViewSetTests(WagtailTestUtils, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.login()
+        site_root = Page.objects.get(depth=2)
+        self.page = site_root.add_child(instance=HomePage(title="Gallery"))
+        self.other = site_root.add_child(instance=HomePage(title="Other"))
+        for page in (self.page, self.other):
+            for index, caption in enumerate("ABC", start=1):
+                HomePageGalleryItem.objects.create(
+                    page=page, caption=caption, sort_order=index
+                )
+
+    def order(self, page):
+        return list(
+            page.gallery_items.order_by("sort_order").values_list("caption", flat=True)
+        )
+
+    def ids(self, page, captions):
+        items = dict(page.gallery_items.values_list("caption", "pk"))
+        return [items[caption] for caption in captions]
+
+    def test_order_view_lists_children_of_parent(self):
+        url = gallery_item_viewset.get_order_url(self.page)
+        self.assertEqual(url, f"{BASE_URL}order/?parent={self.page.pk}")
+        resp = self.client.get(url)
+        self.assertEqual(
+            [obj.pk for obj in resp.context["object_list"]], self.ids(self.page, "ABC")
+        )
+        self.assertContains(resp, f'data-scope="parent={self.page.pk}"')
+        self.assertContains(resp, f"/admin/pages/{self.page.pk}/edit/")
+
+    def test_reorder_skips_form_save(self):
+        with CaptureQueriesContext(connection) as ctx:
+            resp = self.client.post(
+                BASE_URL + "update-order/",
+                {"parent": self.page.pk, "object_ids[]": self.ids(self.page, "CAB")},
+            )
+        self.assertEqual(resp.json()["success"], True)
+        self.assertEqual(self.order(self.page), ["C", "A", "B"])
+        self.assertEqual(self.order(self.other), ["A", "B", "C"])
+
+        updates = [q for q in ctx.captured_queries if q["sql"].startswith("UPDATE")]
+        self.assertEqual(len(updates), 1)
+        # Without a pending draft the page's revisions are left alone
+        self.assertFalse(
+            any("wagtailcore_revision" in q["sql"] for q in ctx.captured_queries)
+        )
+
+    def test_undo_is_kept_per_parent(self):
+        for page in (self.page, self.other):
+            self.client.post(
+                BASE_URL + "update-order/",
+                {"parent": page.pk, "object_ids[]": self.ids(page, "CAB")},
+            )
+        resp = self.client.post(BASE_URL + "undo-order/", {"parent": self.page.pk})
+        self.assertEqual(resp.json()["undone"], 1)
+        self.assertEqual(self.order(self.page), ["A", "B", "C"])
+        self.assertEqual(self.order(self.other), ["C", "A", "B"])
+
+    def test_ids_of_other_parents_are_ignored(self):
+        self.client.post(
+            BASE_URL + "update-order/",
+            {"parent": self.page.pk, "object_ids[]": self.ids(self.other, "CBA")},
+        )
+        self.assertEqual(self.order(self.other), ["A", "B", "C"])
+
+    def test_parent_is_required(self):
+        self.assertEqual(self.client.get(BASE_URL + "order/").status_code, 404)
+        resp = self.client.post(
+            BASE_URL + "move-order/", {"parent": "nope", "move": "first"}
+        )
+        self.assertEqual(resp.status_code, 404)
+
+    def test_reorder_updates_pending_draft(self):
+        self.page.title = "Gallery (draft)"
+        revision = self.page.save_revision()
+        self.assertTrue(HomePage.objects.get(pk=self.page.pk).has_unpublished_changes)
+
+        self.client.post(
+            BASE_URL + "update-order/",
+            {"parent": self.page.pk, "object_ids[]": self.ids(self.page, "CAB")},
+        )
+        self.assertEqual(self.order(self.page), ["C", "A", "B"])
+        revision.refresh_from_db()
+        self.assertEqual(
+            [item["caption"] for item in revision.content["gallery_items"]],
+            ["C", "A", "B"],
+        )
+
+        # Publishing the draft keeps the new order
+        revision.publish()
+        self.assertEqual(self.order(self.page), ["C", "A", "B"])
+        self.assertEqual(HomePage.objects.get(pk=self.page.pk).title, "Gallery (draft)")
+
+    def test_parent_edit_permission_is_required(self):
+        user = get_user_model().objects.create_user(
+            username="viewer", email="viewer@example.com", password="password"
+        )
+        user.user_permissions.add(
+            Permission.objects.get(
+                content_type__app_label="wagtailadmin", codename="access_admin"
+            )
+        )
+        self.client.force_login(user)
+
+        resp = self.client.get(gallery_item_viewset.get_order_url(self.page))
+        self.assertRedirects(resp, "/admin/")
+        resp = self.client.post(
+            BASE_URL + "update-order/",
+            {"parent": self.page.pk, "object_ids[]": self.ids(self.page, "CAB")},
+            headers={"x-requested-with": "XMLHttpRequest"},
+        )
+        self.assertEqual(resp.status_code, 403)
+        self.assertEqual(self.order(self.page), ["A", "B", "C"])
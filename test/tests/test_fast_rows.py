@@ -0,0 +1,56 @@
+import re
+from unittest import mock
+
+from django.template.loader import render_to_string
+from django.test import TestCase
+from home.admin_views import team_member_viewset, testimonial_viewset
+from home.models import TeamMember, Testimonial
+from wagtail.test.utils import WagtailTestUtils
+
+from wagtail_orderable_viewset.rendering import OrderRowRenderer
+
+
+def get_list(resp):
+    return re.search(
+        r'<ul class="listing__list".*?</ul>', resp.content.decode(), re.DOTALL
+    ).group(0)
+
+
+class FastRowsTests(WagtailTestUtils, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.login()
+        for name in ["<b>Ann</b>", "Bo & 'Co'", '"100%"']:
+            Testimonial.objects.create(name=name, company="X", content="c")
+        TeamMember.objects.create(name="Alice", position="<Eng>", bio="x")
+
+    def assertSameRows(self, url, viewset):
+        fast = self.client.get(url)
+        self.assertIn("order_rows_html", fast.context)
+        with mock.patch.object(viewset, "order_fast_rows", False):
+            slow = self.client.get(url)
+        self.assertNotIn("order_rows_html", slow.context)
+        self.assertEqual(get_list(fast), get_list(slow))
+
+    def test_matches_template_rendering(self):
+        self.assertSameRows("/admin/testimonial/order/", testimonial_viewset)
+
+    def test_matches_template_rendering_with_sort_values(self):
+        self.assertSameRows("/admin/team_member/order/", team_member_viewset)
+
+    def test_escapes_titles(self):
+        resp = self.client.get("/admin/testimonial/order/")
+        self.assertContains(resp, "&lt;b&gt;Ann&lt;/b&gt; - X")
+        self.assertContains(resp, "Bo &amp; &#x27;Co&#x27; - X")
+        self.assertContains(resp, "&quot;100%&quot; - X")
+        self.assertNotContains(resp, "<b>Ann</b>")
+
+    def test_renders_fragment_once(self):
+        with mock.patch(
+            "wagtail_orderable_viewset.rendering.render_to_string",
+            wraps=render_to_string,
+        ) as render:
+            OrderRowRenderer(team_member_viewset.order_row_template_name).render(
+                Testimonial.objects.all()
+            )
+        render.assert_called_once()
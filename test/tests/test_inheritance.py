@@ -0,0 +1,86 @@
+from django.core.exceptions import ValidationError
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from home.models import Location, Office, TeamMember, Testimonial
+from wagtail.test.utils import WagtailTestUtils
+
+from wagtail_orderable_viewset.viewsets import OrderableModelViewSet
+
+
+class MultiTableInheritanceTests(WagtailTestUtils, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.login()
+
+    def test_reorder_writes_parent_table_directly(self):
+        a = Office.objects.create(name="A", city="London")
+        b = Office.objects.create(name="B", city="Leeds")
+        c = Office.objects.create(name="C", city="York")
+
+        with CaptureQueriesContext(connection) as ctx:
+            resp = self.client.post(
+                "/admin/office/update-order/", {"object_ids": [c.pk, a.pk, b.pk]}
+            )
+        self.assertJSONEqual(resp.content.decode(), {"success": True, "updated": 3})
+
+        updates = [
+            q["sql"] for q in ctx.captured_queries if q["sql"].startswith("UPDATE")
+        ]
+        location_updates = [sql for sql in updates if '"home_location"' in sql]
+        self.assertEqual(len(location_updates), 1)
+        self.assertNotIn("home_office", location_updates[0])
+
+        self.assertEqual(
+            list(
+                Location.objects.order_by("sort_order").values_list("name", flat=True)
+            ),
+            ["C", "A", "B"],
+        )
+
+
+class CombinedOrderingTests(TestCase):
+    class CombinedViewSet(OrderableModelViewSet):
+        model = Testimonial
+        order_extra_models = (TeamMember,)
+        order_history_enabled = False
+
+    def test_orders_objects_across_models(self):
+        t1 = Testimonial.objects.create(name="T1", company="Co", content="x")
+        t2 = Testimonial.objects.create(name="T2", company="Co", content="x")
+        m1 = TeamMember.objects.create(name="M1", position="Dev", bio="")
+        viewset = self.CombinedViewSet("combined")
+
+        viewset.apply_order(
+            [
+                f"home.teammember:{m1.pk}",
+                f"home.testimonial:{t2.pk}",
+                f"home.testimonial:{t1.pk}",
+            ]
+        )
+
+        objects = viewset.get_order_objects()
+        self.assertEqual(
+            [str(o.order_key) for o in objects],
+            [
+                f"home.teammember:{m1.pk}",
+                f"home.testimonial:{t2.pk}",
+                f"home.testimonial:{t1.pk}",
+            ],
+        )
+        self.assertEqual([o.sort_order for o in objects], [1, 2, 3])
+
+    def test_clean_order_ids(self):
+        viewset = self.CombinedViewSet("combined")
+        self.assertEqual(
+            viewset.clean_order_ids(["home.teammember:01", "home.testimonial:2"]),
+            ["home.teammember:1", "home.testimonial:2"],
+        )
+        for key in ["home.teammember:x", "home.office:1", "1"]:
+            with self.assertRaises(ValidationError):
+                viewset.clean_order_ids([key])
+
+    def test_undo_is_not_offered(self):
+        viewset = self.CombinedViewSet("combined")
+        viewset.order_history_enabled = True
+        self.assertFalse(viewset.is_order_undoable())
@@ -0,0 +1,100 @@
+from django.test import TestCase
+from home.models import Event, Office
+from wagtail.test.utils import WagtailTestUtils
+
+from wagtail_orderable_viewset.models import OrderHistory, OrderRevision
+from wagtail_orderable_viewset.ordering import get_page_order_changes, splice_order
+
+
+class PageOrderTests(WagtailTestUtils, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.login()
+        self.offices = {
+            name: Office.objects.create(name=name, city="X") for name in "ABCDE"
+        }
+
+    def order(self):
+        return "".join(
+            Office.objects.order_by("sort_order").values_list("name", flat=True)
+        )
+
+    def ids(self, names):
+        return [self.offices[name].pk for name in names]
+
+    def test_listing_shows_handles_only_when_sorted_by_sort_order(self):
+        resp = self.client.get("/admin/office/")
+        self.assertContains(resp, 'id="orderable-listing"')
+        self.assertContains(resp, "/admin/office/page-order/")
+        self.assertNotContains(resp, "orderable-listing-handle")
+
+        resp = self.client.get("/admin/office/?ordering=sort_order")
+        self.assertContains(resp, 'class="orderable-listing-handle"', count=5)
+
+    def test_listing_without_inline_mode(self):
+        resp = self.client.get("/admin/team_member/")
+        self.assertNotContains(resp, 'id="orderable-listing"')
+
+    def test_page_reorder_keeps_other_pages_in_place(self):
+        # Page two of a listing showing two rows per page holds C and D
+        resp = self.client.post(
+            "/admin/office/page-order/", {"object_ids[]": self.ids("DC")}
+        )
+        self.assertJSONEqual(resp.content.decode(), {"success": True, "updated": 2})
+        self.assertEqual(self.order(), "ABDCE")
+        values = dict(Office.objects.values_list("name", "sort_order"))
+        self.assertEqual((values["D"], values["C"]), (3, 4))
+        self.assertEqual(OrderHistory.objects.count(), 1)
+
+    def test_filtered_rows_swap_their_own_values(self):
+        self.client.post("/admin/office/page-order/", {"object_ids[]": self.ids("EBA")})
+        self.assertEqual(self.order(), "EBCDA")
+
+    def test_duplicate_values_fall_back_to_full_order(self):
+        Office.objects.filter(pk__in=self.ids("BC")).update(sort_order=2)
+        self.client.post("/admin/office/page-order/", {"object_ids[]": self.ids("CB")})
+        self.assertEqual(
+            list(
+                Office.objects.order_by("sort_order").values_list(
+                    "sort_order", flat=True
+                )
+            ),
+            [1, 2, 3, 4, 5],
+        )
+        self.assertEqual(self.order()[1:3], "CB")
+
+    def test_object_ids_are_required(self):
+        resp = self.client.post("/admin/office/page-order/")
+        self.assertEqual(resp.status_code, 400)
+
+    def test_invalid_object_ids(self):
+        resp = self.client.post(
+            "/admin/office/page-order/", {"object_ids[]": [*self.ids("B"), "abc"]}
+        )
+        self.assertEqual(resp.status_code, 400)
+        self.assertEqual(resp.json()["error"], "Invalid object ID: 'abc'")
+
+    def test_drafts_are_spliced_into_the_draft_order(self):
+        events = {name: Event.objects.create(name=name) for name in "ABC"}
+        self.client.post(
+            "/admin/snippets/home/event/page-order/",
+            {"object_ids[]": [events["C"].pk, events["A"].pk]},
+        )
+        self.assertEqual(
+            OrderRevision.objects.draft_for(Event).object_ids,
+            [str(events[name].pk) for name in "CBA"],
+        )
+
+
+class PageOrderHelperTests(TestCase):
+    def test_splice_order(self):
+        self.assertEqual(
+            splice_order([1, 2, 3, 4, 5], [4, 2, 9]), ["1", "4", "3", "2", "5"]
+        )
+
+    def test_get_page_order_changes_ignores_unknown_ids(self):
+        offices = [Office.objects.create(name=name, city="X") for name in "AB"]
+        changes = get_page_order_changes(
+            Office.objects.all(), "sort_order", [offices[1].pk, 999, offices[0].pk]
+        )
+        self.assertEqual(changes, [(offices[1].pk, 2, 1), (offices[0].pk, 1, 2)])
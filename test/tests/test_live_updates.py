@@ -0,0 +1,115 @@
+import json
+from unittest import mock
+
+from django.core.cache import caches
+from django.test import TestCase
+from home.admin_views import event_viewset, team_member_viewset
+from home.models import Event, TeamMember
+from wagtail.test.utils import WagtailTestUtils
+
+from wagtail_orderable_viewset.events import (
+    RELOAD_EVENT,
+    CacheOrderEventBroker,
+    InProcessOrderEventBroker,
+)
+
+BASE_URL = "/admin/team_member/"
+
+
+class LiveUpdateTests(WagtailTestUtils, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.login()
+        self.items = [
+            TeamMember.objects.create(name=name, position="Eng", bio="x")
+            for name in "ABC"
+        ]
+        self.broker = team_member_viewset.get_order_event_broker()
+        self.channel = team_member_viewset.get_order_event_channel()
+        self.last_id = self.broker.last_event_id(self.channel)
+
+    def read_stream(self, viewset=team_member_viewset, url=BASE_URL, **params):
+        with mock.patch.object(viewset, "order_event_stream_timeout", 0.05):
+            resp = self.client.get(url + "order-events/", params)
+            self.assertEqual(resp["Content-Type"], "text/event-stream")
+            return b"".join(resp.streaming_content).decode()
+
+    def test_reorder_publishes_changed_values_on_commit(self):
+        a, b, c = self.items
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(
+                BASE_URL + "update-order/", {"object_ids[]": [c.pk, a.pk, b.pk]}
+            )
+
+        [(event_id, event)] = self.broker.listen(self.channel, self.last_id, 0)
+        self.assertEqual(event["operation"], "order")
+        self.assertCountEqual(
+            event["changes"], [[str(c.pk), 1], [str(a.pk), 2], [str(b.pk), 3]]
+        )
+
+        stream = self.read_stream(after=self.last_id)
+        self.assertIn(f"id: {event_id}\ndata: {json.dumps(event)}\n\n", stream)
+        # A browser reconnecting after that event gets keep-alives only
+        self.assertNotIn("data:", self.read_stream(after=event_id))
+
+    def test_rolled_back_reorder_publishes_nothing(self):
+        with self.captureOnCommitCallbacks(execute=False) as callbacks:
+            team_member_viewset.publish_order_event({"operation": "order"})
+        self.assertEqual(len(callbacks), 1)
+        self.assertEqual(self.broker.last_event_id(self.channel), self.last_id)
+
+    def test_order_view_renders_values_and_stream_position(self):
+        resp = self.client.get(BASE_URL + "order/")
+        self.assertContains(resp, f'data-events-url="{BASE_URL}order-events/"')
+        self.assertContains(resp, f'data-last-event-id="{self.last_id}"')
+        self.assertContains(resp, f'data-id="{self.items[1].pk}" data-value="2"')
+
+    def test_draft_reorders_publish_the_full_order(self):
+        events = [Event.objects.create(name=name) for name in "AB"]
+        channel = event_viewset.get_order_event_channel()
+        last_id = self.broker.last_event_id(channel)
+        with (
+            mock.patch.object(event_viewset, "order_live_updates_enabled", True),
+            self.captureOnCommitCallbacks(execute=True),
+        ):
+            self.client.post(
+                "/admin/snippets/home/event/update-order/",
+                {"object_ids[]": [events[1].pk, events[0].pk]},
+            )
+        [(_, event)] = self.broker.listen(channel, last_id, 0)
+        self.assertEqual(
+            event,
+            {"operation": "order", "order": [str(events[1].pk), str(events[0].pk)]},
+        )
+
+    def test_stream_is_not_found_when_disabled(self):
+        resp = self.client.get("/admin/office/order-events/")
+        self.assertEqual(resp.status_code, 404)
+
+
+class BrokerTests(TestCase):
+    def test_in_process_broker(self):
+        broker = InProcessOrderEventBroker(history_size=2)
+        self.assertEqual(broker.listen("c", 0, timeout=0), [])
+        ids = [broker.publish("c", {"n": n}) for n in range(3)]
+        self.assertEqual(ids, [1, 2, 3])
+        self.assertEqual(
+            broker.listen("c", 1, timeout=0), [(2, {"n": 1}), (3, {"n": 2})]
+        )
+        # Event 1 has been trimmed, and a listener ahead of the broker is stale
+        self.assertEqual(broker.listen("c", 0, timeout=0), [(3, RELOAD_EVENT)])
+        self.assertEqual(broker.listen("c", 7, timeout=0), [(3, RELOAD_EVENT)])
+        self.assertEqual(broker.last_event_id("other"), 0)
+
+    def test_cache_broker(self):
+        broker = CacheOrderEventBroker(poll_interval=0.01)
+        caches["default"].clear()
+        self.assertEqual(broker.listen("c", 0, timeout=0.02), [])
+        broker.publish("c", {"n": 0})
+        broker.publish("c", {"n": 1})
+        self.assertEqual(
+            broker.listen("c", 0, timeout=0), [(1, {"n": 0}), (2, {"n": 1})]
+        )
+
+        caches["default"].delete("c:2")
+        self.assertEqual(broker.listen("c", 1, timeout=0), [(2, RELOAD_EVENT)])
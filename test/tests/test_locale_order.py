@@ -0,0 +1,201 @@
+import os
+import tempfile
+from io import StringIO
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.db.models import F
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from home.admin_views import sponsor_viewset
+from home.models import Sponsor
+from wagtail.models import Locale
+from wagtail.test.utils import WagtailTestUtils
+
+from wagtail_orderable_viewset.locks import OrderLock
+from wagtail_orderable_viewset.models import OrderHistory
+
+BASE_URL = "/admin/snippets/home/sponsor/"
+
+
+@override_settings(
+    LANGUAGE_CODE="en",
+    WAGTAIL_I18N_ENABLED=True,
+    WAGTAIL_CONTENT_LANGUAGES=[("en", "English"), ("fr", "French"), ("de", "German")],
+)
+class LocaleOrderTests(WagtailTestUtils, TestCase):
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        self.addCleanup(cache.clear)
+        self.login()
+        Locale.objects.update(language_code="en")
+        self.en = Locale.objects.get(language_code="en")
+        self.fr = Locale.objects.create(language_code="fr")
+        self.de = Locale.objects.create(language_code="de")
+        self.sponsors = {name: Sponsor.objects.create(name=name) for name in "ABC"}
+        for locale in (self.fr, self.de):
+            for sponsor in self.sponsors.values():
+                sponsor.copy_for_translation(locale).save()
+
+    def order(self, locale):
+        return list(
+            Sponsor.objects.filter(locale=locale)
+            .order_by("sort_order")
+            .values_list("name", flat=True)
+        )
+
+    def ids(self, locale, names):
+        return [Sponsor.objects.get(locale=locale, name=name).pk for name in names]
+
+    def test_each_locale_has_its_own_order(self):
+        resp = self.client.get(BASE_URL + "order/?locale=fr")
+        self.assertEqual(
+            [obj.locale_id for obj in resp.context["object_list"]], [self.fr.pk] * 3
+        )
+        self.assertContains(resp, 'data-scope="locale=fr"')
+
+        self.client.post(
+            BASE_URL + "update-order/",
+            {"locale": "fr", "object_ids[]": self.ids(self.fr, "CBA")},
+        )
+        self.assertEqual(self.order(self.fr), ["C", "B", "A"])
+        self.assertEqual(self.order(self.en), ["A", "B", "C"])
+        self.assertEqual(self.order(self.de), ["A", "B", "C"])
+
+        # Requests without a locale act on the default locale
+        self.client.post(
+            BASE_URL + "move-order/",
+            {"object_ids[]": self.ids(self.en, "C"), "move": "first"},
+        )
+        self.assertEqual(self.order(self.en), ["C", "A", "B"])
+        self.assertEqual(self.order(self.fr), ["C", "B", "A"])
+
+    def test_sync_to_all_locales_is_one_update(self):
+        self.client.post(
+            BASE_URL + "update-order/", {"object_ids[]": self.ids(self.en, "BCA")}
+        )
+        with CaptureQueriesContext(connection) as ctx:
+            resp = self.client.post(BASE_URL + "sync-order/", {"locale": "en"})
+        self.assertJSONEqual(resp.content.decode(), {"success": True, "updated": 6})
+        updates = [
+            q
+            for q in ctx.captured_queries
+            if q["sql"].startswith('UPDATE "home_sponsor"')
+        ]
+        self.assertEqual(len(updates), 1)
+        self.assertEqual(self.order(self.fr), ["B", "C", "A"])
+        self.assertEqual(self.order(self.de), ["B", "C", "A"])
+
+        # Translations only sort together with their source rows
+        en_values = dict(
+            Sponsor.objects.filter(locale=self.en).values_list(
+                "translation_key", "sort_order"
+            )
+        )
+        for key, value in Sponsor.objects.filter(locale=self.fr).values_list(
+            "translation_key", "sort_order"
+        ):
+            self.assertEqual(value, en_values[key])
+
+    def test_unknown_locale_is_404(self):
+        resp = self.client.get(BASE_URL + "order/?locale=xx")
+        self.assertEqual(resp.status_code, 404)
+
+    def test_per_locale_ordering_is_opt_in(self):
+        with mock.patch.object(sponsor_viewset, "order_per_locale", False):
+            resp = self.client.get(BASE_URL + "order/?locale=fr")
+        self.assertEqual(len(resp.context["object_list"]), 9)
+        self.assertNotIn("order_locales", resp.context)
+
+    def test_sync_requires_locale_ordering(self):
+        resp = self.client.post("/admin/testimonial/sync-order/")
+        self.assertEqual(resp.status_code, 400)
+
+    def test_sync_is_rejected_for_draft_orders(self):
+        with mock.patch.object(sponsor_viewset, "order_drafts_enabled", True):
+            resp = self.client.get(BASE_URL + "order/")
+            self.assertNotContains(resp, 'id="orderable-sync-locales"')
+            resp = self.client.post(BASE_URL + "sync-order/", {"locale": "en"})
+        self.assertEqual(resp.status_code, 400)
+
+    def test_history_is_kept_per_locale(self):
+        self.client.post(
+            BASE_URL + "update-order/",
+            {"locale": "fr", "object_ids[]": self.ids(self.fr, "CBA")},
+        )
+        self.client.post(
+            BASE_URL + "update-order/", {"object_ids[]": self.ids(self.en, "BCA")}
+        )
+
+        # Undoing in French reverts the French reorder, not the later English one
+        self.client.post(BASE_URL + "undo-order/", {"locale": "fr"})
+        self.assertEqual(self.order(self.fr), ["A", "B", "C"])
+        self.assertEqual(self.order(self.en), ["B", "C", "A"])
+
+        resp = self.client.post(BASE_URL + "undo-order/", {"locale": "fr"})
+        self.assertEqual(resp.json()["undone"], 0)
+
+        # Copying the order is recorded in each locale it changed
+        self.client.post(BASE_URL + "sync-order/", {"locale": "en"})
+        self.client.post(BASE_URL + "undo-order/", {"locale": "de"})
+        self.assertEqual(self.order(self.de), ["A", "B", "C"])
+        self.assertEqual(self.order(self.fr), ["B", "C", "A"])
+
+    def test_compaction_clears_only_its_locale_history(self):
+        for locale in (self.en, self.fr):
+            self.client.post(
+                BASE_URL + "update-order/",
+                {
+                    "locale": locale.language_code,
+                    "object_ids[]": self.ids(locale, "CBA"),
+                },
+            )
+        Sponsor.objects.filter(locale=self.fr).update(sort_order=F("sort_order") * 10)
+        with mock.patch.object(sponsor_viewset, "order_compact_in_background", False):
+            self.assertTrue(sponsor_viewset.apply_compaction(scope=self.fr))
+        self.assertFalse(
+            OrderHistory.objects.for_model(Sponsor, scope=self.fr).exists()
+        )
+        self.assertTrue(OrderHistory.objects.for_model(Sponsor, scope=self.en).exists())
+
+    def test_lock_is_per_locale(self):
+        other = get_user_model().objects.create_superuser(
+            username="other", email="other@example.com", password="password"
+        )
+        with OrderLock(sponsor_viewset.get_order_lock_key(self.en), other):
+            resp = self.client.post(
+                BASE_URL + "update-order/",
+                {"locale": "fr", "object_ids[]": self.ids(self.fr, "CBA")},
+            )
+            self.assertEqual(resp.status_code, 200)
+            resp = self.client.post(
+                BASE_URL + "update-order/", {"object_ids[]": self.ids(self.en, "CBA")}
+            )
+            self.assertEqual(resp.status_code, 409)
+            # Syncing writes every locale, so it waits for all of their locks
+            resp = self.client.post(BASE_URL + "sync-order/", {"locale": "fr"})
+            self.assertEqual(resp.status_code, 409)
+        self.assertEqual(self.order(self.en), ["A", "B", "C"])
+
+    def test_import_command_writes_one_locale(self):
+        pks = dict(Sponsor.objects.filter(locale=self.fr).values_list("name", "pk"))
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "order.csv")
+            with open(path, "w") as f:
+                f.write(f"key,sort_order\n{pks['A']},10\n")
+            call_command(
+                "import_ordering",
+                "home.Sponsor",
+                path,
+                "--locale=fr",
+                stdout=StringIO(),
+            )
+        self.assertEqual(self.order(self.fr), ["B", "C", "A"])
+        self.assertEqual(self.order(self.en), ["A", "B", "C"])
+        self.assertEqual(
+            OrderHistory.objects.for_model(Sponsor, scope=self.fr).count(), 1
+        )
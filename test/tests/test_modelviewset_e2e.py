@@ -1,6 +1,12 @@
+from unittest import mock
+
 from django.test import TestCase
+from wagtail.admin.views.generic import IndexView
 from wagtail.test.utils import WagtailTestUtils
+from home.admin_views import testimonial_viewset
 from home.models import Testimonial, TeamMember
+from wagtail_orderable_viewset.viewsets import OrderableModelViewSet
+from wagtail_orderable_viewset.views import OrderableIndexViewMixin
 
 class ModelViewsetE2ETests(WagtailTestUtils, TestCase):
     def setUp(self):
@@ -43,3 +49,55 @@ class ModelViewsetE2ETests(WagtailTestUtils, TestCase):
         b.refresh_from_db()
         c.refresh_from_db()
         self.assertEqual([b.sort_order, c.sort_order, a.sort_order], [1, 2, 3])
+
+    def test_order_view_reuses_memoized_urls(self):
+        Testimonial.objects.create(name="Alice", company="Acme", content="x")
+        self.client.get("/admin/testimonial/order/")
+
+        with mock.patch("wagtail_orderable_viewset.viewsets.reverse") as reverse:
+            resp_order = self.client.get("/admin/testimonial/order/")
+
+        self.assertEqual(resp_order.status_code, 200)
+        self.assertIn("/admin/testimonial/update-order/", resp_order.content.decode())
+        reverse.assert_not_called()
+
+    def test_order_view_preloads_self_hosted_sortable(self):
+        Testimonial.objects.create(name="Alice", company="Acme", content="x")
+        content = self.client.get("/admin/testimonial/order/").content.decode()
+
+        self.assertIn('rel="modulepreload"', content)
+        self.assertIn("wagtail_orderable_viewset/js/sortable.esm.min.js?v=", content)
+        self.assertNotIn("cdn.jsdelivr.net", content)
+
+    def test_reorder_button_rendered_in_header_for_two_or_more_objects(self):
+        Testimonial.objects.create(name="Alice", company="Acme", content="x")
+        resp_index = self.client.get("/admin/testimonial/")
+        self.assertFalse(resp_index.context["is_reorderable"])
+        self.assertNotContains(resp_index, 'href="/admin/testimonial/order/"')
+
+        Testimonial.objects.create(name="Bob", company="Beta", content="y")
+        resp_index = self.client.get("/admin/testimonial/")
+        self.assertTrue(resp_index.context["is_reorderable"])
+        self.assertContains(resp_index, "Reorder Testimonials")
+        self.assertNotContains(resp_index, "DOMContentLoaded")
+
+        # The button is re-rendered with the results when searching
+        resp_results = self.client.get("/admin/testimonial/results/?q=Alice")
+        self.assertContains(resp_results, 'href="/admin/testimonial/order/"')
+
+    def test_custom_index_view_gets_the_reorder_button(self):
+        viewset = OrderableModelViewSet(
+            "custom_testimonial", model=Testimonial, index_view_class=IndexView
+        )
+        view_class = viewset.index_view_class
+        self.assertTrue(issubclass(view_class, OrderableIndexViewMixin))
+        self.assertTrue(issubclass(view_class, IndexView))
+        self.assertEqual(view_class.__name__, "IndexView")
+
+    def test_is_reorderable_uses_a_limited_query(self):
+        for name in "ABC":
+            Testimonial.objects.create(name=name, company="Acme", content="x")
+
+        with self.assertNumQueries(1) as ctx:
+            self.assertTrue(testimonial_viewset.is_reorderable())
+        self.assertIn("LIMIT 2", ctx.captured_queries[0]["sql"])
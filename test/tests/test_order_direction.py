@@ -0,0 +1,106 @@
+from unittest import mock
+
+from django.test import SimpleTestCase, TestCase
+from home.admin_views import testimonial_viewset
+from home.models import Testimonial
+from wagtail.test.utils import WagtailTestUtils
+
+from wagtail_orderable_viewset.ordering import get_page_order_changes, merge_ordered
+
+
+class MergeOrderedTests(SimpleTestCase):
+    def test_merges_in_either_direction_with_nulls(self):
+        self.assertEqual(
+            merge_ordered([[1, 4], [None, 2, 3]], key=lambda v: v, nulls_first=True),
+            [None, 1, 2, 3, 4],
+        )
+        self.assertEqual(
+            merge_ordered([[4, 1], [3, 2, None]], key=lambda v: v, descending=True),
+            [4, 3, 2, 1, None],
+        )
+
+
+class OrderDirectionTests(WagtailTestUtils, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.login()
+        self.items = {
+            name: Testimonial.objects.create(name=name, company="Co", content="x")
+            for name in "ABCDE"
+        }
+        patcher = mock.patch.object(testimonial_viewset, "order_descending", True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def listed(self):
+        resp = self.client.get("/admin/testimonial/order/")
+        return "".join(obj.name for obj in resp.context["object_list"])
+
+    def ids(self, names):
+        return [self.items[name].pk for name in names]
+
+    def test_lists_highest_values_first(self):
+        self.assertEqual(self.listed(), "EDCBA")
+        resp = self.client.get("/admin/testimonial/order/")
+        self.assertContains(resp, 'data-descending="true"')
+
+    def test_numbers_from_the_bottom_up(self):
+        self.client.post(
+            "/admin/testimonial/update-order/", {"object_ids[]": self.ids("ABCDE")}
+        )
+        self.assertEqual(self.listed(), "ABCDE")
+        self.assertEqual(Testimonial.objects.get(name="A").sort_order, 5)
+
+    def test_move_first_takes_the_highest_value(self):
+        self.client.post(
+            "/admin/testimonial/move-order/",
+            {"object_ids[]": self.ids("BA"), "move": "first"},
+        )
+        self.assertEqual(self.listed(), "BAEDC")
+        self.assertEqual(Testimonial.objects.get(name="B").sort_order, 7)
+
+    def test_reseed_lists_in_the_requested_order(self):
+        Testimonial.objects.filter(name="C").update(rating=1)
+        self.client.post("/admin/testimonial/reseed-order/", {"ordering": "name"})
+        self.assertEqual(self.listed(), "ABCDE")
+        self.client.post("/admin/testimonial/reseed-order/", {"ordering": "-rating"})
+        self.assertEqual(self.listed(), "ABDEC")
+
+    def test_page_order_reuses_values_from_the_top(self):
+        changes = get_page_order_changes(
+            Testimonial.objects.all(), "sort_order", self.ids("BDC"), descending=True
+        )
+        self.assertEqual(
+            sorted((pk, new) for pk, old, new in changes),
+            sorted(zip(self.ids("BDC"), [4, 3, 2], strict=True)),
+        )
+
+    def test_nulls_position(self):
+        Testimonial.objects.filter(name="C").update(sort_order=None)
+        with mock.patch.object(testimonial_viewset, "order_nulls", "first"):
+            self.assertEqual(self.listed(), "CEDBA")
+        with mock.patch.object(testimonial_viewset, "order_nulls", "last"):
+            self.assertEqual(self.listed(), "EDBAC")
+
+
+class NewSortOrderTests(TestCase):
+    def setUp(self):
+        for name in "AB":
+            Testimonial.objects.create(name=name, company="Co", content="x")
+
+    def create(self):
+        return Testimonial.objects.create(name="New", company="Co", content="x")
+
+    def test_appends_by_default(self):
+        self.assertEqual(self.create().sort_order, 3)
+
+    def test_insert_at_start_uses_the_minimum(self):
+        with mock.patch.object(Testimonial, "sort_order_insert_at_start", True):
+            self.assertEqual(self.create().sort_order, 0)
+            self.assertEqual(self.create().sort_order, -1)
+
+    def test_descending_order_appends_below_the_minimum(self):
+        with mock.patch.object(Testimonial, "sort_order_descending", True):
+            self.assertEqual(self.create().sort_order, 0)
+            with mock.patch.object(Testimonial, "sort_order_insert_at_start", True):
+                self.assertEqual(self.create().sort_order, 3)
@@ -0,0 +1,153 @@
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Permission
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase
+from home.admin_views import event_viewset
+from home.models import Event
+from wagtail.test.utils import WagtailTestUtils
+
+from wagtail_orderable_viewset.models import OrderHistory, OrderRevision
+
+BASE_URL = "/admin/snippets/home/event/"
+
+
+class OrderDraftTests(WagtailTestUtils, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.login()
+        self.events = {name: Event.objects.create(name=name) for name in "ABC"}
+
+    def live_order(self):
+        return list(Event.objects.order_by("sort_order").values_list("name", flat=True))
+
+    def ids(self, names):
+        return [self.events[name].pk for name in names]
+
+    def test_reorder_saves_one_revision_without_touching_live_rows(self):
+        resp = self.client.post(
+            BASE_URL + "update-order/", {"object_ids[]": self.ids("CAB")}
+        )
+        self.assertEqual(resp.json()["draft"], True)
+        self.assertEqual(self.live_order(), ["A", "B", "C"])
+        self.assertFalse(OrderHistory.objects.exists())
+
+        draft = OrderRevision.objects.draft_for(Event)
+        self.assertEqual(draft.object_ids, [str(pk) for pk in self.ids("CAB")])
+
+        # Further moves update the same revision, starting from the draft
+        self.client.post(
+            BASE_URL + "move-order/", {"object_ids[]": self.ids("B"), "move": "first"}
+        )
+        self.assertEqual(OrderRevision.objects.count(), 1)
+        draft.refresh_from_db()
+        self.assertEqual(draft.object_ids, [str(pk) for pk in self.ids("BCA")])
+
+    def test_order_view_and_preview_show_draft(self):
+        self.client.post(BASE_URL + "update-order/", {"object_ids[]": self.ids("CAB")})
+        resp = self.client.get(BASE_URL + "order/")
+        self.assertContains(resp, 'id="orderable-draft"')
+        self.assertEqual(
+            [obj.name for obj in resp.context["object_list"]], ["C", "A", "B"]
+        )
+
+        new = Event.objects.create(name="D")
+        preview = OrderRevision.objects.draft_for(Event).apply_to(
+            Event.objects.order_by("sort_order")
+        )
+        self.assertEqual([obj.name for obj in preview], ["C", "A", "B", new.name])
+
+    def test_publish_applies_draft_in_bulk(self):
+        self.client.post(BASE_URL + "update-order/", {"object_ids[]": self.ids("CAB")})
+        resp = self.client.post(BASE_URL + "publish-order/")
+        self.assertJSONEqual(resp.content.decode(), {"success": True, "updated": 3})
+        self.assertEqual(self.live_order(), ["C", "A", "B"])
+        self.assertFalse(OrderRevision.objects.exists())
+        self.assertEqual(OrderHistory.objects.for_model(Event).count(), 1)
+
+        resp = self.client.post(BASE_URL + "publish-order/")
+        self.assertEqual(resp.status_code, 400)
+
+    def test_discard_keeps_live_order(self):
+        self.client.post(BASE_URL + "update-order/", {"object_ids[]": self.ids("CAB")})
+        resp = self.client.post(BASE_URL + "discard-order/")
+        self.assertJSONEqual(
+            resp.content.decode(), {"success": True, "discarded": True}
+        )
+        self.assertEqual(self.live_order(), ["A", "B", "C"])
+        self.assertIsNone(OrderRevision.objects.draft_for(Event))
+
+    def test_reseed_and_import_are_saved_as_drafts(self):
+        with mock.patch.object(event_viewset, "order_reseed_fields", ["-name"]):
+            resp = self.client.post(BASE_URL + "reseed-order/", {"ordering": "-name"})
+        self.assertEqual(resp.json()["draft"], True)
+        self.assertEqual(self.live_order(), ["A", "B", "C"])
+        draft = OrderRevision.objects.draft_for(Event)
+        self.assertEqual(draft.object_ids, [str(pk) for pk in self.ids("CBA")])
+
+        a, b = self.ids("AB")
+        content = f"key,sort_order\n{b},10\n{a},-1\n"
+        resp = self.client.post(
+            BASE_URL + "import-order/",
+            {"file": SimpleUploadedFile("order.csv", content.encode())},
+        )
+        self.assertEqual(resp.json()["draft"], True)
+        self.assertEqual(self.live_order(), ["A", "B", "C"])
+        self.assertFalse(OrderHistory.objects.exists())
+        draft.refresh_from_db()
+        self.assertEqual(draft.object_ids, [str(pk) for pk in self.ids("ACB")])
+
+    def test_undo_is_not_offered(self):
+        self.client.post(BASE_URL + "update-order/", {"object_ids[]": self.ids("CAB")})
+        self.client.post(BASE_URL + "publish-order/")
+        resp = self.client.get(BASE_URL + "order/")
+        self.assertNotContains(resp, 'id="orderable-undo"')
+
+        resp = self.client.post(BASE_URL + "undo-order/")
+        self.assertEqual(resp.status_code, 400)
+        self.assertEqual(self.live_order(), ["C", "A", "B"])
+
+    def test_draft_endpoints_check_permissions(self):
+        user = get_user_model().objects.create_user(
+            username="editor", email="editor@example.com", password="password"
+        )
+        user.user_permissions.add(
+            *Permission.objects.filter(codename__in=["access_admin", "view_event"])
+        )
+        self.client.force_login(user)
+        resp = self.client.post(
+            BASE_URL + "update-order/", {"object_ids[]": self.ids("CAB")}
+        )
+        self.assertEqual(resp.status_code, 403)
+        self.assertIsNone(OrderRevision.objects.draft_for(Event))
+
+        user.user_permissions.add(Permission.objects.get(codename="change_event"))
+        self.client.post(BASE_URL + "update-order/", {"object_ids[]": self.ids("CAB")})
+        self.assertIsNotNone(OrderRevision.objects.draft_for(Event))
+
+        # Saving a draft does not allow publishing it
+        self.assertNotContains(
+            self.client.get(BASE_URL + "order/"), 'id="orderable-publish"'
+        )
+        resp = self.client.post(BASE_URL + "publish-order/")
+        self.assertEqual(resp.status_code, 403)
+        self.assertEqual(self.live_order(), ["A", "B", "C"])
+
+        user.user_permissions.add(Permission.objects.get(codename="publish_event"))
+        resp = self.client.post(BASE_URL + "publish-order/")
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(self.live_order(), ["C", "A", "B"])
+
+    def test_discard_needs_change_permission(self):
+        self.client.post(BASE_URL + "update-order/", {"object_ids[]": self.ids("CAB")})
+        user = get_user_model().objects.create_user(
+            username="viewer", email="viewer@example.com", password="password"
+        )
+        user.user_permissions.add(
+            *Permission.objects.filter(codename__in=["access_admin", "view_event"])
+        )
+        self.client.force_login(user)
+        resp = self.client.post(BASE_URL + "discard-order/")
+        self.assertEqual(resp.status_code, 403)
+        self.assertIsNotNone(OrderRevision.objects.draft_for(Event))
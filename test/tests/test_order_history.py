@@ -0,0 +1,96 @@
+from unittest import mock
+
+from django.test import TestCase
+from home.admin_views import testimonial_viewset
+from home.models import Person, Testimonial
+from wagtail.test.utils import WagtailTestUtils
+
+from wagtail_orderable_viewset.models import OrderHistory
+
+
+class OrderHistoryTests(WagtailTestUtils, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.user = self.login()
+        self.a = Testimonial.objects.create(name="A", company="Co", content="x")
+        self.b = Testimonial.objects.create(name="B", company="Co", content="x")
+        self.c = Testimonial.objects.create(name="C", company="Co", content="x")
+        self.d = Testimonial.objects.create(name="D", company="Co", content="x")
+
+    def reorder(self, *objs):
+        return self.client.post(
+            "/admin/testimonial/update-order/", {"object_ids": [o.pk for o in objs]}
+        )
+
+    def current_order(self):
+        return list(
+            Testimonial.objects.order_by("sort_order").values_list("name", flat=True)
+        )
+
+    def test_reorder_records_only_changed_rows(self):
+        self.reorder(self.a, self.c, self.b, self.d)
+        entry = OrderHistory.objects.for_model(Testimonial).get()
+        self.assertEqual(sorted(entry.changes), [[self.b.pk, 2, 3], [self.c.pk, 3, 2]])
+        self.assertEqual(entry.user, self.user)
+
+    def test_undo_and_redo(self):
+        self.reorder(self.d, self.a, self.b, self.c)
+        self.reorder(self.d, self.c, self.a, self.b)
+        self.assertEqual(self.current_order(), ["D", "C", "A", "B"])
+
+        resp = self.client.post("/admin/testimonial/undo-order/")
+        self.assertJSONEqual(resp.content.decode(), {"success": True, "undone": 1})
+        self.assertEqual(self.current_order(), ["D", "A", "B", "C"])
+
+        resp = self.client.post("/admin/testimonial/undo-order/", {"steps": 5})
+        self.assertJSONEqual(resp.content.decode(), {"success": True, "undone": 1})
+        self.assertEqual(self.current_order(), ["A", "B", "C", "D"])
+
+        resp = self.client.post("/admin/testimonial/redo-order/", {"steps": 2})
+        self.assertJSONEqual(resp.content.decode(), {"success": True, "redone": 2})
+        self.assertEqual(self.current_order(), ["D", "C", "A", "B"])
+
+    def test_new_reorder_discards_redo_stack(self):
+        self.reorder(self.b, self.a, self.c, self.d)
+        self.client.post("/admin/testimonial/undo-order/")
+        self.reorder(self.a, self.b, self.d, self.c)
+
+        resp = self.client.post("/admin/testimonial/redo-order/")
+        self.assertJSONEqual(resp.content.decode(), {"success": True, "redone": 0})
+        self.assertEqual(self.current_order(), ["A", "B", "D", "C"])
+
+    def test_history_is_per_model(self):
+        p1 = Person.objects.create(name="P1", age=1, city="X", team="hr")
+        p2 = Person.objects.create(name="P2", age=2, city="X", team="hr")
+        self.client.post(
+            "/admin/snippets/home/person/update-order/", {"object_ids": [p2.pk, p1.pk]}
+        )
+        resp = self.client.post("/admin/testimonial/undo-order/")
+        self.assertJSONEqual(resp.content.decode(), {"success": True, "undone": 0})
+        self.assertEqual(OrderHistory.objects.for_model(Person).count(), 1)
+
+    def test_history_is_pruned(self):
+        orders = [
+            (self.b, self.a, self.c, self.d),
+            (self.a, self.b, self.c, self.d),
+            (self.c, self.a, self.b, self.d),
+            (self.d, self.c, self.a, self.b),
+        ]
+        entry_ids = []
+        with mock.patch.object(testimonial_viewset, "order_history_limit", 2):
+            for order in orders:
+                self.reorder(*order)
+                entry_ids.append(OrderHistory.objects.latest("pk").pk)
+
+        self.assertEqual(
+            list(
+                OrderHistory.objects.for_model(Testimonial)
+                .order_by("pk")
+                .values_list("pk", flat=True)
+            ),
+            entry_ids[-2:],
+        )
+
+    def test_invalid_steps(self):
+        resp = self.client.post("/admin/testimonial/undo-order/", {"steps": "x"})
+        self.assertEqual(resp.status_code, 400)
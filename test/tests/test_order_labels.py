@@ -0,0 +1,43 @@
+from unittest import mock
+
+from django.test import TestCase
+from home.models import TeamMember
+from wagtail.test.utils import WagtailTestUtils
+
+from wagtail_orderable_viewset.viewsets import OrderRow
+
+
+class OrderLabelTests(WagtailTestUtils, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.login()
+        self.alice = TeamMember.objects.create(name="Alice", position="Eng", bio="x")
+        self.bob = TeamMember.objects.create(name="Bob", position="Ops", bio="y")
+
+    def test_label_maintained_on_save(self):
+        self.assertEqual(self.alice.order_label, "Alice - Eng")
+        self.alice.position = "CTO"
+        self.alice.save(update_fields=["position"])
+        self.alice.refresh_from_db()
+        self.assertEqual(self.alice.order_label, "Alice - CTO")
+
+    def test_order_view_renders_stored_labels_without_instances(self):
+        with mock.patch.object(TeamMember, "__str__", autospec=True) as to_str:
+            resp = self.client.get("/admin/team_member/order/")
+        to_str.assert_not_called()
+        rows = resp.context["object_list"]
+        self.assertTrue(all(isinstance(row, OrderRow) for row in rows))
+        self.assertEqual([row.pk for row in rows], [self.alice.pk, self.bob.pk])
+        self.assertContains(resp, "Alice - Eng")
+        self.assertContains(resp, "Bob - Ops")
+
+    def test_blank_labels_fall_back_to_the_object(self):
+        TeamMember.objects.filter(pk=self.bob.pk).update(order_label="")
+        resp = self.client.get("/admin/team_member/order/")
+        self.assertContains(resp, "Bob - Ops")
+
+    def test_refresh_order_labels(self):
+        TeamMember.objects.filter(pk=self.bob.pk).update(position="Sales")
+        self.assertEqual(TeamMember.refresh_order_labels(), 1)
+        self.bob.refresh_from_db()
+        self.assertEqual(self.bob.order_label, "Bob - Sales")
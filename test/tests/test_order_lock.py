@@ -0,0 +1,92 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+from home.models import TeamMember, Testimonial
+from wagtail.test.utils import WagtailTestUtils
+
+from wagtail_orderable_viewset.locks import OrderLock, OrderLocked
+
+
+class OrderLockTests(WagtailTestUtils, TestCase):
+    lock_key = "wagtail_orderable_viewset:lock:home.testimonial"
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        self.addCleanup(cache.clear)
+        self.a = Testimonial.objects.create(name="A", company="Co", content="x")
+        self.b = Testimonial.objects.create(name="B", company="Co", content="x")
+        self.other = get_user_model().objects.create_superuser(
+            username="other",
+            email="other@example.com",
+            password="password",
+            first_name="Olive",
+            last_name="Other",
+        )
+
+    def reorder(self, *objs):
+        return self.client.post(
+            "/admin/testimonial/update-order/", {"object_ids": [o.pk for o in objs]}
+        )
+
+    def test_lock_is_released_after_save(self):
+        self.login()
+        self.assertEqual(self.reorder(self.b, self.a).status_code, 200)
+        self.assertIsNone(cache.get(self.lock_key))
+
+        self.client.force_login(self.other)
+        self.assertEqual(self.reorder(self.a, self.b).status_code, 200)
+
+    def test_conflicting_save_fails_fast(self):
+        self.login()
+        with OrderLock(self.lock_key, self.other):
+            resp = self.reorder(self.b, self.a)
+            self.assertEqual(resp.status_code, 409)
+            self.assertEqual(resp.json()["locked_by"], "Olive Other")
+
+            resp_order = self.client.get("/admin/testimonial/order/")
+            self.assertContains(resp_order, "Olive Other is currently reordering")
+
+        self.a.refresh_from_db()
+        self.assertEqual(self.a.sort_order, 1)
+
+    def test_lock_is_per_model(self):
+        self.login()
+        member = TeamMember.objects.create(name="M", position="Dev", bio="")
+        with OrderLock(self.lock_key, self.other):
+            resp = self.client.post(
+                "/admin/team_member/update-order/", {"object_ids": [member.pk]}
+            )
+        self.assertEqual(resp.status_code, 200)
+
+    def test_lock_context_manager(self):
+        with OrderLock(self.lock_key, self.other):
+            with self.assertRaises(OrderLocked), OrderLock(self.lock_key, self.login()):
+                pass
+            # A second request of the holder refreshes but doesn't drop the lease
+            token = cache.get(self.lock_key)["token"]
+            with OrderLock(self.lock_key, self.other):
+                pass
+            self.assertEqual(cache.get(self.lock_key)["token"], token)
+        self.assertIsNone(cache.get(self.lock_key))
+
+    def test_holder_can_save_from_a_second_tab(self):
+        user = self.login()
+        with OrderLock(self.lock_key, user):
+            self.assertEqual(self.reorder(self.b, self.a).status_code, 200)
+            resp = self.client.get("/admin/testimonial/order/")
+            self.assertNotContains(resp, "is currently reordering")
+        self.a.refresh_from_db()
+        self.assertEqual(self.a.sort_order, 2)
+
+    def test_release_keeps_a_lease_taken_after_expiry(self):
+        lock = OrderLock(self.lock_key, self.other)
+        self.assertTrue(lock.acquire())
+        # The lease expires and another request of the same user takes it
+        cache.delete(self.lock_key)
+        newer = OrderLock(self.lock_key, self.other)
+        self.assertTrue(newer.acquire())
+        lock.release()
+        self.assertEqual(cache.get(self.lock_key)["token"], newer.token)
+        newer.release()
+        self.assertIsNone(cache.get(self.lock_key))
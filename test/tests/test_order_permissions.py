@@ -0,0 +1,64 @@
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Permission
+from django.test import TestCase
+from home.models import Testimonial
+from wagtail.test.utils import WagtailTestUtils
+
+BASE_URL = "/admin/testimonial/"
+
+
+class OrderPermissionTests(WagtailTestUtils, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.items = [
+            Testimonial.objects.create(name=name, company="Co", content="x")
+            for name in "ABC"
+        ]
+        self.user = get_user_model().objects.create_user(
+            username="editor", email="editor@example.com", password="password"
+        )
+        self.grant("wagtailadmin.access_admin", "home.view_testimonial")
+        self.client.force_login(self.user)
+
+    def grant(self, *perms):
+        for perm in perms:
+            app_label, codename = perm.split(".")
+            self.user.user_permissions.add(
+                Permission.objects.get(
+                    content_type__app_label=app_label, codename=codename
+                )
+            )
+
+    def current_order(self):
+        return "".join(
+            Testimonial.objects.order_by("sort_order").values_list("name", flat=True)
+        )
+
+    def test_write_endpoints_need_change_permission(self):
+        pks = [item.pk for item in reversed(self.items)]
+        requests = {
+            "update-order/": {"object_ids[]": pks},
+            "move-order/": {"object_ids[]": pks[:1], "move": "first"},
+            "page-order/": {"object_ids[]": pks},
+            "reseed-order/": {"ordering": "name"},
+            "undo-order/": {},
+            "redo-order/": {},
+        }
+        for url, data in requests.items():
+            resp = self.client.post(BASE_URL + url, data)
+            self.assertEqual(resp.status_code, 403, url)
+            self.assertIn("permission", resp.json()["error"])
+        self.assertEqual(self.current_order(), "ABC")
+
+        self.grant("home.change_testimonial")
+        resp = self.client.post(BASE_URL + "update-order/", requests["update-order/"])
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(self.current_order(), "CBA")
+
+    def test_order_page_and_button_need_change_permission(self):
+        self.assertRedirects(self.client.get(BASE_URL + "order/"), "/admin/")
+        self.assertNotContains(self.client.get(BASE_URL), "Reorder Testimonials")
+
+        self.grant("home.change_testimonial")
+        self.assertEqual(self.client.get(BASE_URL + "order/").status_code, 200)
+        self.assertContains(self.client.get(BASE_URL), "Reorder Testimonials")
@@ -0,0 +1,128 @@
+from unittest import mock
+
+from django.db import connection
+from django.test import TestCase
+from home.admin_views import testimonial_viewset
+from home.models import Testimonial
+from wagtail.test.utils import WagtailTestUtils
+
+from wagtail_orderable_viewset import ordering
+from wagtail_orderable_viewset.models import OrderHistory
+from wagtail_orderable_viewset.ordering import compact_order
+
+
+def limit_range(low, high):
+    return mock.patch.object(
+        connection.ops, "integer_field_range", return_value=(low, high)
+    )
+
+
+class OrderRangeTests(WagtailTestUtils, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.login()
+        self.items = {
+            name: Testimonial.objects.create(name=name, company="Co", content="x")
+            for name in "ABCDE"
+        }
+
+    def values(self):
+        return dict(
+            Testimonial.objects.order_by("sort_order", "pk").values_list(
+                "name", "sort_order"
+            )
+        )
+
+    def set_values(self, **values):
+        for name, value in values.items():
+            Testimonial.objects.filter(pk=self.items[name].pk).update(sort_order=value)
+
+    def move(self, move, *names):
+        return self.client.post(
+            "/admin/testimonial/move-order/",
+            {"object_ids[]": [self.items[name].pk for name in names], "move": move},
+        )
+
+    def test_moves_to_the_ends_write_only_the_moved_rows(self):
+        self.move("first", "D", "B")
+        self.assertEqual(self.values(), {"B": -1, "D": 0, "A": 1, "C": 3, "E": 5})
+        self.move("last", "A")
+        self.assertEqual(self.values(), {"B": -1, "D": 0, "C": 3, "E": 5, "A": 6})
+        self.assertEqual(
+            [len(entry.changes) for entry in OrderHistory.objects.order_by("pk")],
+            [2, 1],
+        )
+
+    def test_moves_past_the_column_limits_renumber(self):
+        with limit_range(0, 100):
+            self.move("first", "E", "D")
+        self.assertEqual(self.values(), {"D": 1, "E": 2, "A": 3, "B": 4, "C": 5})
+
+    def test_compact_order_keeps_order_and_ties(self):
+        self.set_values(A=-50, B=-50, C=7, D=1000, E=2000)
+        written = compact_order(Testimonial.objects.all(), "sort_order", batch_size=1)
+        self.assertEqual(written, 5)
+        self.assertEqual(self.values(), {"A": 1, "B": 1, "C": 2, "D": 3, "E": 4})
+
+    def test_compact_order_stops_on_concurrent_changes(self):
+        self.set_values(A=10, B=20, C=30, D=40, E=50)
+        apply_order_values = ordering.apply_order_values
+
+        def write_and_interfere(*args, **kwargs):
+            apply_order_values(*args, **kwargs)
+            self.set_values(C=35)
+
+        with mock.patch.object(
+            ordering, "apply_order_values", side_effect=write_and_interfere
+        ):
+            written = compact_order(
+                Testimonial.objects.all(), "sort_order", batch_size=2
+            )
+        self.assertEqual(written, 2)
+        self.assertEqual(self.values(), {"A": 1, "B": 2, "C": 35, "D": 40, "E": 50})
+
+    def test_writes_near_the_limits_compact_the_order(self):
+        self.set_values(E=90)
+        with (
+            limit_range(-100, 100),
+            mock.patch.object(
+                testimonial_viewset, "order_compact_in_background", False
+            ),
+        ):
+            self.move("last", "A")
+        self.assertEqual(self.values(), {"B": 1, "C": 2, "D": 3, "E": 4, "A": 5})
+        self.assertFalse(OrderHistory.objects.exists())
+
+    def test_compaction_runs_in_the_background(self):
+        self.set_values(E=90)
+        with (
+            limit_range(-100, 100),
+            mock.patch(
+                "wagtail_orderable_viewset.viewsets.start_order_compaction"
+            ) as start,
+        ):
+            self.move("last", "A")
+        start.assert_called_once()
+        self.assertEqual(start.call_args.args[0], "home.testimonial:")
+        self.assertEqual(self.values()["A"], 91)
+
+    def test_appending_at_the_limit_compacts_first(self):
+        self.set_values(A=-100, E=100)
+        with limit_range(-100, 100):
+            f = Testimonial.objects.create(name="F", company="Co", content="x")
+        self.assertEqual(f.sort_order, 6)
+        self.assertEqual(
+            self.values(), {"A": 1, "B": 2, "C": 3, "D": 4, "E": 5, "F": 6}
+        )
+
+    def test_appending_near_the_limit_compacts_in_the_background(self):
+        self.set_values(E=90)
+        with (
+            limit_range(-100, 100),
+            mock.patch(
+                "wagtail_orderable_viewset.models.start_order_compaction"
+            ) as start,
+        ):
+            f = Testimonial.objects.create(name="F", company="Co", content="x")
+        self.assertEqual(f.sort_order, 91)
+        start.assert_called_once()
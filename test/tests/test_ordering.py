@@ -0,0 +1,122 @@
+import threading
+from unittest import mock
+
+from django.db import OperationalError, connection, connections
+from django.test import TestCase, TransactionTestCase
+from django.test.utils import CaptureQueriesContext
+from home.models import TeamMember
+
+from wagtail_orderable_viewset.ordering import (
+    apply_order_values,
+    atomic_with_retry,
+    get_order_changes,
+)
+
+
+class DeadlockCause(Exception):
+    sqlstate = "40P01"
+
+
+def deadlock():
+    try:
+        raise DeadlockCause("deadlock detected")
+    except DeadlockCause as cause:
+        raise OperationalError("deadlock detected") from cause
+
+
+class ApplyOrderValuesTests(TestCase):
+    def setUp(self):
+        self.members = [
+            TeamMember.objects.create(name=f"M{i}", position="Dev", bio="")
+            for i in range(7)
+        ]
+
+    def test_get_order_changes_skips_unchanged_and_unknown_rows(self):
+        a, b, c = self.members[:3]
+        changes = get_order_changes(
+            TeamMember.objects.all(), "sort_order", [a.pk, c.pk, b.pk, "999"]
+        )
+        self.assertEqual(changes, [(c.pk, 3, 2), (b.pk, 2, 3)])
+
+    def test_writes_in_bounded_batches(self):
+        values = {m.pk: 100 - i for i, m in enumerate(self.members)}
+        with CaptureQueriesContext(connection) as ctx:
+            apply_order_values(
+                TeamMember.objects.all(), "sort_order", values, batch_size=3
+            )
+        updates = [q for q in ctx.captured_queries if q["sql"].startswith("UPDATE")]
+        self.assertEqual(len(updates), 3)
+        for member in self.members:
+            member.refresh_from_db()
+            self.assertEqual(member.sort_order, values[member.pk])
+
+
+class AtomicWithRetryTests(TransactionTestCase):
+    def test_retries_deadlocks(self):
+        calls = []
+
+        def flaky():
+            calls.append(1)
+            if len(calls) == 1:
+                deadlock()
+            return "done"
+
+        with mock.patch("wagtail_orderable_viewset.ordering.time.sleep"):
+            self.assertEqual(atomic_with_retry(flaky, attempts=3), "done")
+        self.assertEqual(len(calls), 2)
+
+    def test_does_not_retry_other_errors(self):
+        func = mock.Mock(side_effect=OperationalError("no such table"))
+        with self.assertRaises(OperationalError):
+            atomic_with_retry(func, attempts=3)
+        self.assertEqual(func.call_count, 1)
+
+    def test_gives_up_after_attempts(self):
+        func = mock.Mock(side_effect=deadlock)
+        with (
+            mock.patch("wagtail_orderable_viewset.ordering.time.sleep"),
+            self.assertRaises(OperationalError),
+        ):
+            atomic_with_retry(func, attempts=3)
+        self.assertEqual(func.call_count, 3)
+
+
+class ConcurrentReorderStressTests(TransactionTestCase):
+    def test_overlapping_reorders(self):
+        members = [
+            TeamMember.objects.create(name=f"M{i}", position="Dev", bio="")
+            for i in range(60)
+        ]
+        pks = [m.pk for m in members]
+        orders = [pks, pks[::-1], pks[::2] + pks[1::2], pks[1::2][::-1] + pks[::2]]
+        errors = []
+
+        def reorder(object_ids):
+            try:
+                for _ in range(5):
+                    atomic_with_retry(
+                        lambda: apply_order_values(
+                            TeamMember.objects.all(),
+                            "sort_order",
+                            {pk: i for i, pk in enumerate(object_ids, start=1)},
+                            batch_size=16,
+                        ),
+                        attempts=20,
+                        backoff=0.001,
+                    )
+            except Exception as e:  # noqa: BLE001 - reported by the main thread
+                errors.append(e)
+            finally:
+                connections.close_all()
+
+        threads = [threading.Thread(target=reorder, args=(o,)) for o in orders * 2]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        final = list(
+            TeamMember.objects.order_by("sort_order").values_list("pk", flat=True)
+        )
+        self.assertIn(final, orders)
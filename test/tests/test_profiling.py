@@ -0,0 +1,66 @@
+import os
+import pstats
+import tempfile
+from unittest import mock
+
+from django.test import TestCase
+from home.admin_views import testimonial_viewset
+from home.models import Testimonial
+from wagtail.test.utils import WagtailTestUtils
+
+BASE_URL = "/admin/testimonial/"
+
+
+class OrderProfilingTests(WagtailTestUtils, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.login()
+        self.items = [
+            Testimonial.objects.create(name=name, company="Acme", content="x")
+            for name in "ABC"
+        ]
+
+    def profiling(self, **attrs):
+        return mock.patch.multiple(
+            testimonial_viewset, order_profiling_enabled=True, **attrs
+        )
+
+    def test_order_view_reports_phase_timings(self):
+        with self.profiling():
+            resp = self.client.get(BASE_URL + "order/")
+        phases = [part.split(";")[0] for part in resp["Server-Timing"].split(", ")]
+        self.assertEqual(phases, ["query", "labels", "render"])
+        self.assertEqual(list(resp.context["order_timings"]), ["query", "labels"])
+        self.assertContains(resp, 'id="orderable-profile"')
+
+    def test_update_view_reports_write_timing(self):
+        with self.profiling():
+            resp = self.client.post(
+                BASE_URL + "update-order/",
+                {"object_ids[]": [item.pk for item in reversed(self.items)]},
+            )
+        data = resp.json()
+        self.assertEqual(data["updated"], 3)
+        self.assertEqual(list(data["timings"]), ["write"])
+        self.assertIn("write;dur=", resp["Server-Timing"])
+
+    def test_cprofile_dump(self):
+        with tempfile.TemporaryDirectory() as profile_dir:
+            with self.profiling(order_profile_dir=profile_dir):
+                self.client.get(BASE_URL + "order/")
+            [filename] = os.listdir(profile_dir)
+            self.assertTrue(filename.startswith("home.testimonial-order-"))
+            stats = pstats.Stats(os.path.join(profile_dir, filename))
+            self.assertTrue(stats.total_calls)
+
+    def test_disabled_by_default(self):
+        resp = self.client.get(BASE_URL + "order/")
+        self.assertNotIn("Server-Timing", resp)
+        self.assertNotContains(resp, 'id="orderable-profile"')
+
+    def test_labels_are_computed_once_per_object(self):
+        with mock.patch.object(
+            Testimonial, "__str__", autospec=True, return_value="label"
+        ) as to_str:
+            self.client.get(BASE_URL + "order/")
+        self.assertEqual(to_str.call_count, 3)
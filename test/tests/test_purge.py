@@ -0,0 +1,57 @@
+from django.test import TestCase, override_settings
+from home.frontend_cache import RecordingBackend
+from home.models import HomePage, Office, TeamMember, Testimonial
+from wagtail.models import Page
+from wagtail.test.utils import WagtailTestUtils
+
+from wagtail_orderable_viewset.purge import get_purge_batch
+
+
+@override_settings(
+    WAGTAILFRONTENDCACHE={"stub": {"BACKEND": "home.frontend_cache.RecordingBackend"}}
+)
+class ReorderPurgeTests(WagtailTestUtils, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.login()
+        RecordingBackend.batches.clear()
+        self.addCleanup(RecordingBackend.batches.clear)
+        site_root = Page.objects.get(depth=2)
+        for title in ["About", "Contact"]:
+            site_root.add_child(instance=HomePage(title=title))
+        self.pks = [
+            Testimonial.objects.create(
+                name=name, company="Co", content="x", rating=5
+            ).pk
+            for name in ["Abe", "Bea"]
+        ]
+
+    def test_registered_pages_purged_in_one_batch(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(
+                "/admin/testimonial/update-order/", {"object_ids[]": self.pks[::-1]}
+            )
+        self.assertEqual(
+            RecordingBackend.batches,
+            [
+                [
+                    "http://localhost/",
+                    "http://localhost/about/",
+                    "http://localhost/contact/",
+                ]
+            ],
+        )
+
+    def test_no_purge_without_changes(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(
+                "/admin/testimonial/update-order/", {"object_ids[]": self.pks}
+            )
+        self.assertEqual(RecordingBackend.batches, [])
+
+    def test_unregistered_model_is_not_purged(self):
+        self.assertIsNone(get_purge_batch(TeamMember, [1]))
+
+    def test_targets_of_parent_model_apply_to_children(self):
+        batch = get_purge_batch(Office, [1])
+        self.assertEqual(batch.urls, {"http://localhost/locations/"})
@@ -0,0 +1,123 @@
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.handlers.wsgi import WSGIRequest
+from django.db import connection
+from django.test import Client, TestCase
+from django.test.utils import CaptureQueriesContext
+from home.admin_views import testimonial_viewset
+from home.models import Testimonial
+from wagtail.test.utils import WagtailTestUtils
+
+
+class RequestLimitTests(WagtailTestUtils, TestCase):
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        self.addCleanup(cache.clear)
+        self.user = self.login()
+        self.pks = [
+            Testimonial.objects.create(name=name, company="Co", content="x").pk
+            for name in "ABC"
+        ]
+
+    def reorder(self, pks=None):
+        return self.client.post(
+            "/admin/testimonial/update-order/",
+            {"object_ids[]": self.pks[::-1] if pks is None else pks},
+        )
+
+    def assertRejectedEarly(self, status, **limits):
+        with (
+            mock.patch.multiple(testimonial_viewset, **limits),
+            CaptureQueriesContext(connection) as ctx,
+        ):
+            resp = self.reorder()
+        self.assertEqual(resp.status_code, status)
+        self.assertFalse(
+            [q for q in ctx.captured_queries if "home_testimonial" in q["sql"]]
+        )
+        return resp
+
+    def test_rate_limit_per_user(self):
+        with (
+            mock.patch.object(testimonial_viewset, "order_rate_limit", (2, 60)),
+            mock.patch("time.time", return_value=1000.0),
+        ):
+            self.assertEqual(self.reorder().status_code, 200)
+            self.assertEqual(self.reorder().status_code, 200)
+            resp = self.assertRejectedEarly(429, order_rate_limit=(2, 60))
+            self.assertEqual(resp["Retry-After"], "20")
+            self.assertEqual(resp.json()["retry_after"], 20)
+
+            other = get_user_model().objects.create_superuser(
+                username="other", email="other@example.com", password="password"
+            )
+            self.client.force_login(other)
+            self.assertEqual(self.reorder().status_code, 200)
+
+        with (
+            mock.patch.object(testimonial_viewset, "order_rate_limit", (2, 60)),
+            mock.patch("time.time", return_value=1020.0),
+        ):
+            self.client.force_login(self.user)
+            self.assertEqual(self.reorder().status_code, 200)
+
+    def test_limits_are_checked_before_the_body_is_read(self):
+        # The CSRF check would otherwise parse the body first
+        self.client = Client(enforce_csrf_checks=True)
+        self.client.force_login(self.user)
+        for url in ["update-order", "move-order", "page-order", "import-order"]:
+            with (
+                mock.patch.object(testimonial_viewset, "order_max_request_size", 10),
+                mock.patch.object(
+                    WSGIRequest, "_load_post_and_files", autospec=True
+                ) as load,
+            ):
+                resp = self.client.post(
+                    f"/admin/testimonial/{url}/", {"object_ids[]": self.pks}
+                )
+            self.assertEqual(resp.status_code, 413)
+            load.assert_not_called()
+
+        # Requests within the limits still need a CSRF token
+        resp = self.reorder()
+        self.assertEqual(resp.status_code, 403)
+
+    def test_import_is_limited(self):
+        content = "".join(f"{pk},{i}\n" for i, pk in enumerate(self.pks))
+        with mock.patch.object(testimonial_viewset, "order_rate_limit", (1, 60)):
+            for status in [200, 429]:
+                resp = self.client.post(
+                    "/admin/testimonial/import-order/",
+                    {
+                        "file": SimpleUploadedFile(
+                            "order.csv", f"key,sort_order\n{content}".encode()
+                        )
+                    },
+                )
+                self.assertEqual(resp.status_code, status)
+
+    def test_too_many_ids(self):
+        resp = self.assertRejectedEarly(413, order_max_ids=2)
+        self.assertIn("At most 2 objects", resp.json()["error"])
+
+    def test_request_too_large(self):
+        resp = self.assertRejectedEarly(413, order_max_request_size=10)
+        self.assertIn("larger than 10 bytes", resp.json()["error"])
+
+    def test_missing_ids(self):
+        resp = self.reorder(pks=[])
+        self.assertEqual(resp.status_code, 400)
+        self.assertEqual(resp.json()["error"], "object_ids is required")
+
+    def test_move_and_page_endpoints_are_limited(self):
+        with mock.patch.object(testimonial_viewset, "order_max_ids", 1):
+            for url in ["move-order", "page-order"]:
+                resp = self.client.post(
+                    f"/admin/testimonial/{url}/",
+                    {"object_ids[]": self.pks[:2], "move": "first"},
+                )
+                self.assertEqual(resp.status_code, 413)
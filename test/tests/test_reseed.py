@@ -0,0 +1,112 @@
+from unittest import mock
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from home.models import Office, Testimonial
+from wagtail.test.utils import WagtailTestUtils
+
+from wagtail_orderable_viewset.models import OrderHistory
+from wagtail_orderable_viewset.ordering import reseed_order
+
+
+class ReseedOrderTests(WagtailTestUtils, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.login()
+        for name, rating in [("Cara", 3), ("Abe", 4), ("Bea", 5), ("Dan", 4)]:
+            Testimonial.objects.create(
+                name=name, company="Co", content="x", rating=rating
+            )
+
+    def current_order(self):
+        return list(
+            Testimonial.objects.order_by("sort_order").values_list("name", flat=True)
+        )
+
+    def test_reseed_by_field_is_one_update(self):
+        with CaptureQueriesContext(connection) as ctx:
+            resp = self.client.post(
+                "/admin/testimonial/reseed-order/", {"ordering": "name"}
+            )
+        self.assertJSONEqual(resp.content.decode(), {"success": True, "updated": 4})
+        self.assertEqual(self.current_order(), ["Abe", "Bea", "Cara", "Dan"])
+        updates = [q for q in ctx.captured_queries if q["sql"].startswith("UPDATE")]
+        self.assertEqual(len(updates), 1)
+        self.assertIn("ROW_NUMBER() OVER", updates[0]["sql"])
+
+    def test_reseed_descending_with_pk_tiebreak(self):
+        self.client.post("/admin/testimonial/reseed-order/", {"ordering": "-rating"})
+        self.assertEqual(self.current_order(), ["Bea", "Abe", "Dan", "Cara"])
+
+    def test_reseed_is_recorded_in_history(self):
+        self.client.post("/admin/testimonial/reseed-order/", {"ordering": "name"})
+        self.assertEqual(OrderHistory.objects.for_model(Testimonial).count(), 1)
+        self.client.post("/admin/testimonial/undo-order/")
+        self.assertEqual(self.current_order(), ["Cara", "Abe", "Bea", "Dan"])
+
+    def test_ordering_must_be_allowed(self):
+        resp = self.client.post(
+            "/admin/testimonial/reseed-order/", {"ordering": "content"}
+        )
+        self.assertEqual(resp.status_code, 400)
+        resp = self.client.post(
+            "/admin/team_member/reseed-order/", {"ordering": "name"}
+        )
+        self.assertEqual(resp.status_code, 400)
+
+    def test_order_page_lists_reseed_choices(self):
+        resp = self.client.get("/admin/testimonial/order/")
+        self.assertContains(
+            resp, '<option value="-rating">Rating (descending)</option>', html=True
+        )
+
+    def test_fallback_without_window_functions(self):
+        with mock.patch.object(connection.features, "supports_over_clause", False):
+            updated = reseed_order(Testimonial.objects.all(), "sort_order", ["name"])
+        self.assertEqual(updated, 4)
+        self.assertEqual(self.current_order(), ["Abe", "Bea", "Cara", "Dan"])
+
+    def test_fallback_without_joined_updates(self):
+        with mock.patch(
+            "wagtail_orderable_viewset.ordering.supports_update_join",
+            return_value=False,
+        ):
+            updated = reseed_order(Testimonial.objects.all(), "sort_order", ["name"])
+        self.assertEqual(updated, 4)
+        self.assertEqual(self.current_order(), ["Abe", "Bea", "Cara", "Dan"])
+
+    def test_reseed_many_rows_joins_the_ranking_once(self):
+        Testimonial.objects.bulk_create(
+            Testimonial(
+                name=f"T{i:05d}", company="Co", content="x", sort_order=10_000 - i
+            )
+            for i in range(5000)
+        )
+        with CaptureQueriesContext(connection) as ctx:
+            updated = reseed_order(Testimonial.objects.all(), "sort_order", ["name"])
+        self.assertEqual(updated, 5004)
+        self.assertEqual(len(ctx.captured_queries), 1)
+        # The ranking is a derived table joined once, not a subquery per row
+        self.assertEqual(ctx.captured_queries[0]["sql"].count("ROW_NUMBER()"), 1)
+        names = list(
+            Testimonial.objects.order_by("sort_order").values_list("name", flat=True)
+        )
+        self.assertEqual(names, sorted(names))
+        self.assertEqual(
+            list(
+                Testimonial.objects.order_by("sort_order")[:3].values_list(
+                    "sort_order", flat=True
+                )
+            ),
+            [1, 2, 3],
+        )
+
+    def test_reseed_inherited_field(self):
+        for name in ["Zeta", "Alpha", "Mu"]:
+            Office.objects.create(name=name, city="X")
+        reseed_order(Office.objects.all(), "sort_order", ["name"])
+        self.assertEqual(
+            list(Office.objects.order_by("sort_order").values_list("name", flat=True)),
+            ["Alpha", "Mu", "Zeta"],
+        )
@@ -0,0 +1,95 @@
+from django.test import TestCase
+from home.models import Testimonial
+from wagtail import hooks
+from wagtail.test.utils import WagtailTestUtils
+
+from wagtail_orderable_viewset.signals import post_reorder, pre_reorder
+
+
+class ReorderSignalTests(WagtailTestUtils, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.user = self.login()
+        self.objects = [
+            Testimonial.objects.create(name=name, company="Co", content="x", rating=5)
+            for name in ["Abe", "Bea", "Cara"]
+        ]
+        self.pks = [obj.pk for obj in self.objects]
+        self.received = []
+
+        def receiver(signal):
+            def handler(sender, **kwargs):
+                self.received.append((signal, sender, kwargs))
+
+            return handler
+
+        self.pre_handler = receiver("pre")
+        self.post_handler = receiver("post")
+        pre_reorder.connect(self.pre_handler)
+        post_reorder.connect(self.post_handler)
+        self.addCleanup(pre_reorder.disconnect, self.pre_handler)
+        self.addCleanup(post_reorder.disconnect, self.post_handler)
+
+    def test_sent_once_per_bulk_reorder(self):
+        calls = []
+        with (
+            hooks.register_temporarily(
+                "after_reorder",
+                lambda model, pks, **kwargs: calls.append((model, pks)),
+            ),
+            self.captureOnCommitCallbacks(execute=True),
+        ):
+            self.client.post(
+                "/admin/testimonial/update-order/",
+                {"object_ids[]": [self.pks[2], self.pks[0], self.pks[1]]},
+            )
+
+        self.assertEqual([signal for signal, *_ in self.received], ["pre", "post"])
+        for _signal, sender, kwargs in self.received:
+            self.assertIs(sender, Testimonial)
+            self.assertEqual(sorted(kwargs["pks"]), sorted(self.pks))
+            self.assertEqual(kwargs["operation"], "order")
+            self.assertIsNone(kwargs["scope"])
+            self.assertEqual(kwargs["user"], self.user)
+        self.assertEqual(calls, [(Testimonial, self.received[1][2]["pks"])])
+
+    def test_post_reorder_waits_for_commit(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            self.client.post(
+                "/admin/testimonial/move-order/",
+                {"object_ids[]": [self.pks[2]], "move": "first"},
+            )
+        self.assertEqual([signal for signal, *_ in self.received], ["pre"])
+        self.assertEqual(len(callbacks), 1)
+        callbacks[0]()
+        self.assertEqual(self.received[1][2]["operation"], "move")
+
+    def test_no_signals_without_changes(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(
+                "/admin/testimonial/update-order/", {"object_ids[]": self.pks}
+            )
+        self.assertEqual(self.received, [])
+
+    def test_reseed_and_undo_report_changed_pks(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(
+                "/admin/testimonial/reseed-order/", {"ordering": "-rating"}
+            )
+        # Equal ratings keep the pk order, so nothing changes.
+        self.assertEqual(
+            [(signal, kwargs["pks"]) for signal, _, kwargs in self.received],
+            [("pre", None)],
+        )
+
+        self.received.clear()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post("/admin/testimonial/reseed-order/", {"ordering": "name"})
+            self.client.post(
+                "/admin/testimonial/update-order/",
+                {"object_ids[]": [self.pks[1], self.pks[0], self.pks[2]]},
+            )
+            self.client.post("/admin/testimonial/undo-order/")
+        post = [kwargs for signal, _, kwargs in self.received if signal == "post"]
+        self.assertEqual([kwargs["operation"] for kwargs in post], ["order", "undo"])
+        self.assertEqual(sorted(post[1]["pks"]), sorted(self.pks[:2]))
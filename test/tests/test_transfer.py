@@ -0,0 +1,167 @@
+import os
+import tempfile
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import CommandError, call_command
+from django.test import TestCase
+from home.admin_views import testimonial_viewset
+from home.models import Event, Testimonial
+from wagtail.test.utils import WagtailTestUtils
+
+from wagtail_orderable_viewset.locks import OrderLock
+from wagtail_orderable_viewset.models import OrderHistory, OrderRevision
+from wagtail_orderable_viewset.transfer import export_ordering, read_ordering
+
+
+class OrderTransferTests(WagtailTestUtils, TestCase):
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        self.addCleanup(cache.clear)
+        self.login()
+        for name in ["Abe", "Bea", "Cara"]:
+            Testimonial.objects.create(name=name, company="Co", content="x", rating=5)
+
+    def current_order(self):
+        return list(
+            Testimonial.objects.order_by("sort_order").values_list("name", flat=True)
+        )
+
+    def test_export_formats(self):
+        queryset = Testimonial.objects.all()
+        csv_lines = list(export_ordering(queryset, "sort_order", key_field="name"))
+        self.assertEqual("".join(csv_lines), "key,sort_order\nAbe,1\nBea,2\nCara,3\n")
+        jsonl = "".join(
+            export_ordering(queryset, "sort_order", key_field="name", format="jsonl")
+        )
+        self.assertEqual(
+            read_ordering(jsonl.splitlines(), "sort_order", format="jsonl"),
+            {"Abe": 1, "Bea": 2, "Cara": 3},
+        )
+
+    def test_read_ordering_reports_every_bad_line(self):
+        lines = ["key,sort_order", "Abe,1", "Bea,x", ",3", "Abe,4"]
+        with self.assertRaises(ValidationError) as ctx:
+            read_ordering(lines, "sort_order")
+        self.assertEqual(
+            ctx.exception.messages,
+            [
+                "Line 3: sort_order must be an integer",
+                "Line 4: missing key",
+                "Line 5: duplicate key 'Abe'",
+            ],
+        )
+
+    def test_read_ordering_rejects_non_objects_and_out_of_range_values(self):
+        lines = [
+            '{"key": "Abe", "sort_order": 1}',
+            "[1, 2]",
+            "3",
+            '{"key": "Bea", "sort_order": 100}',
+        ]
+        with self.assertRaises(ValidationError) as ctx:
+            read_ordering(lines, "sort_order", format="jsonl", limits=(-99, 99))
+        self.assertEqual(
+            ctx.exception.messages,
+            [
+                "Line 2: expected a JSON object",
+                "Line 3: expected a JSON object",
+                "Line 4: sort_order must be between -99 and 99",
+            ],
+        )
+
+    def test_command_round_trip_by_natural_key(self):
+        out = StringIO()
+        call_command("export_ordering", "home.Testimonial", "--key=name", stdout=out)
+        exported = out.getvalue().replace("Abe,1", "Abe,4")
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "order.csv")
+            with open(path, "w") as f:
+                f.write(exported)
+            out = StringIO()
+            call_command(
+                "import_ordering", "home.Testimonial", path, "--key=name", stdout=out
+            )
+
+        self.assertIn("Imported 3 rows, 1 changed.", out.getvalue())
+        self.assertEqual(self.current_order(), ["Bea", "Cara", "Abe"])
+        self.assertEqual(OrderHistory.objects.for_model(Testimonial).count(), 1)
+
+    def test_command_rejects_unknown_keys(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "order.jsonl")
+            with open(path, "w") as f:
+                f.write('{"key": "Zed", "sort_order": 1}\n')
+            with self.assertRaisesMessage(CommandError, "1 unknown key(s) for name"):
+                call_command("import_ordering", "home.Testimonial", path, "--key=name")
+        self.assertEqual(self.current_order(), ["Abe", "Bea", "Cara"])
+
+    def write_file(self, tmp, content):
+        path = os.path.join(tmp, "order.csv")
+        with open(path, "w") as f:
+            f.write(content)
+        return path
+
+    def test_command_uses_the_viewset_write_path(self):
+        other = get_user_model().objects.create_superuser(
+            username="other", email="other@example.com", password="password"
+        )
+        with tempfile.TemporaryDirectory() as tmp:
+            path = self.write_file(tmp, "key,sort_order\nAbe,4\n")
+            with (
+                OrderLock(testimonial_viewset.get_order_lock_key(), other),
+                self.assertRaisesMessage(CommandError, "other is currently reordering"),
+            ):
+                call_command("import_ordering", "home.Testimonial", path, "--key=name")
+            self.assertEqual(self.current_order(), ["Abe", "Bea", "Cara"])
+
+            with self.assertRaisesMessage(CommandError, "No orderable viewset"):
+                call_command("import_ordering", "home.Location", path)
+
+            events = {name: Event.objects.create(name=name) for name in "AB"}
+            path = self.write_file(tmp, "key,sort_order\nA,3\n")
+            call_command(
+                "import_ordering", "home.Event", path, "--key=name", stdout=StringIO()
+            )
+        # Draft orders are saved as a draft rather than written live
+        self.assertEqual(events["A"].sort_order, Event.objects.get(name="A").sort_order)
+        draft = OrderRevision.objects.draft_for(Event)
+        self.assertEqual(draft.object_ids, [str(events["B"].pk), str(events["A"].pk)])
+
+    def test_export_view_streams_attachment(self):
+        resp = self.client.get("/admin/testimonial/export-order/?format=jsonl")
+        self.assertEqual(resp.status_code, 200)
+        self.assertIn("attachment", resp["Content-Disposition"])
+        self.assertEqual(len(b"".join(resp.streaming_content).splitlines()), 3)
+
+        resp = self.client.get("/admin/testimonial/export-order/?format=xml")
+        self.assertEqual(resp.status_code, 400)
+
+    def test_import_view(self):
+        pks = dict(Testimonial.objects.values_list("name", "pk"))
+        content = f"key,sort_order\n{pks['Cara']},1\n{pks['Abe']},2\n{pks['Bea']},3\n"
+        resp = self.client.post(
+            "/admin/testimonial/import-order/",
+            {"file": SimpleUploadedFile("order.csv", content.encode())},
+        )
+        self.assertJSONEqual(
+            resp.content.decode(), {"success": True, "imported": 3, "updated": 3}
+        )
+        self.assertEqual(self.current_order(), ["Cara", "Abe", "Bea"])
+
+        self.client.post("/admin/testimonial/undo-order/")
+        self.assertEqual(self.current_order(), ["Abe", "Bea", "Cara"])
+
+    def test_import_view_rejects_invalid_file(self):
+        resp = self.client.post(
+            "/admin/testimonial/import-order/",
+            {"file": SimpleUploadedFile("order.csv", b"key,sort_order\n999999,1\n")},
+        )
+        self.assertEqual(resp.status_code, 400)
+        self.assertIn("unknown key", resp.json()["error"])
+        self.assertEqual(self.current_order(), ["Abe", "Bea", "Cara"])